@@ -0,0 +1,26 @@
+"""Add job output format
+Revision ID: c4e8f1a2b3d5
+Revises: a17b877b1ff5
+Create Date: 2026-10-17 05:30:12.418233
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8f1a2b3d5'
+down_revision = 'a17b877b1ff5'
+branch_labels = None
+depends_on = None
+
+output_format = sa.Enum('mp3', 'm4b', name='outputformat')
+
+
+def upgrade():
+    output_format.create(op.get_bind(), checkfirst=True)
+    op.add_column('jobs', sa.Column('output_format', output_format, nullable=True))
+
+
+def downgrade():
+    op.drop_column('jobs', 'output_format')
+    output_format.drop(op.get_bind(), checkfirst=True)
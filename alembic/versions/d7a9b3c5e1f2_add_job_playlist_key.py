@@ -0,0 +1,22 @@
+"""Add job HLS playlist key
+Revision ID: d7a9b3c5e1f2
+Revises: c4e8f1a2b3d5
+Create Date: 2026-10-17 06:02:47.193650
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7a9b3c5e1f2'
+down_revision = 'c4e8f1a2b3d5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('jobs', sa.Column('playlist_s3_key', sa.String(length=500), nullable=True))
+
+
+def downgrade():
+    op.drop_column('jobs', 'playlist_s3_key')
@@ -0,0 +1,24 @@
+"""Add job output profile and bytes saved
+Revision ID: e3b5c7d9f1a4
+Revises: d7a9b3c5e1f2
+Create Date: 2026-10-17 08:41:12.520371
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3b5c7d9f1a4'
+down_revision = 'd7a9b3c5e1f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('jobs', sa.Column('output_profile', sa.String(length=50), server_default='standard', nullable=True))
+    op.add_column('jobs', sa.Column('bytes_saved', sa.BigInteger(), server_default='0', nullable=True))
+
+
+def downgrade():
+    op.drop_column('jobs', 'bytes_saved')
+    op.drop_column('jobs', 'output_profile')
@@ -4,7 +4,7 @@ from typing import List, Optional
 
 from app.core.database import get_db
 from app.core.config import settings
-from app.schemas import Job, JobCreate, JobUpdate, JobStatus, VoiceProvider, ConversionMode, User
+from app.schemas import Job, JobCreate, JobUpdate, JobStatus, VoiceProvider, ConversionMode, OutputFormat, User
 from app.services.auth import get_current_user
 from app.services.job import JobService
 from app.services.storage import StorageService
@@ -42,6 +42,12 @@ async def create_job(
     conversion_mode: ConversionMode = Form(
         ConversionMode.full, description="Conversion mode: 'full' for word-for-word or 'summary_explanation' for core concepts explanation."
     ),
+    output_format: OutputFormat = Form(
+        OutputFormat.mp3, description="Audiobook format: 'mp3', or 'm4b' for AAC with chapter markers from the PDF outline."
+    ),
+    output_profile: str = Form(
+        settings.OUTPUT_PROFILE_DEFAULT, description="Output profile, e.g. 'standard', 'mp3_64k', 'aac_48k' or 'opus_32k'."
+    ),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -68,6 +74,12 @@ async def create_job(
             detail=f"Invalid file type. Allowed types: {', '.join(settings.ALLOWED_FILE_TYPES)}"
         )
 
+    if output_profile not in settings.OUTPUT_PROFILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown output profile. Available: {', '.join(settings.OUTPUT_PROFILES)}"
+        )
+
     # Check file size using configuration
     file_content = await file.read()
     if len(file_content) > settings.max_file_size_bytes:
@@ -86,6 +98,8 @@ async def create_job(
     - **voice_type**: The desired voice from the provider.
     - **reading_speed**: Audiobook reading speed.
     - **include_summary**: If true, an AI summary is added to the start.
+    - **output_format**: MP3, or M4B with chapters.
+    - **output_profile**: Codec, bitrate and channels of the audio.
 
     The endpoint first validates the user's credits, uploads the file to S3, creates a job record in the database, and finally queues a background task to perform the conversion.
     """
@@ -107,6 +121,8 @@ async def create_job(
         reading_speed=reading_speed,
         include_summary=include_summary,
         conversion_mode=conversion_mode,
+        output_format=output_format,
+        output_profile=output_profile,
     )
     job = job_service.create_job(current_user.id, job_data, pdf_s3_key, pdf_s3_url)
 
@@ -227,7 +243,8 @@ async def get_job_status(
 
     - **job_id**: The ID of the job to check.
 
-    Returns the status, progress percentage, and the final audio URL if completed.
+    Returns the status, progress percentage, the final audio URL if completed,
+    and the HLS playlist URL as soon as the first segment is playable.
     """
     job_service = JobService(db)
     job = job_service.get_user_job(current_user.id, job_id)
@@ -236,17 +253,22 @@ async def get_job_status(
             status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
         )
 
+    storage_service = StorageService()
     audio_url = job.audio_s3_url
     if job.status == JobStatus.completed and job.audio_s3_key:
-        storage_service = StorageService()
         audio_url = storage_service.generate_presigned_url(job.audio_s3_key)
 
+    playlist_url = None
+    if job.playlist_s3_key:
+        playlist_url = storage_service.generate_presigned_url(job.playlist_s3_key)
+
     return {
         "job_id": job.id,
         "status": job.status,
         "progress_percentage": job.progress_percentage,
         "error_message": job.error_message,
         "audio_url": audio_url,
+        "playlist_url": playlist_url,
         "estimated_cost": job.estimated_cost,
     }
 
@@ -1,6 +1,6 @@
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any
 import os
 from loguru import logger
 
@@ -82,6 +82,20 @@ class Settings(BaseSettings):
     # OpenRouter
     OPENROUTER_API_KEY: Optional[str] = None
     LLM_MODEL: str = "google/gemini-2.0-flash-001:free"
+    # OpenAI-compatible endpoint override (self-hosted gateway, local fake)
+    LLM_BASE_URL: Optional[str] = None
+    # Summaries/explanations of long documents: map-reduce over sections
+    SUMMARY_SECTION_CHARS: int = 20000
+    SUMMARY_MAX_PARALLEL: int = 8
+    # Cache LLM results in Redis, keyed by model, prompts and parameters
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL_SECONDS: int = 30 * 24 * 3600
+    LLM_CACHE_PREFIX: str = "llmcache:"
+    # Pooled LLM HTTP client, one per worker process
+    LLM_TIMEOUT_SECONDS: float = 120.0
+    LLM_CONNECT_TIMEOUT_SECONDS: float = 10.0
+    LLM_MAX_CONNECTIONS: int = 20
+    LLM_KEEPALIVE_SECONDS: float = 60.0
 
     # Google TTS Voices
     GOOGLE_VOICE_US_FEMALE_STD: str = "en-US-Wavenet-C"
@@ -97,6 +111,102 @@ class Settings(BaseSettings):
     GOOGLE_TTS_COST_WAVENET: float = 4.0
     GOOGLE_TTS_COST_CHIRP: float = 30.0
 
+    # PDF extraction
+    PDF_EXTRACTION_WORKERS: int = 0  # 0 = one process per CPU
+    PDF_PARALLEL_EXTRACTION_MIN_PAGES: int = 200
+    OCR_PAGE_MIN_CHARS: int = 25  # pages with less text than this (and an image) get OCR'd
+    OCR_DPI: int = 300
+    OCR_WORKERS: int = 0  # 0 = one tesseract process per CPU
+
+    # Running header/footer/page-number removal before TTS
+    STRIP_REPEATED_LINES: bool = True
+    REPEATED_LINE_MIN_PAGES: int = 3
+    REPEATED_LINE_MIN_FRACTION: float = 0.2
+    REPEATED_LINE_LOOKAHEAD_PAGES: int = 20  # pages indexed ahead when streaming
+
+    # Stream pages through cleanup/chunking into TTS while extraction runs
+    # (full mode without summary only)
+    PIPELINE_STREAMING: bool = True
+    PIPELINE_QUEUE_SIZE: int = 8  # chunks buffered ahead of synthesis
+    # Explanation modes: synthesize the LLM's output while it is generated
+    LLM_STREAMING_TTS: bool = True
+    LLM_STREAM_FIRST_CHUNK_CHARS: int = 200  # first chunk size; doubles per chunk
+
+    # Provider-side long-form synthesis (Polly synthesis tasks, Google long
+    # audio) for texts of at least LONG_FORM_MIN_CHARS; output goes straight
+    # to object storage instead of through the worker
+    LONG_FORM_TTS_ENABLED: bool = False
+    LONG_FORM_MIN_CHARS: int = 200000
+    LONG_FORM_S3_BUCKET: Optional[str] = None  # Polly output; defaults to S3_BUCKET_NAME
+    LONG_FORM_PREFIX: str = "longform/"
+    LONG_FORM_POLL_SECONDS: float = 10.0
+    LONG_FORM_TIMEOUT_SECONDS: float = 4 * 3600
+    GOOGLE_CLOUD_PROJECT: Optional[str] = None  # defaults to the credentials' project
+    GOOGLE_LONG_AUDIO_LOCATION: str = "global"
+    GOOGLE_LONG_AUDIO_GCS_BUCKET: Optional[str] = None
+
+    # TTS synthesis: concurrent requests per worker process, by provider
+    TTS_CONCURRENCY: Dict[str, int] = {
+        "openai": 4,
+        "google": 8,
+        "aws_polly": 8,
+        "azure": 4,
+        "eleven_labs": 2,
+    }
+    TTS_DEFAULT_CONCURRENCY: int = 4
+    TTS_CHUNK_MAX_RETRIES: int = 2
+    # Adapt in-flight calls per provider (AIMD): grow while healthy, halve on
+    # 429s/timeouts. TTS_CONCURRENCY / LLM_CONCURRENCY are the starting points.
+    ADAPTIVE_CONCURRENCY_ENABLED: bool = True
+    ADAPTIVE_CONCURRENCY_MAX: int = 16
+    LLM_CONCURRENCY: int = 2
+
+    # Shared (Redis) rate limits per provider and credential. Quotas depend
+    # on each account's tier, so none are assumed: set the ones you need.
+    # A missing or 0 entry means no limit on that axis.
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMITS: Dict[str, Dict[str, float]] = {}
+
+    # Job checkpoints (chunk audio kept in S3 so Celery retries resume)
+    JOB_CHECKPOINTS_ENABLED: bool = True
+    JOB_CHECKPOINT_PREFIX: str = "checkpoints/"
+
+    # M4B output: AAC bitrate and the PDF outline depth used for chapters
+    M4B_BITRATE: str = "64k"
+    M4B_CHAPTER_LEVEL: int = 1
+
+    # Output profiles jobs can pick: codec (mp3, aac, opus), bitrate and
+    # channels. MP3 without a bitrate keeps the provider's audio as is.
+    OUTPUT_PROFILES: Dict[str, Dict[str, Any]] = {
+        "standard": {"codec": "mp3"},
+        "mp3_64k": {"codec": "mp3", "bitrate_kbps": 64, "channels": 1},
+        "aac_48k": {"codec": "aac", "bitrate_kbps": 48, "channels": 1},
+        "opus_32k": {"codec": "opus", "bitrate_kbps": 32, "channels": 1},
+    }
+    OUTPUT_PROFILE_DEFAULT: str = "standard"
+
+    # Live HLS playlist of each job's audio, for playback while it processes
+    HLS_ENABLED: bool = False
+    HLS_SEGMENT_SECONDS: float = 10.0
+    HLS_PREFIX: str = "hls/"
+    HLS_URL_EXPIRY_SECONDS: int = 86400  # presigned segment URLs; at most 7 days
+
+    # Upload the final audio (multipart) while chunks are still being assembled
+    STREAMING_UPLOAD_ENABLED: bool = True
+    STREAMING_UPLOAD_PART_MB: int = 8  # S3 minimum is 5
+
+    # TTS audio cache (keyed by provider, voice, speed and chunk text hash)
+    AUDIO_CACHE_ENABLED: bool = True
+    AUDIO_CACHE_DIR: str = "/tmp/pdf2audiobook/cache/audio"
+    AUDIO_CACHE_MAX_MB: int = 2048
+    AUDIO_CACHE_S3_PREFIX: str = "cache/audio/"  # empty = local tier only
+
+    # Extraction cache (keyed by PDF SHA-256 + extractor version)
+    EXTRACTION_CACHE_ENABLED: bool = True
+    EXTRACTION_CACHE_DIR: str = "/tmp/pdf2audiobook/cache/extraction"
+    EXTRACTION_CACHE_MAX_MB: int = 512
+    EXTRACTION_CACHE_S3_PREFIX: str = "cache/extraction/"  # empty = local tier only
+
     # File upload limits
     MAX_FILE_SIZE_MB: int = 50
     ALLOWED_FILE_TYPES: Any = ["application/pdf"]
@@ -2,6 +2,7 @@ import enum
 import os
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -61,6 +62,11 @@ class ConversionMode(str, enum.Enum):
     summary_explanation = "summary_explanation"
 
 
+class OutputFormat(str, enum.Enum):
+    mp3 = "mp3"
+    m4b = "m4b"
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -101,6 +107,7 @@ class Job(Base):
     audio_s3_key = Column(String(500))
     pdf_s3_url = Column(String(1000))
     audio_s3_url = Column(String(1000))
+    playlist_s3_key = Column(String(500))  # live HLS playlist, set once playable
 
     # Processing info
     status = Column(
@@ -122,9 +129,15 @@ class Job(Base):
         create_enum_type("conversionmode", ConversionMode, Base.metadata),
         default=ConversionMode.full,
     )
+    output_format = Column(
+        create_enum_type("outputformat", OutputFormat, Base.metadata),
+        default=OutputFormat.mp3,
+    )
+    output_profile = Column(String(50), default="standard")  # key of OUTPUT_PROFILES
     estimated_cost = Column(Numeric(10, 6), default=0.0)
     chars_processed = Column(Integer, default=0)
     tokens_used = Column(Integer, default=0)
+    bytes_saved = Column(BigInteger, default=0)  # by the output profile
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
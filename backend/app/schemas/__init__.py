@@ -48,6 +48,13 @@ class ConversionMode(str, Enum):
     summary_explanation = "summary_explanation"
 
 
+class OutputFormat(str, Enum):
+    """Enumeration for audiobook file formats."""
+
+    mp3 = "mp3"
+    m4b = "m4b"
+
+
 # --- User Schemas ---
 
 
@@ -157,6 +164,15 @@ class JobBase(BaseModel):
         ConversionMode.full,
         description="Conversion mode: full word-for-word conversion or summary explanation of core concepts.",
     )
+    output_format: OutputFormat = Field(
+        OutputFormat.mp3,
+        description="Audiobook format: MP3, or M4B (AAC) with chapters from the PDF outline.",
+    )
+    output_profile: str = Field(
+        "standard",
+        json_schema_extra={"example": "opus_32k"},
+        description="Output profile (codec, bitrate, channels); one of the configured OUTPUT_PROFILES.",
+    )
 
 
 class JobCreate(JobBase):
@@ -214,6 +230,11 @@ class Job(JobBase):
         json_schema_extra={"example": "https://bucket.s3.amazonaws.com/audio/1/42.mp3"},
         description="The public URL for the generated audio file.",
     )
+    playlist_s3_key: Optional[str] = Field(
+        None,
+        json_schema_extra={"example": "hls/1/42/playlist.m3u8"},
+        description="The S3 key of the live HLS playlist, set once the first segment is playable.",
+    )
     status: JobStatus = Field(
         ..., json_schema_extra={"example": JobStatus.completed}, description="The current status of the job."
     )
@@ -224,6 +245,11 @@ class Job(JobBase):
         None, description="An error message if the job failed."
     )
     estimated_cost: float = Field(0.0, description="The estimated cost of the job.")
+    bytes_saved: Optional[int] = Field(
+        None,
+        json_schema_extra={"example": 41943040},
+        description="Bytes the output profile saved against the provider's default audio.",
+    )
     created_at: datetime = Field(..., description="Timestamp when the job was created.")
     started_at: Optional[datetime] = Field(
         None, description="Timestamp when processing started."
@@ -27,6 +27,8 @@ class JobService:
             reading_speed=job_data.reading_speed,
             include_summary=job_data.include_summary,
             conversion_mode=job_data.conversion_mode,
+            output_format=job_data.output_format,
+            output_profile=job_data.output_profile,
             status=JobStatus.pending,
         )
 
@@ -210,6 +212,13 @@ class JobService:
             except Exception as e:
                 logger.warning(f"Could not delete audio file {job.audio_s3_key}: {e}")
 
+        # Try to delete the HLS playlist and its segments
+        if job.playlist_s3_key:
+            try:
+                storage.delete_prefix(job.playlist_s3_key.rsplit("/", 1)[0] + "/")
+            except Exception as e:
+                logger.warning(f"Could not delete HLS files {job.playlist_s3_key}: {e}")
+
         # Delete database record
         self.db.delete(job)
         self.db.commit()
@@ -245,6 +254,11 @@ class JobService:
                     storage.delete_file(job.audio_s3_key)
                 except Exception as e:
                     logger.warning(f"Could not delete audio {job.audio_s3_key} for job {job.id}: {e}")
+            if job.playlist_s3_key:
+                try:
+                    storage.delete_prefix(job.playlist_s3_key.rsplit("/", 1)[0] + "/")
+                except Exception as e:
+                    logger.warning(f"Could not delete HLS files {job.playlist_s3_key} for job {job.id}: {e}")
             
             self.db.delete(job)
             count += 1
@@ -58,6 +58,12 @@ class StorageService:
         except ClientError as e:
             raise Exception(f"S3 upload failed: {str(e)}")
 
+    def object_url(self, key: str) -> str:
+        """Public URL of an object in the bucket"""
+        if settings.AWS_ENDPOINT_URL:
+            return f"{settings.AWS_ENDPOINT_URL.rstrip('/')}/{self.bucket_name}/{key}"
+        return f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{key}"
+
     def upload_large_file(self, file_path: str, key: str, content_type: str = "audio/mpeg") -> str:
         """Upload a large file from disk to S3 using multipart upload (automatic via upload_file)"""
         try:
@@ -122,6 +128,23 @@ class StorageService:
         except ClientError as e:
             raise Exception(f"S3 delete failed: {str(e)}")
     
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete every object under a prefix; returns how many were deleted"""
+        try:
+            deleted = 0
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                objects = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+                if objects:
+                    self.s3_client.delete_objects(
+                        Bucket=self.bucket_name, Delete={'Objects': objects}
+                    )
+                    deleted += len(objects)
+            return deleted
+
+        except ClientError as e:
+            raise Exception(f"S3 delete failed: {str(e)}")
+
     def generate_presigned_url(self, key: str, expiration: int = 3600) -> Optional[str]:
         """Generate a presigned URL for temporary access"""
         try:
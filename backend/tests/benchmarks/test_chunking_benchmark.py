@@ -0,0 +1,64 @@
+"""
+TTS chunker benchmark over multi-megabyte texts.
+
+Skipped by default; run with:
+    RUN_BENCHMARKS=1 pytest backend/tests/benchmarks -s
+"""
+import os
+import random
+import time
+
+import pytest
+
+from worker.chunking import chunk_text
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+WORDS = "the quick brown fox jumps over lazy dog committee reviews figures".split()
+
+
+def make_text(size_mb):
+    rng = random.Random(size_mb)
+    sentences = []
+    total = 0
+    target = size_mb * 1024 * 1024
+    while total < target:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 40)))
+        sentence += rng.choice([". ", "! ", "? ", ".\n\n", ", "])
+        sentences.append(sentence)
+        total += len(sentence)
+    return "".join(sentences)
+
+
+@pytest.mark.parametrize("size_mb", [1, 5, 20])
+def test_chunker_throughput(size_mb):
+    text = make_text(size_mb)
+
+    start = time.perf_counter()
+    chunks = chunk_text(text)
+    elapsed = time.perf_counter() - start
+
+    assert all(len(chunk) <= 4500 for chunk in chunks)
+    print(f"\n{size_mb} MB: {len(chunks)} chunks in {elapsed:.3f}s ({size_mb / elapsed:.1f} MB/s)")
+
+
+@pytest.mark.parametrize("size_mb", [1, 2])
+def test_chunker_matches_and_beats_reference(size_mb, reference_chunks):
+    # The quadratic reference gets slow fast; keep it to small inputs
+    text = make_text(size_mb)
+
+    start = time.perf_counter()
+    expected = reference_chunks(text, 4500)
+    reference_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chunks = chunk_text(text)
+    offset_s = time.perf_counter() - start
+
+    assert chunks == expected
+    print(
+        f"\n{size_mb} MB: reference {reference_s:.3f}s, offsets {offset_s:.3f}s, "
+        f"speedup {reference_s / offset_s:.1f}x"
+    )
@@ -0,0 +1,52 @@
+"""
+Extraction throughput benchmark: serial vs. process-pool page-range extraction.
+
+Skipped by default; run with:
+    RUN_BENCHMARKS=1 pytest backend/tests/benchmarks -s
+"""
+import os
+import time
+
+import fitz
+import pytest
+
+from worker.extraction import default_workers, extract_pages
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+PARAGRAPH = (
+    "The quick brown fox jumps over the lazy dog while the committee reviews "
+    "the quarterly figures in considerable detail. "
+) * 4
+
+
+def make_book(path, page_count):
+    doc = fitz.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        page.insert_textbox(page.rect + (72, 72, -72, -72), f"Page {i}. {PARAGRAPH * 3}")
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+@pytest.mark.parametrize("page_count", [100, 500, 2000])
+def test_extraction_speedup(tmp_path, page_count):
+    pdf_path = make_book(tmp_path / f"book_{page_count}.pdf", page_count)
+    workers = default_workers(0)
+
+    start = time.perf_counter()
+    serial = extract_pages(pdf_path, workers=1)
+    serial_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = extract_pages(pdf_path, workers=workers, min_pages_for_parallel=1)
+    parallel_s = time.perf_counter() - start
+
+    assert parallel == serial
+    print(
+        f"\n{page_count} pages: serial {serial_s:.2f}s, "
+        f"{workers} workers {parallel_s:.2f}s, speedup {serial_s / parallel_s:.2f}x"
+    )
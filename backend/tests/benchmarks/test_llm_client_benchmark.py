@@ -0,0 +1,68 @@
+"""
+Per-call overhead of a fresh OpenAI client per LLM call (the old code) against
+the pooled per-process client, on a local keep-alive stub server.
+
+Plain HTTP on loopback, so this only counts client construction and TCP
+setup; against a real HTTPS endpoint each fresh client also pays DNS, a TLS
+handshake and network round trips on top.
+
+Skipped by default; run with:
+    RUN_BENCHMARKS=1 pytest backend/tests/benchmarks -s
+"""
+import os
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+import openai
+import pytest
+
+from worker.llm_client import close_llm_clients, get_llm_client
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "worker"))
+from test_llm_client import KeepAliveChatHandler  # noqa: E402
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+CALLS = 200
+
+
+def call(client):
+    client.chat.completions.create(
+        model="test", messages=[{"role": "user", "content": "hi"}], max_tokens=5
+    )
+
+
+def test_pooled_client_overhead():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveChatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        KeepAliveChatHandler.peers = []
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            with openai.OpenAI(api_key="test-key", base_url=base_url) as client:
+                call(client)
+        fresh_ms = (time.perf_counter() - start) * 1000 / CALLS
+        fresh_connections = len(set(KeepAliveChatHandler.peers))
+
+        KeepAliveChatHandler.peers = []
+        call(get_llm_client("test-key", base_url))  # warm the pool
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            call(get_llm_client("test-key", base_url))
+        pooled_ms = (time.perf_counter() - start) * 1000 / CALLS
+        pooled_connections = len(set(KeepAliveChatHandler.peers))
+    finally:
+        server.shutdown()
+        close_llm_clients()
+
+    assert pooled_connections == 1
+    print(
+        f"\n{CALLS} calls: fresh client {fresh_ms:.2f} ms/call over {fresh_connections} connections, "
+        f"pooled {pooled_ms:.2f} ms/call over {pooled_connections} connection "
+        f"({fresh_ms - pooled_ms:.2f} ms saved per call)"
+    )
@@ -0,0 +1,70 @@
+"""
+Text normalization throughput (MB/s) against the old multi-pass cleanup.
+
+Skipped by default; run with:
+    RUN_BENCHMARKS=1 pytest backend/tests/benchmarks -s
+"""
+import os
+import random
+import re
+import time
+
+import pytest
+
+from worker.normalization import normalize_pages
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+WORDS = "the quick brown fox jumps over lazy dog committee reviews figures".split()
+# Roughly one damaged word per few hundred, as in a badly encoded book
+DAMAGED = ["ﬁsh", "itâ€™s", "â€œquotedâ€œ"]
+
+
+def multi_pass_cleanup(text):
+    """The cleanup this replaced: several full passes, each copying the text."""
+    text = re.sub(r"\n\s*\n", "\n", text)
+    text = re.sub(r"\s+", " ", text)
+    for old, new in {"â€™": "'", "â€œ": '"'}.items():
+        text = text.replace(old, new)
+    text = text.replace("ﬁ", "fi").replace("ﬂ", "fl")
+    text = re.sub(r"\s{2,}", " ", text)
+    return text.strip()
+
+
+def make_pages(size_mb, page_chars=3000):
+    rng = random.Random(size_mb)
+    pages = []
+    for _ in range(size_mb * 1024 * 1024 // page_chars):
+        lines = []
+        length = 0
+        while length < page_chars:
+            line = " ".join(
+                rng.choice(DAMAGED) if rng.random() < 0.005 else rng.choice(WORDS)
+                for _ in range(rng.randint(6, 14))
+            )
+            lines.append(line)
+            length += len(line) + 1
+        pages.append("\n".join(lines) + "\n\n")
+    return pages
+
+
+@pytest.mark.parametrize("size_mb", [1, 10])
+def test_normalization_throughput(size_mb):
+    pages = make_pages(size_mb)
+    megabytes = sum(len(page) for page in pages) / (1024 * 1024)
+
+    start = time.perf_counter()
+    old = multi_pass_cleanup("".join(pages))
+    old_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = " ".join(normalize_pages(pages))
+    new_s = time.perf_counter() - start
+
+    assert new == old
+    print(
+        f"\n{megabytes:.1f} MB: multi-pass {megabytes / old_s:.1f} MB/s, "
+        f"single pass {megabytes / new_s:.1f} MB/s"
+    )
@@ -1,4 +1,5 @@
 import pytest
+import re
 import sys
 import os
 from fastapi.testclient import TestClient
@@ -58,3 +59,28 @@ def client(db_session):
     yield TestClient(app)
 
     app.dependency_overrides.clear()
+
+
+def _reference_chunks(text, max_chars):
+    """The original cut-and-restrip chunker the offset version must match."""
+    if not text:
+        return []
+    if len(text) <= max_chars:
+        return [text]
+    chunks = []
+    while text:
+        if len(text) <= max_chars:
+            chunks.append(text)
+            break
+        sub_text = text[:max_chars]
+        matches = list(re.finditer(r"[.!?]\s+", sub_text)) or list(re.finditer(r"\s+", sub_text))
+        split_point = matches[-1].end() if matches else max_chars
+        chunks.append(text[:split_point].strip())
+        text = text[split_point:].strip()
+    return chunks
+
+
+@pytest.fixture
+def reference_chunks():
+    """Shared by the chunking tests and the chunking benchmark."""
+    return _reference_chunks
@@ -0,0 +1,92 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from worker.assembly import StreamingAssembler
+from worker.mp3 import audio_spans, duration_seconds
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def make_mp3(path, seconds, frequency=440):
+    # ffmpeg writes an ID3 tag and a Xing header frame, as providers often do
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "lavfi",
+         "-i", f"sine=frequency={frequency}:duration={seconds}",
+         "-c:a", "libmp3lame", "-b:a", "64k", str(path)],
+        check=True,
+    )
+    return str(path)
+
+
+def decodes(path):
+    return subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", str(path), "-f", "null", "-"], capture_output=True
+    ).returncode == 0
+
+
+def test_frames_skip_tags_and_info_header(tmp_path):
+    data = open(make_mp3(tmp_path / "a.mp3", 1), "rb").read()
+    frames = audio_spans(data)
+
+    assert data[:3] == b"ID3"
+    assert data[frames[0].offset:frames[0].offset + 2] in (b"\xff\xfb", b"\xff\xfa")
+    assert b"Xing" not in data[frames[0].offset:frames[0].offset + frames[0].length]
+    assert 1.0 <= duration_seconds(frames) < 1.1
+    assert audio_spans(b"not audio at all" * 100) is None
+
+
+def test_chunks_are_appended_in_order_as_they_land(tmp_path):
+    chunks = [make_mp3(tmp_path / f"chunk_{i}.mp3", 1, 300 + 100 * i) for i in range(4)]
+    expected = b"".join(
+        data[f.offset:f.offset + f.length]
+        for data in (open(c, "rb").read() for c in chunks)
+        for f in audio_spans(data)
+    )
+    output = tmp_path / "final_output.mp3"
+    sent = []
+    assembler = StreamingAssembler(
+        str(output), concat=lambda files: pytest.fail("no fallback"), sinks=[sent.append]
+    )
+
+    assembler.add(1, chunks[1])
+    assert assembler.appended == 0 and os.path.exists(chunks[1])
+    assembler.add(0, chunks[0])
+    # Both are in the output and their files are gone
+    assert assembler.appended == 2
+    assert not os.path.exists(chunks[0]) and not os.path.exists(chunks[1])
+    assembler.add(3, chunks[3])
+    assembler.add(2, chunks[2])
+
+    assert assembler.finish(4) == str(output)
+    assert output.read_bytes() == expected
+    # The sink (streaming upload) saw exactly the output
+    assert b"".join(sent) == expected
+    assert 4.0 <= assembler.duration < 4.4
+    assert decodes(output)
+
+
+def test_non_mp3_chunk_falls_back_to_concat(tmp_path):
+    first = make_mp3(tmp_path / "chunk_0.mp3", 1)
+    odd = tmp_path / "chunk_1.wav"
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "lavfi", "-i", "sine=duration=1", str(odd)],
+        check=True,
+    )
+    concatenated = []
+
+    def concat(files):
+        concatenated.extend(files)
+        return "concat.mp3"
+
+    output = tmp_path / "final_output.mp3"
+    assembler = StreamingAssembler(str(output), concat)
+    assembler.add(0, first)
+    assembler.add(1, str(odd))
+
+    assert assembler.finish(2) == "concat.mp3"
+    # The audio assembled so far leads, then the chunk it couldn't append
+    assert concatenated == [f"{output}.head.mp3", str(odd)]
+    assert decodes(concatenated[0])
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from worker.event_loop import run_sync
+from worker.pdf_pipeline import AsyncTTSProvider, ElevenLabsTTS, OpenAITTS
+
+
+class SleepyTTS(AsyncTTSProvider):
+    def _make_client(self):
+        return None
+
+    async def text_to_audio_async(self, text, voice_id, speed):
+        await asyncio.sleep(0.2)
+        return text.encode()
+
+
+def test_hundreds_of_requests_in_flight_without_a_thread_each():
+    provider = SleepyTTS()
+    threads_before = threading.active_count()
+
+    async def many():
+        return await asyncio.gather(
+            *(provider.text_to_audio_async(f"chunk {i}", "default", 1.0) for i in range(300))
+        )
+
+    start = time.monotonic()
+    results = run_sync(many())
+
+    assert results == [f"chunk {i}".encode() for i in range(300)]
+    assert time.monotonic() - start < 2
+    # At most the shared loop's thread was added
+    assert threading.active_count() <= threads_before + 1
+
+
+def test_sync_adapter_serves_threaded_callers():
+    provider = SleepyTTS()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda i: provider.text_to_audio(str(i), "default", 1.0), range(16)))
+    assert results == [str(i).encode() for i in range(16)]
+
+
+class SpeechHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(0.2)
+        payload = b"ID3-fake-mp3"
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def speech_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SpeechHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+    yield
+    server.shutdown()
+
+
+def test_openai_requests_overlap_on_one_loop(speech_server):
+    provider = OpenAITTS()
+
+    async def many():
+        return await asyncio.gather(
+            *(provider.text_to_audio_async("Hello.", "default", 1.0) for _ in range(20))
+        )
+
+    start = time.monotonic()
+    results = run_sync(many())
+
+    assert results == [b"ID3-fake-mp3"] * 20
+    # 20 requests of 0.2s each, concurrently
+    assert time.monotonic() - start < 2
+    assert provider.text_to_audio("Hello.", "default", 1.0) == b"ID3-fake-mp3"
+
+
+def test_eleven_labs_joins_streamed_audio():
+    calls = []
+
+    class FakeTextToSpeech:
+        async def convert(self, voice_id, **kwargs):
+            calls.append(voice_id)
+            for part in (b"ID3", b"-part1", b"-part2"):
+                yield part
+
+    class FakeClient:
+        text_to_speech = FakeTextToSpeech()
+
+    provider = ElevenLabsTTS()
+    provider._make_client = FakeClient
+
+    assert provider.text_to_audio("Hello.", "", 1.0) == b"ID3-part1-part2"
+    assert calls == ["21m00Tcm4TlvDq8ikWAM"]
@@ -0,0 +1,47 @@
+from worker.boilerplate import RepeatedLineFilter
+
+
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf"]
+
+
+def make_book(page_count):
+    pages = []
+    for i in range(page_count):
+        word = WORDS[i % len(WORDS)]
+        body = f"Page {i} opens with {word}.\nIt ends with {word} {i}."
+        heading = "Chapter 1\n" if i == 0 else ""
+        pages.append(f"The Great Book\n{heading}{body}\n\n  {i + 1}  \n")
+    return pages
+
+
+def test_strips_running_headers_and_page_numbers():
+    repeated = RepeatedLineFilter()
+    pages = list(repeated.filter(make_book(10)))
+
+    assert pages[0] == "Chapter 1\nPage 0 opens with alpha.\nIt ends with alpha 0.\n"
+    assert pages[5].startswith("Page 5 opens")
+    assert repeated.lines_removed == 20
+    assert repeated.chars_removed == 10 * len("The Great Book") + 9 + 2
+
+
+def test_keeps_lines_that_do_not_recur_often_enough():
+    pages = [f"Heading {i}\nUnique body {i}.\n" for i in range(2)]
+    repeated = RepeatedLineFilter()
+
+    assert [p.rstrip("\n") for p in repeated.filter(pages)] == [p.rstrip("\n") for p in pages]
+    assert repeated.chars_removed == 0
+
+
+def test_lookahead_releases_pages_before_the_end():
+    consumed = []
+
+    def pages():
+        for i, page in enumerate(make_book(30)):
+            consumed.append(i)
+            yield page
+
+    stream = RepeatedLineFilter().filter(pages(), lookahead=5)
+    first = next(stream)
+
+    assert len(consumed) == 6
+    assert first.startswith("Chapter 1")
@@ -0,0 +1,88 @@
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import fitz
+
+from worker.cache import LocalDiskCache, ObjectStoreCache, TieredCache
+
+
+def test_local_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = LocalDiskCache(str(tmp_path), max_bytes=250)
+    cache.set("a", b"x" * 100)
+    cache.set("b", b"y" * 100)
+    # Make "a" the most recently used entry
+    past = time.time() - 60
+    os.utime(tmp_path / "b", (past, past))
+    assert cache.get("a") == b"x" * 100
+
+    cache.set("c", b"z" * 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"x" * 100
+    assert cache.get("c") == b"z" * 100
+
+
+def test_tiered_cache_backfills_faster_tiers(tmp_path):
+    local = LocalDiskCache(str(tmp_path), max_bytes=1024)
+    storage = MagicMock()
+    storage.download_file.return_value = b"shared"
+    cache = TieredCache(local, ObjectStoreCache("cache/", storage=storage))
+
+    assert cache.get("key") == b"shared"
+    storage.download_file.assert_called_once_with("cache/key")
+    assert local.get("key") == b"shared"
+
+
+def test_tiered_cache_treats_backend_errors_as_misses(tmp_path):
+    storage = MagicMock()
+    storage.download_file.side_effect = Exception("S3 download failed: timeout")
+    storage.upload_file_data.side_effect = Exception("S3 upload failed: timeout")
+    cache = TieredCache(ObjectStoreCache("cache/", storage=storage))
+
+    assert cache.get("key") is None
+    cache.set("key", b"value")  # must not raise
+
+
+def test_second_extraction_of_same_pdf_is_served_from_cache(tmp_path):
+    from worker.pdf_pipeline import PDFToAudioPipeline
+
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Cached extraction test content. " * 5)
+    pdf_path = str(tmp_path / "book.pdf")
+    doc.save(pdf_path)
+    doc.close()
+
+    pipeline = PDFToAudioPipeline()
+    pipeline.extraction_cache = TieredCache(
+        LocalDiskCache(str(tmp_path / "cache"), max_bytes=1024 * 1024)
+    )
+
+    first = pipeline._extract_and_clean(pdf_path)
+    with patch.object(pipeline, "_extract_pages") as mock_extract:
+        second = pipeline._extract_and_clean(pdf_path)
+
+    mock_extract.assert_not_called()
+    assert second == first
+    assert "Cached extraction test content." in second[1]
+
+
+def test_extraction_cache_key_changes_with_extraction_settings(tmp_path):
+    from worker.pdf_pipeline import PDFToAudioPipeline, settings
+
+    pdf_path = str(tmp_path / "book.pdf")
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Cache key test content.")
+    doc.save(pdf_path)
+    doc.close()
+    pipeline = PDFToAudioPipeline()
+    key = pipeline._extraction_cache_key(pdf_path)
+
+    with patch.object(settings, "OCR_WORKERS", settings.OCR_WORKERS + 1):
+        assert pipeline._extraction_cache_key(pdf_path) == key
+    with patch.object(settings, "OCR_DPI", settings.OCR_DPI // 2):
+        assert pipeline._extraction_cache_key(pdf_path) != key
+    with patch.object(settings, "STRIP_REPEATED_LINES", not settings.STRIP_REPEATED_LINES):
+        assert pipeline._extraction_cache_key(pdf_path) != key
+    with patch.object(settings, "REPEATED_LINE_MIN_PAGES", settings.REPEATED_LINE_MIN_PAGES + 1):
+        assert pipeline._extraction_cache_key(pdf_path) != key
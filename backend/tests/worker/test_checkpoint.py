@@ -0,0 +1,95 @@
+from worker.checkpoint import JobCheckpoint
+from worker.synthesis import ChunkSynthesizer
+
+FINGERPRINT = {"voice_provider": "openai", "voice_type": "default", "reading_speed": 1.0}
+
+
+class FakeStorage:
+    def __init__(self):
+        self.objects = {}
+
+    def upload_file_data(self, data, key, content_type="application/octet-stream"):
+        self.objects[key] = data
+
+    def download_file(self, key):
+        if key not in self.objects:
+            raise Exception(f"File not found: {key}")
+        return self.objects[key]
+
+    def delete_file(self, key):
+        self.objects.pop(key, None)
+        return True
+
+    def delete_prefix(self, prefix):
+        keys = [key for key in self.objects if key.startswith(prefix)]
+        for key in keys:
+            del self.objects[key]
+        return len(keys)
+
+
+class FlakyTTS:
+    """Fails permanently once ``fail_at`` chunks have been requested."""
+
+    def __init__(self, fail_at=None):
+        self.fail_at = fail_at
+        self.calls = []
+
+    def text_to_audio(self, text, voice_id, speed):
+        if self.fail_at is not None and len(self.calls) >= self.fail_at:
+            raise RuntimeError("provider outage")
+        self.calls.append(text)
+        return text.encode()
+
+
+def synthesize(tmp_path, provider, checkpoint, chunks):
+    return ChunkSynthesizer(
+        provider, "default", 1.0, str(tmp_path),
+        concurrency=1, max_retries=0, checkpoint=checkpoint,
+    ).synthesize(chunks)
+
+
+def test_retry_resumes_at_first_missing_chunk(tmp_path):
+    storage = FakeStorage()
+    chunks = [f"Chunk number {i}." for i in range(10)]
+
+    first_attempt = FlakyTTS(fail_at=7)
+    try:
+        synthesize(tmp_path, first_attempt, JobCheckpoint(42, FINGERPRINT, storage=storage), chunks)
+    except RuntimeError:
+        pass
+
+    retry = FlakyTTS()
+    checkpoint = JobCheckpoint(42, FINGERPRINT, storage=storage)
+    paths = synthesize(tmp_path, retry, checkpoint, chunks)
+
+    assert retry.calls == chunks[7:]
+    assert checkpoint.stats() == {
+        "checkpoint_chunks_reused": 7,
+        "checkpoint_chars_reused": sum(len(c) for c in chunks[:7]),
+    }
+    assert [open(p, "rb").read().decode() for p in paths] == chunks
+
+
+def test_changed_settings_or_text_are_not_reused(tmp_path):
+    storage = FakeStorage()
+    synthesize(tmp_path, FlakyTTS(), JobCheckpoint(1, FINGERPRINT, storage=storage), ["a.", "b."])
+
+    other_speed = dict(FINGERPRINT, reading_speed=1.5)
+    provider = FlakyTTS()
+    synthesize(tmp_path, provider, JobCheckpoint(1, other_speed, storage=storage), ["a.", "b."])
+    assert provider.calls == ["a.", "b."]
+
+    provider = FlakyTTS()
+    synthesize(tmp_path, provider, JobCheckpoint(1, FINGERPRINT, storage=storage), ["a.", "B!"])
+    assert provider.calls == ["B!"]
+
+
+def test_clear_removes_checkpoint_objects(tmp_path):
+    storage = FakeStorage()
+    checkpoint = JobCheckpoint(5, FINGERPRINT, storage=storage)
+    synthesize(tmp_path, FlakyTTS(), checkpoint, ["one.", "two."])
+    assert storage.objects
+
+    checkpoint.clear()
+
+    assert storage.objects == {}
@@ -0,0 +1,101 @@
+import random
+
+from worker.chunking import chunk_text
+
+
+def test_chunk_text_matches_reference_on_random_text(reference_chunks):
+    rng = random.Random(7)
+    alphabet = ["word", "a", ".", "!", "?", " ", "  ", "\n", "\t", "longerword"]
+    for _ in range(3000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        max_chars = rng.randint(1, 20)
+        assert chunk_text(text, max_chars) == reference_chunks(text, max_chars)
+
+
+def test_chunk_text_prefers_sentences_then_words_then_hard_cuts():
+    text = "One two. Three four five six seven"
+    assert chunk_text(text, 20) == ["One two.", "Three four five six", "seven"]
+    assert chunk_text("abcdefghij", 4) == ["abcd", "efgh", "ij"]
+
+
+def test_chunk_text_short_input_is_returned_as_is():
+    assert chunk_text("", 10) == []
+    assert chunk_text("  short  ", 10) == ["  short  "]
+
+
+def test_chunks_fit_provider_limits_measured_their_way():
+    from worker.pdf_pipeline import TTSManager
+
+    text = " ".join(["Fish & chips <served> \"hot\". Crème brûlée ☕ for ünïcode."] * 2000)
+    limits = TTSManager.CHUNK_LIMITS
+
+    for name in ("openai", "google", "aws_polly", "azure", "eleven_labs"):
+        limit = limits[name]
+        chunks = chunk_text(text, limit.max_chars, limit.fits)
+        assert all(limit.fits(chunk) for chunk in chunks), name
+        assert " ".join(chunks) == text
+
+    google = chunk_text(text, limits["google"].max_chars, limits["google"].fits)
+    assert max(len(chunk.encode("utf-8")) for chunk in google) > 4500
+
+
+def test_limit_only_shrinks_windows_when_needed():
+    from worker.chunking import ChunkLimit, escaped_length
+
+    limit = ChunkLimit(20, max_size=20, size=escaped_length)
+    assert chunk_text("plain words here ok", 20, limit.fits) == ["plain words here ok"]
+    assert chunk_text("a & b & c & d", 20, limit.fits) == ["a & b & c", "& d"]
+
+
+def feed_in_pieces(chunker, text, rng):
+    chunks = []
+    position = 0
+    while position < len(text):
+        size = rng.randint(1, 8)
+        chunks.extend(chunker.feed(text[position:position + size]))
+        position += size
+    return chunks + chunker.close()
+
+
+def test_stream_chunker_releases_first_sentence_early():
+    from worker.chunking import StreamChunker
+
+    chunker = StreamChunker(max_chars=1000, first_chars=20)
+    assert chunker.feed("The first sentence is") == []
+    assert chunker.feed(" here. The sec") == ["The first sentence is here."]
+    assert chunker.feed("ond one") == []
+    assert chunker.close() == ["The second one"]
+
+
+def test_stream_chunker_cuts_do_not_depend_on_the_pieces():
+    from worker.chunking import ChunkLimit, StreamChunker, utf8_bytes
+
+    rng = random.Random(11)
+    words = ["alpha", "beta.", "ünïcode", "gamma!", "delta", "x" * 60, "eps?", "end.  ", "\n\n", "?!"]
+    text = " ".join(rng.choice(words) for _ in range(3000))
+    limit = ChunkLimit(300, max_size=300, size=utf8_bytes)
+
+    def make():
+        return StreamChunker(limit.max_chars, limit.fits, first_chars=40)
+
+    # A cached completion arrives in one piece; a live one in small deltas
+    whole = make()
+    cached = whole.feed(text) + whole.close()
+
+    assert feed_in_pieces(make(), text, rng) == cached
+
+
+def test_stream_chunker_covers_text_within_limits():
+    from worker.chunking import ChunkLimit, StreamChunker, utf8_bytes
+
+    rng = random.Random(7)
+    words = ["alpha", "beta.", "ünïcode", "gamma!", "delta", "x" * 60, "eps?"]
+    text = " ".join(rng.choice(words) for _ in range(5000))
+    limit = ChunkLimit(300, max_size=300, size=utf8_bytes)
+
+    chunks = feed_in_pieces(StreamChunker(limit.max_chars, limit.fits, first_chars=40), text, rng)
+
+    assert " ".join(chunks) == text
+    assert all(limit.fits(chunk) for chunk in chunks)
+    # Chunks grow to the limit, so there are few more than for the whole text
+    assert len(chunks) <= len(chunk_text(text, limit.max_chars, limit.fits)) + 5
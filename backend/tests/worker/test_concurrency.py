@@ -0,0 +1,87 @@
+import threading
+import time
+
+from worker.concurrency import AIMDController, is_overload_error
+
+
+def run(controller, error=None):
+    try:
+        with controller.slot():
+            if error:
+                raise error
+    except Exception:
+        pass
+
+
+def saturate(controller):
+    """Fill every slot, then complete the calls successfully."""
+    slots = [controller.slot() for _ in range(controller.stats()["limit"])]
+    for slot in slots:
+        slot.__enter__()
+    for slot in slots:
+        slot.__exit__(None, None, None)
+
+
+def test_limit_grows_additively_only_while_saturated():
+    controller = AIMDController("test", initial=2, max_limit=4)
+
+    for _ in range(10):
+        run(controller)  # one call at a time never uses both slots
+    assert controller.stats()["limit"] == 2
+
+    for _ in range(20):
+        saturate(controller)
+    assert controller.stats()["limit"] == 4
+
+
+def test_overload_halves_the_limit_once_per_episode():
+    controller = AIMDController("test", initial=8, max_limit=16)
+    slots = [controller.slot() for _ in range(4)]
+    for slot in slots:
+        slot.__enter__()
+
+    # Four concurrent 429s from the same episode count as one signal
+    for slot in slots:
+        slot.__exit__(RuntimeError, RuntimeError("429 Too Many Requests"), None)
+
+    assert controller.stats() == {"limit": 4, "in_flight": 0, "decreases": 1}
+
+    run(controller, TimeoutError("read timed out"))
+    assert controller.stats()["limit"] == 2
+
+
+def test_other_errors_do_not_change_the_limit():
+    controller = AIMDController("test", initial=3)
+    run(controller, ValueError("bad voice id"))
+    assert controller.stats()["limit"] == 3
+
+
+def test_in_flight_calls_never_exceed_the_limit():
+    controller = AIMDController("test", initial=2, max_limit=2)
+    peak = 0
+    active = 0
+    lock = threading.Lock()
+
+    def call():
+        nonlocal peak, active
+        with controller.slot():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+
+
+def test_is_overload_error():
+    assert is_overload_error(Exception("Error code: 429 - rate limit reached"))
+    assert is_overload_error(Exception("ThrottlingException: Rate exceeded"))
+    assert not is_overload_error(ValueError("Unsupported TTS provider"))
@@ -0,0 +1,92 @@
+import shutil
+import subprocess
+import threading
+
+import boto3
+import pytest
+
+from worker.hls import HLSWriter, split_segments, timestamp_tag
+from worker.mp3 import Frame, audio_spans
+
+moto = pytest.importorskip("moto")
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_aws():
+        from app.services.storage import StorageService
+
+        storage = StorageService()
+        storage.s3_client = boto3.client("s3", region_name="us-east-1")
+        storage.bucket_name = "app-bucket"
+        storage.s3_client.create_bucket(Bucket="app-bucket")
+        yield storage
+
+
+def chunk_audio(tmp_path, name, seconds):
+    path = tmp_path / name
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "lavfi",
+         "-i", f"sine=duration={seconds}", "-c:a", "libmp3lame", "-b:a", "64k", str(path)],
+        check=True,
+    )
+    data = path.read_bytes()
+    # What the assembler hands its sinks: the chunk's bare audio frames
+    return b"".join(data[f.offset:f.offset + f.length] for f in audio_spans(data))
+
+
+def test_timestamp_tag_carries_33_bit_pts():
+    tag = timestamp_tag((1 << 33) + 90000)
+
+    assert tag[:3] == b"ID3" and b"com.apple.streaming.transportStreamTimestamp\x00" in tag
+    assert int.from_bytes(tag[-8:], "big") == 90000
+
+
+def test_segments_never_exceed_the_target():
+    frames = [Frame(i * 100, 100, 1152, 44100) for i in range(1000)]  # ~26 s
+
+    segments = split_segments(frames, 10.0)
+
+    durations = [sum(f.samples / f.sample_rate for f in s) for s in segments]
+    assert all(d <= 10.0 for d in durations) and len(segments) == 3
+    assert sum(len(s) for s in segments) == 1000
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_playlist_is_live_after_the_first_chunk(storage, tmp_path):
+    chunks = [chunk_audio(tmp_path, "a.mp3", 5), chunk_audio(tmp_path, "b.mp3", 3)]
+    live = threading.Event()
+    recorded = []
+
+    def on_live(key):
+        recorded.append(key)
+        live.set()
+
+    hls = HLSWriter(storage, "hls/1/42/", segment_seconds=2.0, on_live=on_live)
+    hls.write(chunks[0])
+    assert live.wait(timeout=10)
+
+    playlist = storage.download_file("hls/1/42/playlist.m3u8").decode()
+    assert "#EXT-X-TARGETDURATION:2" in playlist
+    assert "#EXT-X-ENDLIST" not in playlist
+
+    hls.write(chunks[1])
+    hls.finish()
+
+    playlist = storage.download_file("hls/1/42/playlist.m3u8").decode()
+    assert playlist.rstrip().endswith("#EXT-X-ENDLIST")
+    durations = [float(line[8:-1]) for line in playlist.splitlines() if line.startswith("#EXTINF:")]
+    assert all(d <= 2.0 for d in durations)
+    assert abs(sum(durations) - 8.0) < 0.2
+    assert recorded == ["hls/1/42/playlist.m3u8"]
+
+    # Segments are the chunks' frames, each behind its timestamp tag
+    audio = b""
+    for i in range(len(durations)):
+        segment = storage.download_file(hls.segment_key(i))
+        assert segment[:3] == b"ID3"
+        audio += segment[len(timestamp_tag(0)):]
+    assert audio == b"".join(chunks)
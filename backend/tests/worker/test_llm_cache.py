@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from worker.cache import RedisCache, TieredCache
+from worker.pdf_pipeline import PDFToAudioPipeline
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def make_response(content, tokens):
+    response = MagicMock()
+    response.choices[0].message.content = content
+    response.usage.total_tokens = tokens
+    return response
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = PDFToAudioPipeline()
+    pipeline.rate_limiter = None
+    pipeline.llm_cache = TieredCache(RedisCache(fakeredis.FakeRedis(), "llmcache:", ttl=60))
+    return pipeline
+
+
+@patch("worker.pdf_pipeline.openai.OpenAI")
+def test_repeated_llm_call_is_served_from_cache_at_zero_tokens(mock_openai, pipeline):
+    create = mock_openai.return_value.chat.completions.create
+    create.return_value = make_response(" A summary. ", 1200)
+
+    with patch.multiple("worker.pdf_pipeline.settings", OPENROUTER_API_KEY=None, OPENAI_API_KEY="k"):
+        first = pipeline._call_llm_with_retry("Summarize.", "Book text.", 600, 0.3)
+        second = pipeline._call_llm_with_retry("Summarize.", "Book text.", 600, 0.3)
+        other = pipeline._call_llm_with_retry("Summarize.", "Book text.", 600, 0.7)
+
+    assert first == ("A summary.", 1200)
+    assert second == ("A summary.", 0)
+    assert other == ("A summary.", 1200)
+    assert create.call_count == 2
+
+
+def test_redis_cache_entries_expire():
+    client = fakeredis.FakeRedis()
+    RedisCache(client, "llmcache:", ttl=60).set("key", b"value")
+
+    assert 0 < client.ttl("llmcache:key") <= 60
+
+
+@patch("worker.pdf_pipeline.openai.OpenAI")
+def test_llm_cache_hits_and_misses_are_counted_per_job(mock_openai, pipeline):
+    mock_openai.return_value.chat.completions.create.return_value = make_response("A summary.", 10)
+
+    with patch.multiple("worker.pdf_pipeline.settings", OPENROUTER_API_KEY=None, OPENAI_API_KEY="k"):
+        pipeline._call_llm_with_retry("Summarize.", "Earlier job.", 600, 0.3)
+        start = pipeline._llm_cache_counts()
+        pipeline._call_llm_with_retry("Summarize.", "Book text.", 600, 0.3)
+        pipeline._call_llm_with_retry("Summarize.", "Book text.", 600, 0.3)
+        list(pipeline._stream_llm("Summarize.", "Book text.", 600, 0.3, {}))
+
+    assert pipeline._llm_cache_stats(start) == {"llm_cache_hits": 2, "llm_cache_misses": 1}
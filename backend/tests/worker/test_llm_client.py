@@ -0,0 +1,82 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from worker import llm_client
+from worker.llm_client import close_llm_clients, get_llm_client
+
+
+class KeepAliveChatHandler(BaseHTTPRequestHandler):
+    """Chat completions stub that records which client socket each call used."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; don't let Nagle hold the body back
+    disable_nagle_algorithm = True
+    peers = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.peers.append(self.client_address)
+        payload = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "test",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "ok"},
+                "finish_reason": "stop",
+            }],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def keepalive_server():
+    KeepAliveChatHandler.peers = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveChatHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    close_llm_clients()
+
+
+def test_client_is_shared_per_key_and_base_url():
+    try:
+        first = get_llm_client("key-a", "http://127.0.0.1:1/v1")
+        assert get_llm_client("key-a", "http://127.0.0.1:1/v1") is first
+        assert get_llm_client("key-b", "http://127.0.0.1:1/v1") is not first
+        assert get_llm_client("key-a", "http://127.0.0.1:2/v1") is not first
+    finally:
+        close_llm_clients()
+    assert llm_client._clients == {}
+
+
+def test_calls_reuse_one_keep_alive_connection(keepalive_server):
+    for _ in range(5):
+        client = get_llm_client("test-key", keepalive_server)
+        client.chat.completions.create(
+            model="test", messages=[{"role": "user", "content": "hi"}], max_tokens=5
+        )
+
+    assert len(KeepAliveChatHandler.peers) == 5
+    assert len(set(KeepAliveChatHandler.peers)) == 1
+
+
+def test_timeouts_come_from_arguments():
+    try:
+        client = get_llm_client("key", "http://127.0.0.1:1/v1", timeout=7, connect_timeout=3)
+        assert client._client.timeout.read == 7
+        assert client._client.timeout.connect == 3
+    finally:
+        close_llm_clients()
@@ -0,0 +1,123 @@
+import contextlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from worker.llm_client import close_llm_clients
+from worker.pdf_pipeline import PDFToAudioPipeline
+
+FIRST = ["The first ", "idea is ", "simple. "]
+REST = ["Then ", "a second ", "idea follows. ", "And a third ", "one ends it."]
+
+
+class StreamingChatHandler(BaseHTTPRequestHandler):
+    """Chat completions endpoint that streams FIRST, then waits for ``release``."""
+
+    release = threading.Event()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        assert body["stream"] is True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for i, delta in enumerate(FIRST + REST):
+            if i == len(FIRST):
+                self.release.wait(timeout=10)
+            self.send_event({"choices": [{"index": 0, "delta": {"content": delta}}]})
+        self.send_event({
+            "choices": [],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
+        })
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def send_event(self, event):
+        event.update({"id": "chatcmpl-test", "object": "chat.completion.chunk", "created": 0, "model": "test"})
+        self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def streaming_server():
+    StreamingChatHandler.release = threading.Event()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StreamingChatHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    StreamingChatHandler.release.set()
+    server.shutdown()
+    close_llm_clients()
+
+
+def test_first_chunk_is_ready_before_the_completion_ends(streaming_server):
+    pipeline = PDFToAudioPipeline()
+    pipeline.rate_limiter = None
+    pipeline.llm_cache = None
+    text_parts = []
+    usage = {"tokens": 0}
+
+    with patch.multiple(
+        "worker.pdf_pipeline.settings",
+        LLM_BASE_URL=streaming_server,
+        OPENROUTER_API_KEY=None,
+        OPENAI_API_KEY="test-key",
+        LLM_STREAM_FIRST_CHUNK_CHARS=10,
+    ):
+        chunks = pipeline._stream_explanation_chunks("Some document.", text_parts, usage)
+        # The server is still holding back the rest of the completion
+        first, _ = next(chunks)
+        assert first == "The first idea is simple."
+        StreamingChatHandler.release.set()
+        rest = [chunk for chunk, _ in chunks]
+
+    assert " ".join([first] + rest) == "".join(FIRST + REST).strip()
+    assert text_parts == [first] + rest
+    assert usage["tokens"] == 30
+
+
+def test_llm_slot_is_released_before_the_consumer_catches_up(streaming_server):
+    pipeline = PDFToAudioPipeline()
+    pipeline.rate_limiter = None
+    pipeline.llm_cache = None
+    released = threading.Event()
+
+    @contextlib.contextmanager
+    def slot():
+        try:
+            yield
+        finally:
+            released.set()
+
+    with patch.multiple(
+        "worker.pdf_pipeline.settings",
+        LLM_BASE_URL=streaming_server,
+        OPENROUTER_API_KEY=None,
+        OPENAI_API_KEY="test-key",
+    ), patch.object(pipeline, "_llm_slot", slot):
+        deltas = pipeline._stream_llm("System.", "Body.", 100, 0.2, {})
+        assert next(deltas) == FIRST[0]
+        StreamingChatHandler.release.set()
+        # Nothing more is consumed, yet the response is read to the end
+        assert released.wait(timeout=5)
+        rest = list(deltas)
+
+    assert [FIRST[0]] + rest == FIRST + REST
+
+
+def test_llm_failure_before_output_falls_back():
+    pipeline = PDFToAudioPipeline()
+    pipeline.rate_limiter = None
+    pipeline.llm_cache = None
+
+    with patch.multiple(
+        "worker.pdf_pipeline.settings", OPENROUTER_API_KEY=None, OPENAI_API_KEY=None
+    ):
+        pieces = list(pipeline._stream_concept_explanation("Body text.", {}))
+
+    assert pieces == [pipeline._concept_explanation_fallback("Body text.")]
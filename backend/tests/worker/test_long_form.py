@@ -0,0 +1,262 @@
+import io
+import json
+import math
+import re
+import struct
+import threading
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from worker.long_form import MIN_PART_BYTES, assemble_s3_objects, s3_key_from_uri
+from worker.pdf_pipeline import AWSPollyTTS, GoogleTTS, PDFToAudioPipeline
+
+moto = pytest.importorskip("moto")
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_aws():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="tts-bucket")
+        s3.create_bucket(Bucket="app-bucket")
+        yield s3
+
+
+def test_s3_key_from_polly_output_uri():
+    assert s3_key_from_uri("https://s3.us-east-1.amazonaws.com/tts-bucket/longform/a/t1.mp3", "tts-bucket") == "longform/a/t1.mp3"
+    assert s3_key_from_uri("https://tts-bucket.s3.amazonaws.com/longform/a/t1.mp3", "tts-bucket") == "longform/a/t1.mp3"
+
+
+def test_small_leading_parts_are_not_assembled_in_s3(aws):
+    aws.put_object(Bucket="tts-bucket", Key="a.mp3", Body=b"x" * 10)
+    aws.put_object(Bucket="tts-bucket", Key="b.mp3", Body=b"y" * 10)
+
+    assert not assemble_s3_objects(aws, "tts-bucket", ["a.mp3", "b.mp3"], "app-bucket", "out.mp3")
+    assert "Contents" not in aws.list_objects_v2(Bucket="app-bucket")
+
+
+def test_polly_long_form_is_assembled_inside_s3(aws):
+    pipeline = PDFToAudioPipeline()
+    provider = AWSPollyTTS()
+    parts = {"task-1": b"\xff\xfb" * (MIN_PART_BYTES // 2 + 10), "task-2": b"\xff\xf3tail"}
+    outputs = {}
+
+    def task(task_id, status):
+        result = {"TaskId": task_id, "TaskStatus": status}
+        if status == "completed":
+            result["OutputUri"] = f"https://s3.us-east-1.amazonaws.com/tts-bucket/{outputs[task_id]}"
+        return {"SynthesisTask": result}
+
+    stubber = Stubber(provider.client)
+    for task_id in parts:
+        stubber.add_response("start_speech_synthesis_task", {"SynthesisTask": {"TaskId": task_id}})
+    start_task = provider.client.start_speech_synthesis_task
+
+    def start_and_write(**params):
+        # Polly writes its output straight to the bucket; so does the fake
+        assert params["OutputS3BucketName"] == "tts-bucket"
+        task_id = start_task(**params)["SynthesisTask"]["TaskId"]
+        outputs[task_id] = f"{params['OutputS3KeyPrefix']}{task_id}.mp3"
+        aws.put_object(Bucket="tts-bucket", Key=outputs[task_id], Body=parts[task_id])
+        # task-2 is still running at the first poll
+        if task_id == "task-2":
+            stubber.add_response("get_speech_synthesis_task", task("task-1", "completed"))
+            stubber.add_response("get_speech_synthesis_task", task("task-2", "inProgress"))
+            stubber.add_response("get_speech_synthesis_task", task("task-2", "completed"))
+        return {"SynthesisTask": {"TaskId": task_id}}
+
+    provider.client.start_speech_synthesis_task = start_and_write
+
+    with stubber, patch.multiple(
+        "worker.pdf_pipeline.settings",
+        S3_BUCKET_NAME="app-bucket",
+        LONG_FORM_S3_BUCKET="tts-bucket",
+        AWS_ENDPOINT_URL=None,
+        LONG_FORM_POLL_SECONDS=0,
+    ):
+        usage = {}
+        result = pipeline._synthesize_long_form(
+            provider, "aws_polly", "word " * 30000, "Joanna", 1.0,
+            "/tmp", "audio/1/2.mp3", None, usage,
+        )
+        stubber.assert_no_pending_responses()
+
+    assert result is None
+    assembled = aws.get_object(Bucket="app-bucket", Key="audio/1/2.mp3")["Body"].read()
+    assert assembled == parts["task-1"] + parts["task-2"]
+    assert usage["long_form_tasks"] == 2
+    # Intermediates are cleaned up
+    assert "Contents" not in aws.list_objects_v2(Bucket="tts-bucket")
+
+
+def test_polly_outputs_are_deleted_when_a_task_times_out(aws):
+    pipeline = PDFToAudioPipeline()
+    provider = AWSPollyTTS()
+    stubber = Stubber(provider.client)
+    start_task = provider.client.start_speech_synthesis_task
+    for task_id in ("task-1", "task-2"):
+        stubber.add_response("start_speech_synthesis_task", {"SynthesisTask": {"TaskId": task_id}})
+
+    def start_and_write(**params):
+        task_id = start_task(**params)["SynthesisTask"]["TaskId"]
+        # Only task-1 finishes before the timeout
+        if task_id == "task-1":
+            aws.put_object(Bucket="tts-bucket", Key=f"{params['OutputS3KeyPrefix']}task-1.mp3", Body=b"audio")
+            stubber.add_response("get_speech_synthesis_task", {"SynthesisTask": {
+                "TaskId": "task-1", "TaskStatus": "completed",
+                "OutputUri": f"https://s3.us-east-1.amazonaws.com/tts-bucket/{params['OutputS3KeyPrefix']}task-1.mp3",
+            }})
+        else:
+            stubber.add_response("get_speech_synthesis_task", {"SynthesisTask": {
+                "TaskId": "task-2", "TaskStatus": "inProgress",
+            }})
+        return {"SynthesisTask": {"TaskId": task_id}}
+
+    provider.client.start_speech_synthesis_task = start_and_write
+
+    with stubber, patch.multiple(
+        "worker.pdf_pipeline.settings",
+        S3_BUCKET_NAME="app-bucket",
+        LONG_FORM_S3_BUCKET="tts-bucket",
+        LONG_FORM_POLL_SECONDS=0,
+        LONG_FORM_TIMEOUT_SECONDS=0,
+    ), pytest.raises(TimeoutError):
+        pipeline._synthesize_long_form(
+            provider, "aws_polly", "word " * 30000, "Joanna", 1.0,
+            "/tmp", "audio/1/2.mp3", None, {},
+        )
+
+    assert "Contents" not in aws.list_objects_v2(Bucket="tts-bucket")
+
+
+def make_wav(seconds=0.5, rate=16000):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(b"".join(
+            struct.pack("<h", int(8000 * math.sin(2 * math.pi * 440 * i / rate)))
+            for i in range(int(seconds * rate))
+        ))
+    return buffer.getvalue()
+
+
+class FakeGoogleHandler(BaseHTTPRequestHandler):
+    """Long audio synthesis REST endpoint plus the Cloud Storage it writes to."""
+
+    objects = {}
+    operations = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        assert self.path == "/v1/projects/test-project/locations/global:synthesizeLongAudio"
+        assert body["audioConfig"]["audioEncoding"] == "LINEAR16"
+        self.operations.append(body)
+        bucket, key = re.match(r"gs://([^/]+)/(.+)", body["outputGcsUri"]).groups()
+        self.objects[f"/{bucket}/{key}"] = make_wav()
+        self.reply({"name": f"projects/test-project/locations/global/operations/{len(self.operations)}", "done": False})
+
+    def do_GET(self):
+        if self.path.startswith("/v1/"):
+            self.reply({
+                "name": self.path[len("/v1/"):],
+                "done": True,
+                "response": {"@type": "type.googleapis.com/google.cloud.texttospeech.v1.SynthesizeLongAudioResponse"},
+            })
+            return
+        assert self.headers["Authorization"] == "Bearer test-token"
+        data = self.objects[self.path]
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/wav")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_DELETE(self):
+        assert self.headers["Authorization"] == "Bearer test-token"
+        self.send_response(204 if self.objects.pop(self.path, None) else 404)
+        self.end_headers()
+
+    def reply(self, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def google_server():
+    FakeGoogleHandler.objects = {}
+    FakeGoogleHandler.operations = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGoogleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_google_long_audio_is_transcoded_from_storage(google_server, tmp_path):
+    from google.auth.credentials import AnonymousCredentials
+    from google.cloud import texttospeech
+
+    provider = GoogleTTS()
+    provider._long_audio_client = lambda: texttospeech.TextToSpeechLongAudioSynthesizeClient(
+        transport="rest",
+        credentials=AnonymousCredentials(),
+        client_options={"api_endpoint": google_server},
+    )
+    provider.gcs_auth_headers = lambda: {"Authorization": "Bearer test-token"}
+    text = "A sentence of the book. " * 60000
+
+    with patch.multiple(
+        "worker.pdf_pipeline.settings",
+        GOOGLE_CLOUD_PROJECT="test-project",
+        GOOGLE_LONG_AUDIO_GCS_BUCKET="gcs-bucket",
+        LONG_FORM_POLL_SECONDS=0,
+    ), patch("worker.long_form.GCS_BASE_URL", google_server):
+        usage = {}
+        path = PDFToAudioPipeline()._synthesize_long_form(
+            provider, "google", text, "us_female_std", 1.0,
+            str(tmp_path), "audio/1/2.mp3", None, usage,
+        )
+
+    # 1.44 MB of text is two long audio requests
+    assert usage["long_form_tasks"] == len(FakeGoogleHandler.operations) == 2
+    with open(path, "rb") as f:
+        header = f.read(3)
+    assert header == b"ID3" or header[:2] in (b"\xff\xfb", b"\xff\xf3")
+    # The WAV intermediates are deleted from Cloud Storage
+    assert FakeGoogleHandler.objects == {}
+
+
+def test_google_cleanup_failure_keeps_the_synthesis_error(tmp_path):
+    def synthesis_fails(*args):
+        raise RuntimeError("long audio operation failed")
+
+    def refresh_fails():
+        raise RuntimeError("token refresh failed")
+
+    provider = GoogleTTS()
+    provider.synthesize_long_form = synthesis_fails
+    provider.gcs_auth_headers = refresh_fails
+
+    with patch.multiple(
+        "worker.pdf_pipeline.settings", GOOGLE_LONG_AUDIO_GCS_BUCKET="gcs-bucket"
+    ), pytest.raises(RuntimeError, match="long audio operation failed"):
+        PDFToAudioPipeline()._synthesize_long_form(
+            provider, "google", "Some text.", "us_female_std", 1.0,
+            str(tmp_path), None, None, {},
+        )
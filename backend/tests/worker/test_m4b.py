@@ -0,0 +1,107 @@
+import shutil
+import subprocess
+
+import fitz
+import pytest
+
+from worker.assembly import StreamingAssembler
+from worker.extraction import table_of_contents
+from worker.m4b import Chapter, chapters_from_toc, ffmetadata, mux_m4b
+from worker.pdf_pipeline import PDFToAudioPipeline
+
+
+def test_chapters_start_at_the_chunk_reaching_their_page():
+    # Chunk i ends on page chunk_pages[i]
+    chunk_pages = [0, 1, 1, 3, 4, 6]
+    durations = [1.5, 2.0, 2.5, 3.0, 1.0, 4.0]
+    toc = [("Preface", 1), ("One", 2), ("Also two", 3), ("Two", 4), ("Past the end", 9)]
+
+    chapters = chapters_from_toc(toc, chunk_pages, durations)
+
+    # "One" (page 2) and "Also two" (page 3) both start at chunk 3
+    assert chapters == [
+        Chapter("Introduction", 0.0, 1.5),
+        Chapter("Preface", 1.5, 6.0),
+        Chapter("One", 6.0, 9.0),
+        Chapter("Two", 9.0, 14.0),
+    ]
+    assert chapters_from_toc([], chunk_pages, durations) == []
+
+
+def test_ffmetadata_escapes_titles():
+    text = ffmetadata([Chapter("A = B; #1", 0.0, 1.2346)], title="Book")
+
+    assert "title=A \\= B\\; \\#1" in text
+    assert "START=0\nEND=1235" in text
+
+
+def test_table_of_contents_reads_top_level_outline(tmp_path):
+    path = tmp_path / "book.pdf"
+    with fitz.open() as doc:
+        for i in range(4):
+            doc.new_page().insert_text((72, 72), f"Page {i}")
+        doc.set_toc([[1, "First", 1], [2, "Section", 2], [1, "Second", 3]])
+        doc.save(path)
+
+    assert table_of_contents(str(path)) == [("First", 0), ("Second", 2)]
+    assert table_of_contents(str(path), max_level=2)[1] == ("Section", 1)
+    assert table_of_contents(str(tmp_path / "missing.pdf")) == []
+
+
+def test_page_tagged_chunks_match_plain_chunking():
+    pipeline = PDFToAudioPipeline()
+    pages = [f"Page {i} text. " * 20 for i in range(5)] + [""] + ["Last page."]
+    cleaned = " ".join(p.strip() for p in pages if p.strip())
+
+    tagged = pipeline._page_tagged_chunks(pages)
+
+    assert [chunk for chunk, _ in tagged] == pipeline._chunk_text_for_tts(cleaned)
+    assert tagged[-1][1] == 6
+
+
+def test_chunks_are_cut_where_chapters_start():
+    pipeline = PDFToAudioPipeline()
+    pages = ["a. " * 1000, "b. " * 600, "", "c. " * 700, "d. " * 10]
+
+    tagged = pipeline._page_tagged_chunks(pages, chapter_pages=[1, 2])
+
+    # Page 2 is empty, so its chapter starts with page 3's text
+    assert [(chunk[0], page) for chunk, page in tagged] == [("a", 0), ("b", 1), ("c", 4)]
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_m4b_chapter_offsets_match_chunk_boundaries(tmp_path):
+    seconds = [1.0, 2.0, 1.5]
+    chunks = []
+    for i, length in enumerate(seconds):
+        path = tmp_path / f"chunk_{i}.mp3"
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-f", "lavfi",
+             "-i", f"sine=frequency={300 + 100 * i}:duration={length}",
+             "-c:a", "libmp3lame", "-b:a", "64k", str(path)],
+            check=True,
+        )
+        chunks.append(str(path))
+    assembler = StreamingAssembler(str(tmp_path / "final_output.mp3"), concat=None)
+    for i, path in enumerate(chunks):
+        assembler.add(i, path)
+    mp3 = assembler.finish(len(chunks))
+
+    chapters = chapters_from_toc(
+        [("One", 0), ("Two", 1), ("Three", 2)], [0, 1, 2], assembler.chunk_durations
+    )
+    output = mux_m4b(mp3, str(tmp_path / "book.m4b"), chapters)
+
+    metadata = subprocess.run(
+        ["ffmpeg", "-loglevel", "error", "-i", output, "-f", "ffmetadata", "-"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    starts = [int(line[6:]) for line in metadata.splitlines() if line.startswith("START=")]
+    titles = [line[6:] for line in metadata.splitlines() if line.startswith("title=")]
+    boundaries = [0.0]
+    for duration in assembler.chunk_durations[:-1]:
+        boundaries.append(boundaries[-1] + duration)
+    # Frame-header durations, so each boundary is exact to the millisecond
+    assert starts == [round(b * 1000) for b in boundaries]
+    assert abs(boundaries[1] - 1.0) < 0.06 and abs(boundaries[2] - 3.0) < 0.1
+    assert titles == ["One", "Two", "Three"]
@@ -0,0 +1,22 @@
+from worker.normalization import normalize_pages, normalize_text
+
+
+def test_collapses_all_whitespace_runs():
+    assert normalize_text("  One\n\n two\t\tthree\r\nfour  ") == "One two three four"
+
+
+def test_repairs_mojibake_from_latin1_and_cp1252():
+    assert normalize_text("Itâ\u0080\u0099s") == "It's"
+    assert normalize_text("Itâ€™s") == "It's"
+    assert normalize_text("â€œQuotedâ\u0080\u009d") == '"Quoted"'
+    assert normalize_text("Waitâ€¦") == "Wait..."
+    assert normalize_text("pages 1â\u0080\u00935") == "pages 1-5"
+
+
+def test_expands_ligatures():
+    assert normalize_text("ﬁnal ﬂow eﬃcient") == "final flow efficient"
+
+
+def test_normalize_pages_drops_blank_pages():
+    pages = ["First  page.\n", " \n\n", "Second\tpage.\n"]
+    assert list(normalize_pages(pages)) == ["First page.", "Second page."]
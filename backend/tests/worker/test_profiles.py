@@ -0,0 +1,72 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from worker.cache import TieredCache
+from worker.pdf_pipeline import CachedTTSProvider, ElevenLabsTTS, GoogleTTS
+from worker.profiles import OutputProfile, encode_audio, load_profile
+
+PROFILES = {
+    "standard": {"codec": "mp3"},
+    "opus_32k": {"codec": "opus", "bitrate_kbps": 32},
+    "flac": {"codec": "flac", "bitrate_kbps": 500},
+    "aac": {"codec": "aac"},
+}
+
+
+def test_load_profile_validates_the_spec():
+    assert load_profile("standard", PROFILES).passthrough
+    opus = load_profile("opus_32k", PROFILES)
+    assert (opus.codec, opus.bitrate_kbps, opus.channels) == ("opus", 32, 1)
+    assert (opus.extension, opus.content_type) == ("ogg", "audio/ogg")
+
+    for name in ("missing", "flac", "aac"):
+        with pytest.raises(ValueError):
+            load_profile(name, PROFILES)
+
+
+def test_mp3_bitrates_are_requested_from_the_provider():
+    provider = ElevenLabsTTS()
+
+    native = provider.with_mp3_bitrate(64)
+
+    assert native is not provider and native.audio_format == "mp3_44100_64"
+    assert provider.audio_format is None
+    assert provider.with_mp3_bitrate(128) is provider
+    assert provider.with_mp3_bitrate(48) is None
+    assert GoogleTTS.MP3_FORMATS == {32: None}
+
+
+def test_cache_keys_differ_by_format_only_when_set():
+    cache = TieredCache()
+    provider = ElevenLabsTTS()
+    default = CachedTTSProvider(provider, cache)
+    native = CachedTTSProvider(provider.with_mp3_bitrate(64), cache, "mp3_44100_64")
+
+    key = default.cache_key("Some text.", "Rachel", 1.0)
+
+    assert native.cache_key("Some text.", "Rachel", 1.0) != key
+    assert CachedTTSProvider(provider, cache, None).cache_key("Some text.", "Rachel", 1.0) == key
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+@pytest.mark.parametrize("codec", ["opus", "aac"])
+def test_encode_shrinks_the_provider_mp3(tmp_path, codec):
+    source = tmp_path / "final_output.mp3"
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "lavfi", "-i", "sine=duration=5",
+         "-ac", "2", "-c:a", "libmp3lame", "-b:a", "128k", str(source)],
+        check=True,
+    )
+    profile = OutputProfile("compact", codec, 32, 1)
+
+    output = encode_audio(str(source), str(tmp_path / f"out.{profile.extension}"), profile)
+
+    assert os.path.getsize(output) < os.path.getsize(source) / 2
+    # ffmpeg -i without an output prints the stream info, then exits non-zero
+    info = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-i", output], capture_output=True, text=True
+    ).stderr
+    assert f"Audio: {codec}" in info and "mono" in info
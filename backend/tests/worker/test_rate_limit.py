@@ -0,0 +1,64 @@
+import pytest
+
+from worker.rate_limit import RateLimiter, credential_id
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def make_limiter(limits, **kwargs):
+    return RateLimiter(fakeredis.FakeRedis(), limits, **kwargs)
+
+
+def test_requests_within_burst_do_not_wait():
+    limiter = make_limiter({"openai": {"requests_per_sec": 5}})
+
+    assert [limiter.acquire("openai", "key") for _ in range(5)] == [0.0] * 5
+    assert limiter.stats()["openai"]["throttled"] == 0
+
+
+def test_exhausted_bucket_waits_and_records_metrics(monkeypatch):
+    limiter = make_limiter({"google": {"requests_per_sec": 1}})
+    sleeps = []
+    monkeypatch.setattr("worker.rate_limit.time.sleep", sleeps.append)
+    # Nothing refills while the fake sleep returns at once, so let the
+    # second attempt through by hand
+    calls = iter(["0", "0.8", "0"])
+    monkeypatch.setattr(limiter, "_script", lambda keys, args: next(calls))
+
+    assert limiter.acquire("google", "key") == 0.0
+    waited = limiter.acquire("google", "key")
+
+    assert len(sleeps) == 1 and 0.8 <= sleeps[0] <= 0.88
+    assert waited == sleeps[0]
+    stats = limiter.stats()["google"]
+    assert stats["calls"] == 2 and stats["throttled"] == 1
+    assert limiter.redis.hget("ratelimit:metrics:google", "throttled") == b"1"
+
+
+def test_buckets_are_shared_per_credential_and_debit_all_or_nothing():
+    client = fakeredis.FakeRedis()
+    limits = {"azure": {"requests_per_sec": 100, "chars_per_min": 600}}
+    worker_a = RateLimiter(client, limits)
+    worker_b = RateLimiter(client, limits)
+    keys = ["ratelimit:azure:k:requests", "ratelimit:azure:k:chars"]
+    args = [100, 100, 1, 10, 600, 400]
+
+    assert float(worker_a._script(keys=keys, args=args)) == 0
+    # The chars bucket is short, so neither bucket is debited
+    assert float(worker_b._script(keys=keys, args=args)) > 15
+    assert float(client.hget(keys[0], "tokens")) >= 99
+
+
+def test_fails_open_when_redis_is_down():
+    limiter = make_limiter({"openai": {"requests_per_sec": 1}})
+
+    def unavailable(keys, args):
+        raise ConnectionError("Connection refused")
+
+    limiter._script = unavailable
+    assert limiter.acquire("openai", "key") == 0.0
+
+
+def test_credential_id_never_contains_the_secret():
+    assert "sk-secret" not in credential_id("sk-secret")
+    assert credential_id(None) == "default"
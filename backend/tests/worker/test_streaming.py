@@ -0,0 +1,138 @@
+import random
+import time
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from worker.pdf_pipeline import PDFToAudioPipeline
+from worker.streaming import iterate_in_background
+
+
+def test_iterate_in_background_preserves_order():
+    assert list(iterate_in_background(lambda: iter(range(50)), maxsize=2)) == list(range(50))
+
+
+def test_iterate_in_background_reraises_producer_errors():
+    def produce():
+        yield 1
+        raise ValueError("boom")
+
+    stream = iterate_in_background(produce)
+    assert next(stream) == 1
+    with pytest.raises(ValueError, match="boom"):
+        next(stream)
+
+
+def test_iterate_in_background_stops_producer_when_consumer_quits():
+    closed = threading.Event()
+
+    def produce():
+        try:
+            for i in range(10_000):
+                yield i
+        finally:
+            closed.set()
+
+    stream = iterate_in_background(produce, maxsize=1)
+    assert next(stream) == 0
+    stream.close()
+
+    assert closed.wait(timeout=5)
+
+
+def test_incremental_chunker_matches_whole_text_chunker():
+    pipeline = PDFToAudioPipeline()
+    rng = random.Random(7)
+    words = ["alpha", "beta.", "gamma!", "delta?", "epsilon", "zeta,", "x" * 120]
+    pieces = [
+        " ".join(rng.choice(words) for _ in range(rng.randint(1, 400)))
+        for _ in range(40)
+    ]
+
+    for max_chars in (50, 300, 4500):
+        expected = pipeline._chunk_text_for_tts(" ".join(pieces), max_chars)
+        streamed = pipeline._iter_chunks_for_tts(((p, i) for i, p in enumerate(pieces)), max_chars)
+        assert [chunk for chunk, _ in streamed] == expected
+
+
+@patch("worker.pdf_pipeline.PDFToAudioPipeline._assemble_audio_chapters", return_value="final.mp3")
+def test_streaming_pipeline_starts_tts_before_extraction_finishes(mock_assemble, tmp_path):
+    pipeline = PDFToAudioPipeline()
+    pipeline.extraction_cache = None
+    pipeline.audio_cache = None
+    tts_started = threading.Event()
+    tts_ran_before_last_page = []
+
+    def fake_pages(pdf_path):
+        for i in range(3):
+            yield f"Page {i} sentence one. " * 250
+        tts_ran_before_last_page.append(tts_started.wait(timeout=5))
+        yield "The final page."
+
+    def fake_tts(text, voice_id, speed):
+        tts_started.set()
+        return b"audio"
+
+    provider = MagicMock()
+    provider.text_to_audio.side_effect = fake_tts
+    pdf_path = tmp_path / "book.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    with patch.object(pipeline, "_iter_pages", side_effect=fake_pages), patch.object(
+        pipeline.tts_manager, "get_provider", return_value=provider
+    ), patch("worker.pdf_pipeline.settings.REPEATED_LINE_LOOKAHEAD_PAGES", 0):
+        path, cost, usage = pipeline.process_pdf(str(pdf_path), work_dir=str(tmp_path))
+
+    assert path == "final.mp3"
+    assert tts_ran_before_last_page == [True]
+    assert usage["chars"] > 0
+    assert usage["chars_removed"] == 0
+    chunk_files = mock_assemble.call_args[0][0]
+    assert len(chunk_files) == provider.text_to_audio.call_count
+
+
+@patch("worker.pdf_pipeline.PDFToAudioPipeline._assemble_audio_chapters", return_value="final.mp3")
+def test_progress_follows_completed_chunks_not_the_last_to_finish(mock_assemble, tmp_path):
+    pipeline = PDFToAudioPipeline()
+    pipeline.extraction_cache = None
+    pipeline.audio_cache = None
+    pipeline.rate_limiter = None
+    chunks = [f"Chunk {i}." for i in range(8)]
+    lock = threading.Lock()
+    finished = []
+    reported = []
+
+    def fake_tts(text, voice_id, speed):
+        # Later chunks return first
+        time.sleep(0.02 * (len(chunks) - chunks.index(text)))
+        with lock:
+            finished.append(text)
+        return b"audio"
+
+    def on_progress(progress):
+        with lock:
+            reported.append((progress, len(finished)))
+
+    provider = MagicMock()
+    provider.text_to_audio.side_effect = fake_tts
+    pdf_path = tmp_path / "book.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    with patch.object(
+        pipeline, "_extract_and_clean", return_value=([" ".join(chunks)], " ".join(chunks), 0)
+    ), patch.object(pipeline, "_chunk_text_for_tts", return_value=chunks), patch.object(
+        pipeline.tts_manager, "get_provider", return_value=provider
+    ), patch.multiple(
+        "worker.pdf_pipeline.settings",
+        PIPELINE_STREAMING=False,
+        ADAPTIVE_CONCURRENCY_ENABLED=False,
+        TTS_CONCURRENCY={},
+        TTS_DEFAULT_CONCURRENCY=len(chunks),
+    ):
+        pipeline.process_pdf(str(pdf_path), work_dir=str(tmp_path), progress_callback=on_progress)
+
+    synthesis = [(p, done) for p, done in reported if 40 < p < 95]
+    assert synthesis
+    assert all(p <= 40 + int(55 * done / len(chunks)) for p, done in synthesis)
+    assert [p for p, _ in synthesis] == sorted({p for p, _ in synthesis})
@@ -0,0 +1,107 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from worker.chunking import chunk_text
+from worker.pdf_pipeline import PDFToAudioPipeline
+from worker.summarization import MapReduceSummarizer
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible chat completions endpoint."""
+
+    requests = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append(body)
+        user_content = body["messages"][1]["content"]
+        # "Summarize" by keeping the section markers, so the test can follow
+        # every section through the map and reduce levels
+        markers = dict.fromkeys(re.findall(r"Section\d+", user_content))
+        reply = " ".join(f"[{marker}]" for marker in markers)
+        payload = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": reply},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_llm_server():
+    FakeOpenAIHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOpenAIHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+
+
+def test_summary_covers_whole_document_via_map_reduce(fake_llm_server):
+    sections = [f"Section{i} " + "Some sentence here. " * 50 for i in range(12)]
+    text = " ".join(sections)
+    pipeline = PDFToAudioPipeline()
+    pipeline.rate_limiter = None
+    pipeline.llm_cache = None
+
+    with patch.multiple(
+        "worker.pdf_pipeline.settings",
+        LLM_BASE_URL=fake_llm_server,
+        OPENROUTER_API_KEY=None,
+        OPENAI_API_KEY="test-key",
+        SUMMARY_SECTION_CHARS=2000,
+    ):
+        summary, tokens = pipeline._generate_summary(text)
+
+    # Every section, including the last, reaches the final summary
+    assert all(f"[Section{i}]" in summary for i in range(12))
+    assert tokens == 15 * len(FakeOpenAIHandler.requests)
+    # One call per section, then the final summary over the partials
+    assert len(FakeOpenAIHandler.requests) == len(chunk_text(text, 2000)) + 1
+
+
+def test_short_text_is_a_single_call():
+    calls = []
+
+    def call_llm(system_prompt, user_content, max_tokens):
+        calls.append(user_content)
+        return "summary", 7
+
+    result = MapReduceSummarizer(call_llm, section_chars=1000).run("Summarize.", "Short text.", 100)
+
+    assert result == ("summary", 7)
+    assert calls == ["Short text."]
+
+
+def test_reduce_levels_shrink_until_one_request_fits():
+    calls = []
+
+    def call_llm(system_prompt, user_content, max_tokens):
+        calls.append(system_prompt)
+        return "x" * 300, 1
+
+    summarizer = MapReduceSummarizer(call_llm, section_chars=1000, max_workers=4)
+    result, tokens = summarizer.run("Final task.", "Sentence number one. " * 1000, 100)
+
+    assert calls[-1] == "Final task."
+    assert tokens == len(calls)
+    assert calls.count("Final task.") == 1
@@ -0,0 +1,69 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from worker.synthesis import ChunkSynthesizer
+
+
+class SlowProvider:
+    """Fake provider whose latency decreases with chunk number."""
+
+    def __init__(self, fail_once=()):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_once = set(fail_once)
+
+    def text_to_audio(self, text, voice_id, speed):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            should_fail = text in self.fail_once
+            self.fail_once.discard(text)
+        try:
+            time.sleep(0.05 / (int(text) + 1))
+            if should_fail:
+                raise RuntimeError("429 Too Many Requests")
+            return f"audio-{text}".encode()
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def test_chunks_are_written_in_order_with_bounded_concurrency(tmp_path):
+    provider = SlowProvider()
+    synthesizer = ChunkSynthesizer(provider, "default", 1.0, str(tmp_path), concurrency=3)
+    progress = []
+
+    paths = synthesizer.synthesize(
+        (str(i) for i in range(12)), on_progress=lambda done, index: progress.append(done)
+    )
+
+    assert [p.rsplit("/", 1)[1] for p in paths] == [f"chunk_{i:04d}.mp3" for i in range(12)]
+    assert [open(p, "rb").read() for p in paths] == [f"audio-{i}".encode() for i in range(12)]
+    assert 1 < provider.max_in_flight <= 3
+    assert progress == list(range(1, 13))
+
+
+def test_failed_chunk_is_retried_without_blocking_others(tmp_path):
+    provider = SlowProvider(fail_once={"2"})
+    synthesizer = ChunkSynthesizer(
+        provider, "default", 1.0, str(tmp_path), concurrency=4, retry_base_delay=0
+    )
+
+    paths = synthesizer.synthesize(str(i) for i in range(6))
+
+    assert open(paths[2], "rb").read() == b"audio-2"
+
+
+def test_chunk_failure_after_retries_raises(tmp_path):
+    provider = MagicMock()
+    provider.text_to_audio.side_effect = RuntimeError("provider down")
+    synthesizer = ChunkSynthesizer(
+        provider, "default", 1.0, str(tmp_path), max_retries=1, retry_base_delay=0
+    )
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        synthesizer.synthesize(["one", "two"])
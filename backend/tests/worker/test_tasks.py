@@ -144,3 +144,47 @@ def test_cleanup_old_files(MockSessionLocal, MockStorageService):
     mock_storage_service.delete_file.assert_any_call("old.mp3")
     mock_db.delete.assert_called_with(old_job)
     mock_db.commit.assert_called_once()
+
+
+@pytest.mark.parametrize("retries, raised, cleared", [(0, "retry", False), (3, "provider outage", True)])
+@patch("worker.tasks.JobCheckpoint")
+@patch("worker.tasks.StorageService")
+@patch("worker.tasks.JobService")
+@patch("worker.tasks.SessionLocal")
+@patch("worker.tasks.pipeline")
+def test_checkpoint_is_cleared_only_when_retries_run_out(
+    mock_pipeline, MockSessionLocal, MockJobService, MockStorageService, MockCheckpoint,
+    retries, raised, cleared,
+):
+    mock_db = MagicMock()
+    MockSessionLocal.return_value = mock_db
+    job = Job(
+        id=7,
+        user_id=1,
+        pdf_s3_key="test.pdf",
+        voice_provider=VoiceProvider.openai,
+        voice_type="default",
+        reading_speed=1.0,
+        include_summary=False,
+        conversion_mode=ConversionMode.full,
+    )
+    mock_db.query.return_value.filter.return_value.first.return_value = job
+    MockStorageService.return_value.download_file.return_value = b"%PDF-1.4"
+    mock_pipeline.process_pdf.side_effect = Exception("provider outage")
+
+    process_pdf_task.push_request(retries=retries)
+    try:
+        with patch.multiple(
+            "worker.tasks.settings",
+            JOB_CHECKPOINTS_ENABLED=True,
+            S3_BUCKET_NAME="app-bucket",
+            STREAMING_UPLOAD_ENABLED=False,
+            HLS_ENABLED=False,
+        ), patch.object(
+            process_pdf_task, "retry", side_effect=RuntimeError("retry")
+        ), pytest.raises(Exception, match=raised):
+            process_pdf_task(7)
+    finally:
+        process_pdf_task.pop_request()
+
+    assert MockCheckpoint.return_value.clear.called is cleared
@@ -0,0 +1,119 @@
+from unittest.mock import MagicMock, patch
+
+from worker.cache import LocalDiskCache, TieredCache
+from worker.concurrency import AIMDController
+from worker.pdf_pipeline import (
+    AdaptiveTTSProvider,
+    CachedTTSProvider,
+    PDFToAudioPipeline,
+    RateLimitedTTSProvider,
+    TTSProvider,
+)
+
+
+class FakeTTS(TTSProvider):
+    def __init__(self):
+        self.calls = []
+
+    def resolve_voice(self, voice_id):
+        return {"narrator": "alloy"}.get(voice_id, "alloy")
+
+    def text_to_audio(self, text, voice_id, speed):
+        self.calls.append(text)
+        return f"audio:{text}".encode()
+
+
+def make_cached(tmp_path):
+    provider = FakeTTS()
+    cache = TieredCache(LocalDiskCache(str(tmp_path), max_bytes=1024 * 1024))
+    return provider, CachedTTSProvider(provider, cache)
+
+
+def test_repeated_chunks_are_synthesized_once(tmp_path):
+    provider, cached = make_cached(tmp_path)
+
+    first = cached.text_to_audio("Chapter one.", "narrator", 1.0)
+    second = cached.text_to_audio("Chapter  one.\n", "narrator", 1.0)
+
+    assert first == second
+    assert provider.calls == ["Chapter one."]
+    assert cached.stats() == {
+        "audio_cache_hits": 1,
+        "audio_cache_misses": 1,
+        "audio_cache_chars": len("Chapter  one.\n"),
+    }
+
+
+def test_cache_key_depends_on_resolved_voice_and_speed(tmp_path):
+    _, cached = make_cached(tmp_path)
+    key = cached.cache_key("Hello.", "narrator", 1.0)
+
+    # Unknown ids resolve to the same provider voice, so they share audio
+    assert cached.cache_key("Hello.", "someone-else", 1.0) == key
+    assert cached.cache_key("Hello.", "narrator", 1.25) != key
+    assert cached.cache_key("Hello!", "narrator", 1.0) != key
+
+
+class OtherFakeTTS(FakeTTS):
+    pass
+
+
+def test_cache_key_names_the_engine_under_the_wrappers(tmp_path):
+    provider, cached = make_cached(tmp_path)
+    key = cached.cache_key("Hello.", "narrator", 1.0)
+
+    wrapped = AdaptiveTTSProvider(
+        RateLimitedTTSProvider(provider, MagicMock(), "openai", "key-id"),
+        AIMDController("test", initial=2),
+    )
+    assert wrapped.provider_name == "FakeTTS"
+    assert CachedTTSProvider(wrapped, cached.cache).cache_key("Hello.", "narrator", 1.0) == key
+
+    # Same resolved voice, different engine: no shared audio
+    other = AdaptiveTTSProvider(OtherFakeTTS(), AIMDController("test", initial=2))
+    assert CachedTTSProvider(other, cached.cache).cache_key("Hello.", "narrator", 1.0) != key
+
+
+def test_cache_failures_fall_through_to_provider():
+    provider = FakeTTS()
+    broken = MagicMock()
+    broken.get.side_effect = Exception("S3 download failed: timeout")
+    broken.set.side_effect = Exception("S3 upload failed: timeout")
+    cached = CachedTTSProvider(provider, TieredCache(broken))
+
+    assert cached.text_to_audio("Hi.", "narrator", 1.0) == b"audio:Hi."
+    assert cached.stats()["audio_cache_misses"] == 1
+
+
+@patch("worker.pdf_pipeline.PDFToAudioPipeline._assemble_audio_chapters", return_value="final.mp3")
+def test_process_pdf_caches_audio_under_the_engine_key(mock_assemble, tmp_path):
+    provider = FakeTTS()
+    cache = TieredCache(LocalDiskCache(str(tmp_path / "cache"), max_bytes=1024 * 1024))
+    pipeline = PDFToAudioPipeline()
+    pipeline.extraction_cache = None
+    pipeline.audio_cache = cache
+    pipeline.rate_limiter = MagicMock()
+    pipeline.rate_limiter.acquire.return_value = 0
+    chunks = ["Chunk one.", "Chunk two."]
+    pdf_path = tmp_path / "book.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    with patch.object(
+        pipeline, "_extract_and_clean", return_value=([" ".join(chunks)], " ".join(chunks), 0)
+    ), patch.object(pipeline, "_chunk_text_for_tts", return_value=chunks), patch.object(
+        pipeline.tts_manager, "get_provider", return_value=provider
+    ), patch.multiple(
+        "worker.pdf_pipeline.settings",
+        PIPELINE_STREAMING=False,
+        ADAPTIVE_CONCURRENCY_ENABLED=True,
+    ):
+        pipeline.process_pdf(
+            str(pdf_path), voice_type="narrator", work_dir=str(tmp_path)
+        )
+
+    # process_pdf puts the rate limiter and AIMD wrappers under the cache;
+    # the entries must be the ones the bare engine would have made
+    assert provider.calls == chunks
+    bare = CachedTTSProvider(provider, cache)
+    for chunk in chunks:
+        assert cache.get(bare.cache_key(chunk, "narrator", 1.0)) == f"audio:{chunk}".encode()
@@ -0,0 +1,60 @@
+import os
+
+import boto3
+import pytest
+
+from worker.long_form import MIN_PART_BYTES
+from worker.upload import StreamingUpload
+
+moto = pytest.importorskip("moto")
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="app-bucket")
+        yield client
+
+
+def test_parts_are_uploaded_while_writing(s3):
+    data = os.urandom(2 * MIN_PART_BYTES + 1234)
+    upload = StreamingUpload(s3, "app-bucket", "audio/1/1.mp3", part_size=MIN_PART_BYTES)
+
+    # Written in chunk-sized pieces, as the assembler does
+    for start in range(0, len(data), 300_000):
+        upload.write(data[start:start + 300_000])
+    for part in upload._parts:
+        part.result()
+    listed = s3.list_parts(Bucket="app-bucket", Key="audio/1/1.mp3", UploadId=upload.upload_id)
+    # Both full parts are up before the upload is completed
+    assert [p["Size"] for p in listed["Parts"]] == [MIN_PART_BYTES, MIN_PART_BYTES]
+
+    upload.complete()
+
+    obj = s3.get_object(Bucket="app-bucket", Key="audio/1/1.mp3")
+    assert obj["ContentType"] == "audio/mpeg"
+    assert obj["Body"].read() == data
+    assert upload.bytes_written == len(data)
+
+
+def test_small_output_is_a_single_part(s3):
+    upload = StreamingUpload(s3, "app-bucket", "audio/1/2.mp3")
+    upload.write(b"short audio")
+    upload.complete()
+
+    assert s3.get_object(Bucket="app-bucket", Key="audio/1/2.mp3")["Body"].read() == b"short audio"
+
+
+def test_abort_leaves_nothing_behind(s3):
+    upload = StreamingUpload(s3, "app-bucket", "audio/1/3.mp3", part_size=MIN_PART_BYTES)
+    upload.write(os.urandom(MIN_PART_BYTES + 10))
+
+    upload.abort()
+    upload.abort()
+
+    assert "Uploads" not in s3.list_multipart_uploads(Bucket="app-bucket")
+    assert "Contents" not in s3.list_objects_v2(Bucket="app-bucket")
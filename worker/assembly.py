@@ -0,0 +1,99 @@
+import os
+from typing import Callable, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+from .mp3 import audio_spans, duration_seconds
+
+
+class StreamingAssembler:
+    """
+    Builds the final MP3 while chunks are still being synthesized.
+
+    ``add(index, path)`` is called as each chunk file lands, in any order;
+    every chunk whose predecessors are all in is appended to the output
+    straight away, as raw MPEG audio frames (ID3 tags and Xing/Info headers
+    dropped), and its file is deleted. The output is complete moments after
+    the last chunk lands, and disk use stays near one copy of the audio.
+
+    A chunk that doesn't parse as MP3 frames switches the assembler to the
+    ``concat`` fallback (ffmpeg): the output so far plus the remaining
+    chunks are handed to it by ``finish``.
+
+    Bytes appended to the output are also passed to each of ``sinks`` (e.g.
+    a streaming upload, a live playlist), one call per chunk, so the output
+    can leave the machine as it grows. Nothing more is sent to them once the
+    fallback kicks in.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        concat: Callable[[List[str]], str],
+        delete_consumed: bool = True,
+        sinks: Sequence[Callable[[bytes], None]] = (),
+    ):
+        self.output_path = output_path
+        self.concat = concat
+        self.delete_consumed = delete_consumed
+        self.sinks = sinks
+        self.duration = 0.0
+        self.chunk_durations: List[float] = []
+        self.frames = 0
+        self.appended = 0
+        self._ready: Dict[int, str] = {}
+        self._next = 0
+        self._fallback: Optional[List[str]] = None
+        self._out = open(output_path, "wb")
+
+    def add(self, index: int, path: str) -> None:
+        self._ready[index] = path
+        while self._next in self._ready:
+            self._append(self._ready.pop(self._next))
+            self._next += 1
+
+    def _append(self, path: str) -> None:
+        if self._fallback is not None:
+            self._fallback.append(path)
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+        frames = audio_spans(data)
+        if frames is None:
+            logger.warning(f"⚠️ {os.path.basename(path)} is not a plain MP3 stream; assembling with ffmpeg")
+            self._fallback = [path]
+            return
+        view = memoryview(data)
+        audio = b"".join(view[frame.offset:frame.offset + frame.length] for frame in frames)
+        self._out.write(audio)
+        self._out.flush()
+        for sink in self.sinks:
+            sink(audio)
+        self.frames += len(frames)
+        self.chunk_durations.append(duration_seconds(frames))
+        self.duration += self.chunk_durations[-1]
+        self.appended += 1
+        if self.delete_consumed:
+            os.remove(path)
+
+    def finish(self, count: int) -> str:
+        """Close the output once all ``count`` chunks are in; returns its path."""
+        self._out.close()
+        if count == 0:
+            raise Exception("Audio assembly failed: no chunks were synthesized")
+        if self._next != count:
+            raise Exception(f"Audio assembly incomplete: {self._next} of {count} chunks appended")
+        if self._fallback is None:
+            return self.output_path
+        inputs = self._fallback
+        if self.appended:
+            head = f"{self.output_path}.head.mp3"
+            os.replace(self.output_path, head)
+            inputs = [head] + inputs
+        else:
+            os.remove(self.output_path)
+        return self.concat(inputs)
+
+    def close(self) -> None:
+        """Release the output file after a failure."""
+        self._out.close()
@@ -0,0 +1,95 @@
+import re
+from collections import Counter, deque
+from typing import Iterable, Iterator, List, Optional
+
+_DIGITS = re.compile(r"\d+")
+
+
+def line_key(line: str) -> str:
+    """Case- and whitespace-insensitive key with numbers masked, so
+    "Page 12" and "PAGE 13" count as the same running line."""
+    return _DIGITS.sub("#", " ".join(line.lower().split()))
+
+
+class RepeatedLineFilter:
+    """
+    Strips running headers, footers and page numbers before TTS.
+
+    The first and last ``edge_lines`` non-blank lines of every page are
+    indexed by ``line_key``, separately for the top and bottom of the page.
+    An edge line is dropped when its key recurs on at least ``min_repeats``
+    pages and on at least ``min_fraction`` of the pages indexed so far; body
+    text and one-off headings (chapter titles) stay. Lines longer than
+    ``max_line_chars`` are body text, never headers or footers.
+
+    ``filter`` can run with a ``lookahead`` so pages are released while
+    extraction continues: each page is judged once the next ``lookahead``
+    pages are indexed too. Without one, every page is judged against the
+    whole document.
+    """
+
+    def __init__(
+        self,
+        edge_lines: int = 2,
+        min_repeats: int = 3,
+        min_fraction: float = 0.2,
+        max_line_chars: int = 120,
+    ):
+        self.edge_lines = edge_lines
+        self.max_line_chars = max_line_chars
+        self.min_repeats = min_repeats
+        self.min_fraction = min_fraction
+        self.top = Counter()
+        self.bottom = Counter()
+        self.pages_indexed = 0
+        self.chars_removed = 0
+        self.lines_removed = 0
+
+    def filter(self, pages: Iterable[str], lookahead: Optional[int] = None) -> Iterator[str]:
+        """Yield each page with its recurring edge lines removed, in order."""
+        pending: deque = deque()
+        for page in pages:
+            lines = page.splitlines()
+            self._index(lines)
+            pending.append(lines)
+            if lookahead is not None and len(pending) > lookahead:
+                yield self._strip(pending.popleft())
+        while pending:
+            yield self._strip(pending.popleft())
+
+    def _edges(self, lines: List[str]) -> tuple[List[int], List[int]]:
+        content = [i for i, line in enumerate(lines) if line.strip()]
+        return content[: self.edge_lines], content[::-1][: self.edge_lines]
+
+    def _index(self, lines: List[str]) -> None:
+        head, tail = self._edges(lines)
+        self.top.update({self._key(lines[i]) for i in head} - {None})
+        self.bottom.update({self._key(lines[i]) for i in tail} - {None})
+        self.pages_indexed += 1
+
+    def _key(self, line: str) -> Optional[str]:
+        if len(line.strip()) > self.max_line_chars:
+            return None
+        return line_key(line)
+
+    def _is_repeated(self, counts: Counter, line: str) -> bool:
+        key = self._key(line)
+        if key is None:
+            return False
+        threshold = max(self.min_repeats, self.min_fraction * self.pages_indexed)
+        return counts[key] >= threshold
+
+    def _strip(self, lines: List[str]) -> str:
+        head, tail = self._edges(lines)
+        removed = set()
+        for edge, counts in ((head, self.top), (tail, self.bottom)):
+            # Only peel from the outside in; stop at the first real line
+            for i in edge:
+                if i in removed or not self._is_repeated(counts, lines[i]):
+                    break
+                removed.add(i)
+
+        for i in removed:
+            self.chars_removed += len(lines[i].strip())
+        self.lines_removed += len(removed)
+        return "\n".join(line for i, line in enumerate(lines) if i not in removed)
@@ -0,0 +1,185 @@
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Optional
+
+from loguru import logger
+
+
+def sha256_file(path: str, block_size: int = 1024 * 1024) -> str:
+    """Hex SHA-256 of a file, read in blocks so large PDFs aren't loaded whole."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class LocalDiskCache:
+    """
+    Size-bounded on-disk cache with least-recently-used eviction.
+
+    Entries are plain files named by key; reads refresh the file's mtime and
+    writes evict the stalest files once the directory exceeds ``max_bytes``.
+    Safe to share between worker processes on the same host.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key.replace("/", "_"))
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".tmp"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+class ObjectStoreCache:
+    """Cache tier in the shared S3-compatible bucket, visible to every worker."""
+
+    def __init__(self, prefix: str, storage=None):
+        if storage is None:
+            from app.services.storage import StorageService
+
+            storage = StorageService()
+        self.storage = storage
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.storage.download_file(f"{self.prefix}{key}")
+        except Exception as e:
+            if str(e).startswith("File not found"):
+                return None
+            raise
+
+    def set(self, key: str, value: bytes) -> None:
+        self.storage.upload_file_data(value, f"{self.prefix}{key}")
+
+
+class RedisCache:
+    """
+    Cache tier in the shared Redis. Entries expire after ``ttl`` seconds;
+    under memory pressure Redis's own LRU policy evicts them first.
+    """
+
+    def __init__(self, client, prefix: str, ttl: int):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(f"{self.prefix}{key}")
+
+    def set(self, key: str, value: bytes) -> None:
+        self.client.set(f"{self.prefix}{key}", value, ex=self.ttl)
+
+
+class TieredCache:
+    """
+    Checks tiers in order (fastest first) and backfills faster tiers on a hit.
+    Cache failures are logged and treated as misses; they never fail a job.
+    Counts hits and misses over the cache's lifetime.
+    """
+
+    def __init__(self, *tiers):
+        self.tiers = [tier for tier in tiers if tier is not None]
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        for i, tier in enumerate(self.tiers):
+            try:
+                value = tier.get(key)
+            except Exception as e:
+                logger.warning(f"⚠️ Cache read failed ({type(tier).__name__}): {e}")
+                continue
+            if value is not None:
+                for faster in self.tiers[:i]:
+                    self._safe_set(faster, key, value)
+                self._count(hit=True)
+                return value
+        self._count(hit=False)
+        return None
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def set(self, key: str, value: bytes) -> None:
+        for tier in self.tiers:
+            self._safe_set(tier, key, value)
+
+    def _safe_set(self, tier, key: str, value: bytes) -> None:
+        try:
+            tier.set(key, value)
+        except Exception as e:
+            logger.warning(f"⚠️ Cache write failed ({type(tier).__name__}): {e}")
+
+
+def build_tiered_cache(
+    enabled: bool, directory: str, max_mb: int, s3_prefix: str
+) -> Optional[TieredCache]:
+    """Build a local-disk + object-store cache from settings values."""
+    if not enabled:
+        return None
+
+    local = None
+    try:
+        local = LocalDiskCache(directory, max_mb * 1024 * 1024)
+    except OSError as e:
+        logger.warning(f"⚠️ Local cache directory unavailable ({directory}): {e}")
+
+    shared = None
+    from app.core.config import settings
+
+    if s3_prefix and settings.S3_BUCKET_NAME:
+        try:
+            shared = ObjectStoreCache(s3_prefix)
+        except Exception as e:
+            logger.warning(f"⚠️ Object store cache unavailable: {e}")
+
+    return TieredCache(local, shared)
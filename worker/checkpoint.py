@@ -0,0 +1,77 @@
+import hashlib
+import json
+import threading
+from typing import Optional
+
+from loguru import logger
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class JobCheckpoint:
+    """
+    Persists a job's synthesized chunk audio outside the worker's temp dir.
+
+    Each chunk is one object under ``<prefix><job_id>/<settings hash>/``,
+    named by its index and the hash of the text that was synthesized. A
+    retried or redelivered task re-plans the same chunks and reuses every one
+    whose object exists, so only the missing chunks are paid for again.
+    Chunks made with different settings (voice, speed, ...) or text live
+    under other names and are never picked up. Writing a chunk is a single
+    PUT of its own object; there is no shared manifest to serialize on.
+
+    Checkpoint I/O failures are logged and never fail the job; the worst case
+    is re-synthesizing a chunk.
+    """
+
+    def __init__(self, job_id, fingerprint: dict, prefix: str = "checkpoints/", storage=None):
+        if storage is None:
+            from app.services.storage import StorageService
+
+            storage = StorageService()
+        self.storage = storage
+        self.root = f"{prefix}{job_id}/"
+        self.fingerprint = fingerprint
+        settings_hash = _text_hash(json.dumps(fingerprint, sort_keys=True, default=str))
+        self._chunk_root = f"{self.root}{settings_hash[:16]}/"
+        self._lock = threading.Lock()
+        self.reused_chunks = 0
+        self.reused_chars = 0
+
+    def chunk_key(self, index: int, text: str) -> str:
+        return f"{self._chunk_root}chunk_{index:04d}_{_text_hash(text)[:16]}.mp3"
+
+    def get(self, index: int, text: str) -> Optional[bytes]:
+        """Checkpointed audio for chunk ``index`` if it was made from ``text``."""
+        try:
+            audio = self.storage.download_file(self.chunk_key(index, text))
+        except Exception as e:
+            if not str(e).startswith("File not found"):
+                logger.warning(f"⚠️ Could not read checkpointed chunk {index}: {e}")
+            return None
+        with self._lock:
+            self.reused_chunks += 1
+            self.reused_chars += len(text)
+        return audio
+
+    def put(self, index: int, text: str, audio: bytes) -> None:
+        """Persist chunk audio; the object's existence is the record."""
+        try:
+            self.storage.upload_file_data(audio, self.chunk_key(index, text), "audio/mpeg")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not checkpoint chunk {index}: {e}")
+
+    def clear(self) -> None:
+        """Delete the checkpoint once the job no longer needs it."""
+        try:
+            self.storage.delete_prefix(self.root)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not delete checkpoint {self.root}: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "checkpoint_chunks_reused": self.reused_chunks,
+            "checkpoint_chars_reused": self.reused_chars,
+        }
@@ -0,0 +1,195 @@
+import html
+import re
+from bisect import bisect_left, bisect_right
+from typing import Callable, List, Optional
+
+_SENTENCE_END = re.compile(r"[.!?]\s+")
+_LAST_SPACE = re.compile(r"\s\S*\Z")
+
+
+def utf8_bytes(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def escaped_length(text: str) -> int:
+    """Length of the text once html-escaped into an SSML document."""
+    return len(html.escape(text))
+
+
+class ChunkLimit:
+    """
+    A provider's per-request input limit: at most ``max_chars`` characters
+    and, if given, at most ``max_size`` as measured by ``size`` (UTF-8 bytes,
+    escaped SSML length, ...). ``size`` must grow with the text, as byte and
+    escape counts do.
+    """
+
+    def __init__(
+        self,
+        max_chars: int,
+        max_size: Optional[int] = None,
+        size: Callable[[str], int] = len,
+    ):
+        self.max_chars = max_chars
+        self.max_size = max_size
+        self.size = size
+
+    def fits(self, text: str) -> bool:
+        if len(text) > self.max_chars:
+            return False
+        return self.max_size is None or self.size(text) <= self.max_size
+
+    def __repr__(self) -> str:
+        return f"ChunkLimit(max_chars={self.max_chars}, max_size={self.max_size})"
+
+
+def _window_end(
+    text: str, start: int, end: int, max_chars: int, fits: Optional[Callable[[str], bool]]
+) -> int:
+    """End of the longest window from ``start`` that fits the limit."""
+    stop = min(start + max_chars, end)
+    if fits is None or fits(text[start:stop]):
+        return stop
+    # Multi-byte or escaped characters: binary search the longest prefix
+    low, high = start, stop
+    while high - low > 1:
+        middle = (low + high) // 2
+        if fits(text[start:middle]):
+            low = middle
+        else:
+            high = middle
+    return max(low, start + 1)
+
+
+def chunk_text(
+    text: str, max_chars: int = 4500, fits: Optional[Callable[[str], bool]] = None
+) -> List[str]:
+    """
+    Split text into chunks of at most ``max_chars`` for TTS providers.
+
+    Each chunk ends after the last sentence boundary (``.``, ``!`` or ``?``
+    followed by whitespace) in its window, else after the last whitespace,
+    else at a hard cut. Works on offsets into ``text`` with a sentence-boundary
+    index built in one pass, so the cost is linear in the text length; the
+    output is the same as repeatedly cutting and re-stripping the remainder.
+
+    ``fits`` (e.g. ``ChunkLimit.fits``) further shrinks a window to what the
+    provider accepts when its limit isn't a plain character count.
+    """
+    if not text:
+        return []
+    if _window_end(text, 0, len(text), max_chars, fits) == len(text):
+        return [text]
+
+    # Positions of the punctuation mark and the end of the whitespace after it
+    marks = []
+    mark_ends = []
+    for match in _SENTENCE_END.finditer(text):
+        marks.append(match.start())
+        mark_ends.append(match.end())
+
+    chunks = []
+    start = 0
+    end = len(text)
+    stripped_end = len(text.rstrip())
+    while start < end:
+        window_end = _window_end(text, start, end, max_chars, fits)
+        if window_end == end:
+            chunks.append(text[start:end])
+            break
+
+        # Last boundary whose whitespace starts inside the window
+        i = bisect_right(marks, window_end - 2) - 1
+        if i >= 0 and marks[i] >= start:
+            split = min(mark_ends[i], window_end)
+        else:
+            space = _LAST_SPACE.search(text, start, window_end)
+            split = space.start() + 1 if space else window_end
+
+        chunks.append(text[start:split].strip())
+
+        # The remainder is stripped on both sides
+        end = stripped_end
+        start = split
+        while start < end and text[start].isspace():
+            start += 1
+
+    return chunks
+
+
+class StreamChunker:
+    """
+    Cuts text that arrives in pieces (LLM output deltas) into TTS chunks as
+    soon as each is complete, instead of waiting for the whole text.
+
+    A chunk ends at the first sentence boundary at least ``target``
+    characters in. ``target`` starts at ``first_chars`` so the first chunk
+    (and first audio) comes after about one sentence, and doubles per chunk
+    up to the provider limit, so the chunk count stays close to that of
+    chunking the finished text. A buffer that outgrows the limit before such
+    a boundary is cut the way ``chunk_text`` would cut it.
+
+    The cuts depend only on the text, not on how it was split into pieces,
+    so a cached completion fed in one piece gives the same chunks (and
+    checkpoint and audio cache keys) as the live stream did.
+    """
+
+    def __init__(
+        self,
+        max_chars: int = 4500,
+        fits: Optional[Callable[[str], bool]] = None,
+        first_chars: int = 200,
+    ):
+        self.max_chars = max_chars
+        self.fits = fits
+        self.target = min(first_chars, max_chars)
+        self.buffer = ""
+        # Ends (just after the mark) of the sentence boundaries in the buffer;
+        # the whitespace after a mark may arrive in a later piece
+        self._ends: List[int] = []
+
+    def feed(self, piece: str) -> List[str]:
+        """Add text; returns the chunks it completed, if any."""
+        scanned = len(self.buffer)
+        # The buffer never starts with whitespace, however the text was split
+        self.buffer += piece if self.buffer else piece.lstrip()
+        # Only the new text (and the mark just before it) can hold new boundaries
+        for match in _SENTENCE_END.finditer(self.buffer, max(0, scanned - 1)):
+            if not self._ends or match.start() + 1 > self._ends[-1]:
+                self._ends.append(match.start() + 1)
+
+        chunks = []
+        while self.buffer:
+            window = _window_end(self.buffer, 0, len(self.buffer), self.max_chars, self.fits)
+            overflow = window < len(self.buffer)
+            first = bisect_left(self._ends, self.target)
+            last = bisect_right(self._ends, window) - 1
+            if first <= last:
+                cut = self._ends[first]
+            elif overflow and last >= 0:
+                cut = self._ends[last]
+            elif overflow:
+                space = _LAST_SPACE.search(self.buffer, 0, window)
+                cut = space.start() + 1 if space else window
+            else:
+                break
+            chunk = self._take(cut)
+            if chunk:
+                chunks.append(chunk)
+        return chunks
+
+    def close(self) -> List[str]:
+        """The chunks left once the text is complete."""
+        rest = self.buffer.strip()
+        self.buffer = ""
+        self._ends = []
+        return chunk_text(rest, self.max_chars, self.fits)
+
+    def _take(self, cut: int) -> str:
+        chunk = self.buffer[:cut].strip()
+        rest = self.buffer[cut:].lstrip()
+        shift = len(self.buffer) - len(rest)
+        self.buffer = rest
+        self._ends = [end - shift for end in self._ends if end - shift > 0]
+        self.target = min(self.target * 2, self.max_chars)
+        return chunk
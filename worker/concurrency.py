@@ -0,0 +1,116 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from loguru import logger
+
+_OVERLOAD_MARKERS = ("429", "rate limit", "too many requests", "throttl", "timed out", "timeout")
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """True for errors that mean "back off": 429s, throttling and timeouts."""
+    if isinstance(error, TimeoutError):
+        return True
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in _OVERLOAD_MARKERS)
+
+
+class AIMDController:
+    """
+    Adaptive in-flight limit for calls to one provider (AIMD, as in TCP).
+
+    While calls succeed with healthy latency (recent average within
+    ``latency_tolerance`` of the long-run average) and the limit is actually
+    in use, the limit grows by ``increase`` per limit's worth of successes.
+    A 429, throttling error or timeout multiplies it by ``decrease``; calls
+    that were already in flight when it was cut don't cut it again.
+    Other errors leave it alone.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.limit = float(min(max(initial, min_limit), self.max_limit))
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.decreases = 0
+        self._short_latency = None
+        self._long_latency = None
+        self._epoch = 0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one in-flight slot for the duration of a provider call."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+            epoch = self._epoch
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self._release(epoch, time.monotonic() - started, e)
+            raise
+        self._release(epoch, time.monotonic() - started, None)
+
+    def _release(self, epoch: int, latency: float, error) -> None:
+        with self._cond:
+            saturated = self.in_flight >= int(self.limit)
+            self.in_flight -= 1
+            if error is None:
+                if self._healthy(latency) and saturated:
+                    self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+            elif is_overload_error(error) and epoch == self._epoch:
+                previous = int(self.limit)
+                self.limit = max(self.min_limit, self.limit * self.decrease)
+                self._epoch += 1
+                self.decreases += 1
+                logger.warning(
+                    f"⚠️ {self.name} overloaded ({error}); concurrency {previous} -> {int(self.limit)}"
+                )
+            self._cond.notify_all()
+
+    def _healthy(self, latency: float) -> bool:
+        if self._long_latency is None:
+            self._short_latency = self._long_latency = latency
+            return True
+        self._short_latency += 0.3 * (latency - self._short_latency)
+        self._long_latency += 0.02 * (latency - self._long_latency)
+        return self._short_latency <= self.latency_tolerance * self._long_latency
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "decreases": self.decreases,
+            }
+
+
+_controllers: Dict[str, AIMDController] = {}
+_controllers_lock = threading.Lock()
+
+
+def get_controller(name: str, initial: int, max_limit: int) -> AIMDController:
+    """The process-wide controller for ``name``; state persists across jobs."""
+    with _controllers_lock:
+        controller = _controllers.get(name)
+        if controller is None:
+            controller = AIMDController(name, initial, max_limit=max_limit)
+            _controllers[name] = controller
+        return controller
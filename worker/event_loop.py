@@ -0,0 +1,41 @@
+import asyncio
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    # The loop's thread doesn't survive a fork; children start their own
+    global _loop, _loop_lock
+    _loop = None
+    _loop_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """The worker process's shared event loop, running in a daemon thread."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="async-io", daemon=True
+            ).start()
+            _loop = loop
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """
+    Run ``coro`` on the shared loop and block the calling thread for its
+    result. Must not be called from the loop's own thread.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result(timeout)
@@ -0,0 +1,236 @@
+import itertools
+import os
+from collections import deque
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+import pytesseract
+from loguru import logger
+from pdf2image import convert_from_path, pdfinfo_from_path
+from PIL import Image
+
+
+# Bump whenever extraction, OCR or cleanup output changes so cached
+# extractions from older workers are not reused.
+EXTRACTOR_VERSION = "3"
+
+# Pages per range handed to a single worker process. Small enough to balance
+# load across workers, large enough that re-opening the PDF stays cheap.
+MIN_PAGES_PER_RANGE = 25
+
+
+def page_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """
+    Split ``page_count`` pages into contiguous ``(start, stop)`` ranges.
+    Produces a few ranges per worker so a slow range doesn't stall the pool.
+    """
+    if page_count <= 0:
+        return []
+
+    target_ranges = max(1, workers * 4)
+    size = max(MIN_PAGES_PER_RANGE, -(-page_count // target_ranges))
+    return [
+        (start, min(start + size, page_count))
+        for start in range(0, page_count, size)
+    ]
+
+
+def extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages ``start`` to ``stop - 1``.
+    Runs inside worker processes, so it opens its own handle on the PDF.
+    """
+    with fitz.open(pdf_path) as doc:
+        return [doc[i].get_text() for i in range(start, stop)]
+
+
+def extract_pages(
+    pdf_path: str, workers: int = 1, min_pages_for_parallel: int = 200
+) -> List[str]:
+    """
+    Extract the text layer of every page, in page order.
+
+    Documents with at least ``min_pages_for_parallel`` pages are split into
+    page ranges and extracted by a process pool when ``workers`` > 1.
+    """
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+        if workers <= 1 or page_count < min_pages_for_parallel:
+            return [page.get_text() for page in doc]
+
+    ranges = page_ranges(page_count, workers)
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+            futures = [
+                pool.submit(extract_page_range, pdf_path, start, stop)
+                for start, stop in ranges
+            ]
+            pages: List[str] = []
+            for future in futures:
+                pages.extend(future.result())
+            return pages
+    except Exception as e:
+        # e.g. daemonic Celery children that may not spawn processes
+        logger.warning(f"⚠️ Parallel extraction unavailable ({e}), extracting serially")
+        return extract_page_range(pdf_path, 0, page_count)
+
+
+def table_of_contents(pdf_path: str, max_level: int = 1) -> List[Tuple[str, int]]:
+    """
+    ``(title, page index)`` for each outline entry down to ``max_level``, in
+    outline order. Empty when the PDF has no outline or can't be read.
+    """
+    try:
+        with fitz.open(pdf_path) as doc:
+            toc = doc.get_toc(simple=True)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read the PDF outline: {e}")
+        return []
+    # get_toc pages are 1-based; entries pointing nowhere are -1 or 0
+    return [
+        (title.strip(), page - 1)
+        for level, title, page in toc
+        if level <= max_level and page > 0 and title.strip()
+    ]
+
+
+def pages_needing_ocr(
+    pdf_path: str, pages: List[str], min_chars: int = 25
+) -> List[int]:
+    """
+    Return the indexes of pages whose text layer is unusable.
+
+    A page needs OCR when it has fewer than ``min_chars`` non-whitespace
+    characters of text *and* carries at least one image (a scanned insert).
+    Blank pages and pages with a real text layer are left alone.
+    """
+    short_pages = [
+        i for i, text in enumerate(pages) if len("".join(text.split())) < min_chars
+    ]
+    if not short_pages:
+        return []
+
+    with fitz.open(pdf_path) as doc:
+        return [i for i in short_pages if doc[i].get_images(full=False)]
+
+
+def render_page(page: "fitz.Page", dpi: int = 300) -> Image.Image:
+    """Rasterize one page to a grayscale PIL image via a fitz pixmap."""
+    pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+    return Image.frombytes("L", (pix.width, pix.height), pix.samples)
+
+
+def ocr_page(
+    pdf_path: str, page_number: int, dpi: int = 300, renderer: str = "fitz"
+) -> str:
+    """
+    Render and OCR a single (zero-based) page of the PDF.
+
+    Only this page is ever rasterized, so memory stays at one page image.
+    ``renderer="poppler"`` is used for files fitz cannot open.
+    """
+    if renderer == "poppler":
+        images = convert_from_path(
+            pdf_path, dpi=dpi, first_page=page_number + 1, last_page=page_number + 1
+        )
+        image = images[0] if images else None
+    else:
+        with fitz.open(pdf_path) as doc:
+            image = render_page(doc[page_number], dpi)
+
+    if image is None:
+        return ""
+    try:
+        return pytesseract.image_to_string(image, lang="eng") + "\n"
+    finally:
+        image.close()
+
+
+def page_count(pdf_path: str, renderer: str = "fitz") -> int:
+    if renderer == "poppler":
+        return int(pdfinfo_from_path(pdf_path)["Pages"])
+    with fitz.open(pdf_path) as doc:
+        return doc.page_count
+
+
+def iter_ocr_pages(
+    pdf_path: str,
+    page_numbers: Optional[Iterable[int]] = None,
+    dpi: int = 300,
+    workers: int = 1,
+    window: Optional[int] = None,
+    renderer: str = "fitz",
+) -> Iterator[Tuple[int, Optional[str]]]:
+    """
+    OCR pages lazily, yielding ``(page_number, text)`` in page order.
+
+    With ``workers`` > 1 each page is rendered and OCR'd inside a pool
+    process, and at most ``window`` pages are in flight at once, so peak
+    memory is bounded by the window rather than the page count. Pages that
+    fail to OCR are logged and yielded with ``None``.
+    """
+    if page_numbers is None:
+        page_numbers = range(page_count(pdf_path, renderer))
+    page_numbers = iter(page_numbers)
+
+    if workers <= 1:
+        yield from _iter_ocr_serial(pdf_path, page_numbers, dpi, renderer)
+        return
+
+    window = window or workers * 2
+    # Pages taken from page_numbers but not yet yielded, oldest first, so a
+    # broken pool can hand them to the serial fallback in order
+    pending: Deque[int] = deque()
+    futures: Deque[Future] = deque()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for page_number in page_numbers:
+                pending.append(page_number)
+                futures.append(pool.submit(ocr_page, pdf_path, page_number, dpi, renderer))
+                if len(futures) >= window:
+                    result = _collect(pending[0], futures[0])
+                    pending.popleft()
+                    futures.popleft()
+                    yield result
+            while futures:
+                result = _collect(pending[0], futures[0])
+                pending.popleft()
+                futures.popleft()
+                yield result
+        return
+    except Exception as e:
+        # e.g. daemonic Celery children that may not spawn processes, or a
+        # pool broken by a killed worker
+        logger.warning(f"⚠️ OCR pool unavailable ({e}), OCR-ing serially")
+
+    yield from _iter_ocr_serial(pdf_path, itertools.chain(pending, page_numbers), dpi, renderer)
+
+
+def _iter_ocr_serial(
+    pdf_path: str, page_numbers: Iterator[int], dpi: int, renderer: str
+) -> Iterator[Tuple[int, Optional[str]]]:
+    for page_number in page_numbers:
+        try:
+            yield page_number, ocr_page(pdf_path, page_number, dpi, renderer)
+        except Exception as e:
+            logger.warning(f"⚠️ OCR failed for page {page_number + 1}: {e}")
+            yield page_number, None
+
+
+def _collect(page_number: int, future: Future) -> Tuple[int, Optional[str]]:
+    try:
+        return page_number, future.result()
+    except BrokenExecutor:
+        # The pool is gone, not just this page; let the caller fall back
+        raise
+    except Exception as e:
+        logger.warning(f"⚠️ OCR failed for page {page_number + 1}: {e}")
+        return page_number, None
+
+
+def default_workers(configured: int) -> int:
+    """Resolve the configured worker count; 0 means one per CPU."""
+    if configured > 0:
+        return configured
+    return os.cpu_count() or 1
@@ -0,0 +1,148 @@
+import math
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from loguru import logger
+
+from .mp3 import Frame, iter_frames
+
+PLAYLIST_CONTENT_TYPE = "application/vnd.apple.mpegurl"
+_TIMESTAMP_OWNER = b"com.apple.streaming.transportStreamTimestamp\x00"
+
+
+def _syncsafe(value: int) -> bytes:
+    return bytes((value >> shift) & 0x7F for shift in (21, 14, 7, 0))
+
+
+def timestamp_tag(pts: int) -> bytes:
+    """
+    The ID3 PRIV tag every HLS packed-audio segment starts with, carrying the
+    33-bit MPEG-2 timestamp (90 kHz) of its first sample.
+    """
+    body = _TIMESTAMP_OWNER + struct.pack(">Q", pts & ((1 << 33) - 1))
+    frame = b"PRIV" + _syncsafe(len(body)) + b"\x00\x00" + body
+    return b"ID3\x04\x00\x00" + _syncsafe(len(frame)) + frame
+
+
+def split_segments(frames: List[Frame], max_seconds: float) -> List[List[Frame]]:
+    """Group frames into runs of at most ``max_seconds`` (at least one frame each)."""
+    segments: List[List[Frame]] = []
+    current: List[Frame] = []
+    duration = 0.0
+    for frame in frames:
+        length = frame.samples / frame.sample_rate
+        if current and duration + length > max_seconds:
+            segments.append(current)
+            current, duration = [], 0.0
+        current.append(frame)
+        duration += length
+    if current:
+        segments.append(current)
+    return segments
+
+
+class HLSWriter:
+    """
+    Live HLS playlist of a job's audio, published while it is synthesized.
+
+    ``write`` takes each chunk's MP3 frames as the assembler appends them and
+    cuts them, at frame boundaries and without re-encoding, into packed-audio
+    segments of at most ``segment_seconds``. Segments and the updated
+    ``EVENT`` playlist are uploaded in order on a background thread, so
+    synthesis never waits on them; ``on_live(playlist_key)`` is called once
+    the first segment is listed. ``finish`` appends ``#EXT-X-ENDLIST``.
+
+    Segment URIs are presigned (the bucket is private), valid for
+    ``url_expiry`` seconds. Upload failures are logged and stop the playlist;
+    they never fail the job.
+    """
+
+    def __init__(
+        self,
+        storage,
+        prefix: str,
+        segment_seconds: float = 10.0,
+        url_expiry: int = 86400,
+        on_live: Optional[Callable[[str], None]] = None,
+    ):
+        self.storage = storage
+        self.prefix = prefix
+        self.playlist_key = f"{prefix}playlist.m3u8"
+        self.segment_seconds = segment_seconds
+        self.url_expiry = url_expiry
+        self.on_live = on_live
+        self.segments: List[Tuple[str, float]] = []
+        self._pts = 0
+        self._failed = False
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hls")
+
+    def segment_key(self, index: int) -> str:
+        return f"{self.prefix}segment_{index:05d}.mp3"
+
+    def write(self, audio: bytes) -> None:
+        """Publish one chunk's worth of MP3 frames."""
+        if self._failed:
+            return
+        view = memoryview(audio)
+        batch = []
+        for frames in split_segments(list(iter_frames(audio)), self.segment_seconds):
+            start, end = frames[0].offset, frames[-1].offset + frames[-1].length
+            duration = sum(frame.samples / frame.sample_rate for frame in frames)
+            batch.append((timestamp_tag(self._pts) + view[start:end].tobytes(), duration))
+            self._pts += round(duration * 90000)
+        if batch:
+            self._pool.submit(self._publish, batch, False)
+
+    def finish(self) -> None:
+        """End the playlist and wait for every upload."""
+        if not self._failed:
+            self._pool.submit(self._publish, [], True)
+        self._pool.shutdown(wait=True)
+
+    def close(self) -> None:
+        """Stop publishing after a failure; the playlist is left open."""
+        self._failed = True
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def playlist(self, ended: bool = False) -> str:
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            "#EXT-X-PLAYLIST-TYPE:EVENT",
+            # Fixed up front: a live playlist's target duration may not change
+            f"#EXT-X-TARGETDURATION:{math.ceil(self.segment_seconds)}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+        ]
+        for uri, duration in self.segments:
+            lines += [f"#EXTINF:{duration:.3f},", uri]
+        if ended:
+            lines.append("#EXT-X-ENDLIST")
+        return "\n".join(lines) + "\n"
+
+    def _publish(self, batch: List[Tuple[bytes, float]], ended: bool) -> None:
+        if self._failed:
+            return
+        try:
+            for data, duration in batch:
+                key = self.segment_key(len(self.segments))
+                self.storage.upload_file_data(data, key, "audio/mpeg")
+                uri = self.storage.generate_presigned_url(key, expiration=self.url_expiry)
+                self.segments.append((uri or key.rsplit("/", 1)[-1], duration))
+            # Players re-fetch the playlist, so it must not be cached
+            self.storage.s3_client.put_object(
+                Bucket=self.storage.bucket_name,
+                Key=self.playlist_key,
+                Body=self.playlist(ended).encode("utf-8"),
+                ContentType=PLAYLIST_CONTENT_TYPE,
+                CacheControl="no-cache",
+            )
+        except Exception as e:
+            self._failed = True
+            logger.warning(f"⚠️ HLS publishing stopped at {len(self.segments)} segments: {e}")
+            return
+        if self.on_live and batch and len(self.segments) == len(batch):
+            try:
+                self.on_live(self.playlist_key)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not record the HLS playlist: {e}")
@@ -0,0 +1,79 @@
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+import openai
+from loguru import logger
+
+_clients: Dict[Tuple[str, Optional[str]], openai.OpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    # Pooled sockets belong to the parent; Celery's prefork children start clean
+    global _clients_lock
+    _clients.clear()
+    _clients_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def build_http_client(
+    timeout: float = 120.0,
+    connect_timeout: float = 10.0,
+    max_connections: int = 20,
+    keepalive_expiry: float = 60.0,
+) -> httpx.Client:
+    """An httpx client whose connections (and TLS sessions) are kept alive."""
+    return httpx.Client(
+        timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+
+
+def get_llm_client(
+    api_key: str,
+    base_url: Optional[str] = None,
+    timeout: float = 120.0,
+    connect_timeout: float = 10.0,
+    max_connections: int = 20,
+    keepalive_expiry: float = 60.0,
+) -> openai.OpenAI:
+    """
+    The process-wide OpenAI-compatible client for ``api_key`` and ``base_url``.
+
+    Created on first use and shared by every LLM call in the process, so
+    repeated calls (each section of a map-reduce summary, every job) reuse
+    pooled keep-alive connections instead of paying connection and TLS setup
+    each time. The client is thread-safe; ``max_connections`` should cover
+    the summarizer's parallelism.
+    """
+    key = (api_key, base_url)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            logger.info(f"🔌 Creating pooled LLM client for {base_url or 'api.openai.com'}")
+            client = openai.OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=build_http_client(
+                    timeout, connect_timeout, max_connections, keepalive_expiry
+                ),
+            )
+            _clients[key] = client
+        return client
+
+
+def close_llm_clients() -> None:
+    """Close every pooled client (worker shutdown, tests)."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
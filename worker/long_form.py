@@ -0,0 +1,197 @@
+import os
+import subprocess
+import time
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+from urllib.parse import quote, urlparse
+
+from loguru import logger
+
+T = TypeVar("T")
+
+# S3 requires every part of a multipart upload but the last to be >= 5 MiB
+MIN_PART_BYTES = 5 * 1024 * 1024
+GCS_BASE_URL = "https://storage.googleapis.com"
+
+
+def wait_for_all(
+    task_ids: Iterable[T],
+    check: Callable[[T], Optional[str]],
+    poll_interval: float = 10.0,
+    timeout: float = 4 * 3600,
+    on_done: Optional[Callable[[int, int], None]] = None,
+) -> List[str]:
+    """
+    Poll provider-side tasks until all are finished; returns their outputs in
+    task order. ``check(task_id)`` returns the output once the task is done,
+    None while it is running, and raises if it failed. ``on_done(done,
+    total)`` is called as tasks finish.
+    """
+    pending = list(task_ids)
+    total = len(pending)
+    outputs: Dict[T, str] = {}
+    deadline = time.monotonic() + timeout
+    while True:
+        for task_id in [t for t in pending if t not in outputs]:
+            output = check(task_id)
+            if output is not None:
+                outputs[task_id] = output
+                if on_done:
+                    on_done(len(outputs), total)
+        if len(outputs) == total:
+            return [outputs[task_id] for task_id in pending]
+        if time.monotonic() > deadline:
+            raise TimeoutError(
+                f"Long-form synthesis timed out with {total - len(outputs)} of {total} tasks unfinished"
+            )
+        time.sleep(poll_interval)
+
+
+def s3_key_from_uri(uri: str, bucket: str) -> str:
+    """Object key from a path-style or virtual-hosted S3 https URI."""
+    parsed = urlparse(uri)
+    path = parsed.path.lstrip("/")
+    if parsed.netloc.startswith(f"{bucket}."):
+        return path
+    return path[len(bucket) + 1:] if path.startswith(f"{bucket}/") else path
+
+
+def assemble_s3_objects(
+    s3_client, source_bucket: str, keys: List[str], dest_bucket: str, dest_key: str,
+    content_type: str = "audio/mpeg",
+) -> bool:
+    """
+    Concatenate S3 objects into ``dest_key`` without downloading them: one
+    UploadPartCopy per object, so the bytes never leave S3. MP3 streams
+    concatenate byte for byte. Returns False (leaving nothing behind) when an
+    object other than the last is under the 5 MiB part minimum; the caller
+    must then assemble locally.
+    """
+    sizes = [
+        s3_client.head_object(Bucket=source_bucket, Key=key)["ContentLength"] for key in keys
+    ]
+    if any(size < MIN_PART_BYTES for size in sizes[:-1]):
+        return False
+    if len(keys) == 1:
+        s3_client.copy_object(
+            Bucket=dest_bucket,
+            Key=dest_key,
+            CopySource={"Bucket": source_bucket, "Key": keys[0]},
+            ContentType=content_type,
+            MetadataDirective="REPLACE",
+        )
+        return True
+
+    upload_id = s3_client.create_multipart_upload(
+        Bucket=dest_bucket, Key=dest_key, ContentType=content_type
+    )["UploadId"]
+    try:
+        parts = []
+        for number, key in enumerate(keys, start=1):
+            response = s3_client.upload_part_copy(
+                Bucket=dest_bucket,
+                Key=dest_key,
+                UploadId=upload_id,
+                PartNumber=number,
+                CopySource={"Bucket": source_bucket, "Key": key},
+            )
+            parts.append({"PartNumber": number, "ETag": response["CopyPartResult"]["ETag"]})
+        s3_client.complete_multipart_upload(
+            Bucket=dest_bucket,
+            Key=dest_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except Exception:
+        s3_client.abort_multipart_upload(Bucket=dest_bucket, Key=dest_key, UploadId=upload_id)
+        raise
+    return True
+
+
+def download_s3_objects(s3_client, bucket: str, keys: List[str], work_dir: str) -> List[str]:
+    """Stream objects to files in ``work_dir`` (never whole into memory)."""
+    paths = []
+    for i, key in enumerate(keys):
+        path = os.path.join(work_dir, f"long_form_{i:04d}.mp3")
+        s3_client.download_file(bucket, key, path)
+        paths.append(path)
+    return paths
+
+
+def delete_s3_objects(s3_client, bucket: str, keys: List[str]) -> None:
+    try:
+        for start in range(0, len(keys), 1000):
+            s3_client.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in keys[start:start + 1000]]},
+            )
+    except Exception as e:
+        logger.warning(f"⚠️ Could not delete long-form intermediates: {e}")
+
+
+def delete_s3_prefix(s3_client, bucket: str, prefix: str) -> None:
+    """
+    Delete everything under ``prefix``, including the output of tasks that
+    finished before a sibling failed or the wait timed out.
+    """
+    try:
+        keys = [
+            obj["Key"]
+            for page in s3_client.get_paginator("list_objects_v2").paginate(Bucket=bucket, Prefix=prefix)
+            for obj in page.get("Contents", [])
+        ]
+    except Exception as e:
+        logger.warning(f"⚠️ Could not list long-form intermediates under {prefix}: {e}")
+        return
+    delete_s3_objects(s3_client, bucket, keys)
+
+
+def delete_gcs_objects(
+    uris: List[str], headers: Optional[Dict[str, str]] = None, base_url: Optional[str] = None
+) -> None:
+    """Delete gs:// objects; ones that were never written are skipped."""
+    import httpx
+
+    try:
+        with httpx.Client(headers=headers, timeout=30.0) as client:
+            for uri in uris:
+                response = client.delete(gcs_http_url(uri, base_url))
+                if response.status_code != 404:
+                    response.raise_for_status()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not delete long-form intermediates: {e}")
+
+
+def gcs_http_url(uri: str, base_url: Optional[str] = None) -> str:
+    """https download URL for a gs:// URI."""
+    parsed = urlparse(uri)
+    return f"{(base_url or GCS_BASE_URL).rstrip('/')}/{parsed.netloc}/{quote(parsed.path.lstrip('/'))}"
+
+
+def transcode_to_mp3(
+    inputs: List[str], output_path: str, headers: Optional[Dict[str, str]] = None,
+    bitrate: str = "128k",
+) -> str:
+    """
+    Concatenate audio inputs (files or http(s) URLs) into one MP3 in a single
+    ffmpeg pass. Remote inputs are streamed by ffmpeg, so memory stays flat
+    however long the audio is.
+    """
+    cmd = ["ffmpeg", "-y", "-loglevel", "error"]
+    header_lines = "".join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+    for source in inputs:
+        if header_lines and source.startswith(("http://", "https://")):
+            cmd += ["-headers", header_lines]
+        cmd += ["-i", source]
+    cmd += [
+        "-filter_complex",
+        "".join(f"[{i}:a]" for i in range(len(inputs))) + f"concat=n={len(inputs)}:v=0:a=1[out]",
+        "-map", "[out]",
+        "-c:a", "libmp3lame", "-b:a", bitrate,
+        output_path,
+    ]
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as e:
+        stderr_output = e.stderr.decode() if e.stderr else "No stderr"
+        raise Exception(f"FFmpeg long-form transcode failed: {stderr_output}")
+    return output_path
@@ -0,0 +1,108 @@
+import os
+import subprocess
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from loguru import logger
+
+
+class Chapter(NamedTuple):
+    title: str
+    start: float  # seconds
+    end: float
+
+
+def chapters_from_toc(
+    toc: Sequence[Tuple[str, int]],
+    chunk_pages: Sequence[int],
+    chunk_durations: Sequence[float],
+    intro_title: str = "Introduction",
+) -> List[Chapter]:
+    """
+    Chapters for a book whose chunk ``i`` lasts ``chunk_durations[i]`` seconds
+    and ends on page ``chunk_pages[i]``. Each outline entry starts at the
+    first chunk reaching its page, so chapters fall on chunk boundaries.
+    Entries landing on the same chunk as an earlier one are dropped; audio
+    before the first entry becomes an ``intro_title`` chapter.
+    """
+    starts = [0.0]
+    for duration in chunk_durations:
+        starts.append(starts[-1] + duration)
+    total = starts[-1]
+
+    marks: List[Tuple[int, str]] = []
+    for title, page in toc:
+        index = next((i for i, last in enumerate(chunk_pages) if last >= page), None)
+        if index is None:
+            break
+        if marks and index <= marks[-1][0]:
+            continue
+        marks.append((index, title))
+    if not marks:
+        return []
+    if marks[0][0] > 0:
+        marks.insert(0, (0, intro_title))
+
+    ends = [starts[index] for index, _ in marks[1:]] + [total]
+    return [
+        Chapter(title, starts[index], end) for (index, title), end in zip(marks, ends)
+    ]
+
+
+def _escape(value: str) -> str:
+    for char in ("\\", "=", ";", "#", "\n"):
+        value = value.replace(char, "\\" + char)
+    return value
+
+
+def ffmetadata(chapters: Sequence[Chapter], title: Optional[str] = None) -> str:
+    """Chapters (and title) in ffmpeg's FFMETADATA format, millisecond timebase."""
+    lines = [";FFMETADATA1"]
+    if title:
+        lines.append(f"title={_escape(title)}")
+    for chapter in chapters:
+        lines += [
+            "[CHAPTER]",
+            "TIMEBASE=1/1000",
+            f"START={round(chapter.start * 1000)}",
+            f"END={round(chapter.end * 1000)}",
+            f"title={_escape(chapter.title)}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def mux_m4b(
+    audio_path: str,
+    output_path: str,
+    chapters: Sequence[Chapter] = (),
+    bitrate: str = "64k",
+    title: Optional[str] = None,
+    channels: Optional[int] = None,
+) -> str:
+    """
+    Write ``audio_path`` as an AAC .m4b with chapter atoms in one ffmpeg
+    pass: the audio is encoded and the chapters muxed together, with the
+    index moved to the front so players can seek before the download ends.
+    """
+    metadata_path = f"{output_path}.ffmetadata"
+    with open(metadata_path, "w", encoding="utf-8") as f:
+        f.write(ffmetadata(chapters, title))
+    cmd = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-i", audio_path,
+        "-f", "ffmetadata", "-i", metadata_path,
+        "-map", "0:a", "-map_metadata", "1", "-map_chapters", "1",
+        *(["-ac", str(channels)] if channels else []),
+        "-c:a", "aac", "-b:a", bitrate,
+        "-movflags", "+faststart",
+        "-f", "ipod",
+        output_path,
+    ]
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as e:
+        stderr_output = e.stderr.decode() if e.stderr else "No stderr"
+        raise Exception(f"FFmpeg M4B mux failed: {stderr_output}")
+    finally:
+        os.remove(metadata_path)
+    logger.info(f"📖 Wrote M4B with {len(chapters)} chapters")
+    return output_path
@@ -0,0 +1,109 @@
+from typing import Iterator, List, NamedTuple, Optional
+
+# Bitrates (kbps) by (MPEG-1?, layer)
+_BITRATES = {
+    (True, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (True, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (True, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (False, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (False, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (False, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+# Sample rates by version bits (3: MPEG-1, 2: MPEG-2, 0: MPEG-2.5)
+_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+class Frame(NamedTuple):
+    offset: int
+    length: int
+    samples: int
+    sample_rate: int
+
+
+def parse_header(data: bytes, offset: int) -> Optional[Frame]:
+    """The MPEG audio frame starting at ``offset``, or None if there isn't one."""
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2 = data[offset], data[offset + 1], data[offset + 2]
+    if b0 != 0xFF or b1 & 0xE0 != 0xE0:
+        return None
+    version = (b1 >> 3) & 3
+    layer = 4 - ((b1 >> 1) & 3)
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 1
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if mpeg1 or layer == 2 else 576
+        length = samples // 8 * bitrate // sample_rate + padding
+    return Frame(offset, length, samples, sample_rate)
+
+
+def _id3v2_size(data: bytes) -> int:
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in data[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _is_info_frame(data: bytes, frame: Frame) -> bool:
+    """Xing/Info/VBRI header frames carry stream totals, not audio."""
+    body = data[frame.offset + 4:frame.offset + min(frame.length, 64)]
+    return b"Xing" in body or b"Info" in body or b"VBRI" in body
+
+
+def iter_frames(data: bytes) -> Iterator[Frame]:
+    """
+    Audio frames of an MP3 file, skipping ID3 tags, Xing/Info header frames
+    and junk between frames. A header only counts when the next frame (or
+    the end of the data) follows it, so stray 0xFF bytes aren't mistaken
+    for frames.
+    """
+    end = len(data)
+    if end >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128
+    offset = _id3v2_size(data)
+    first = True
+    while offset < end:
+        frame = parse_header(data, offset)
+        if frame is not None and offset + frame.length <= end:
+            following = offset + frame.length
+            if following == end or parse_header(data, following) is not None:
+                if not (first and _is_info_frame(data, frame)):
+                    yield frame
+                first = False
+                offset = following
+                continue
+        # Resynchronize at the next possible frame sync byte
+        offset = data.find(b"\xff", offset + 1, end)
+        if offset < 0:
+            return
+
+
+def audio_spans(data: bytes, max_junk: float = 0.1) -> Optional[List[Frame]]:
+    """
+    The audio frames of ``data`` if it is an MP3 stream: None when there are
+    no frames or more than ``max_junk`` of the bytes are neither frames nor
+    tags, so the caller can fall back to a real demuxer.
+    """
+    frames = list(iter_frames(data))
+    if not frames:
+        return None
+    covered = sum(frame.length for frame in frames) + _id3v2_size(data)
+    if len(data) - covered > max_junk * len(data) + 128 + frames[0].length:
+        return None
+    return frames
+
+
+def duration_seconds(frames: List[Frame]) -> float:
+    return sum(frame.samples / frame.sample_rate for frame in frames)
@@ -0,0 +1,71 @@
+import re
+from typing import Iterable, Iterator
+
+# UTF-8 punctuation that was decoded as Latin-1 / Windows-125x on the way
+# into the PDF ("â€™" for "’" and so on).
+_MOJIBAKE = {
+    "–": "-",  # en dash
+    "—": "-",  # em dash
+    "‘": "'",
+    "’": "'",
+    "“": '"',
+    "”": '"',
+    "…": "...",
+    "•": "*",
+}
+
+_LIGATURES = {
+    "ﬀ": "ff",
+    "ﬁ": "fi",
+    "ﬂ": "fl",
+    "ﬃ": "ffi",
+    "ﬄ": "ffl",
+    "ﬅ": "st",
+    "ﬆ": "st",
+}
+
+
+def _mojibake_forms(char: str) -> set:
+    encoded = char.encode("utf-8")
+    forms = {encoded.decode("latin-1")}
+    for codec in ("cp1250", "cp1252"):
+        try:
+            forms.add(encoded.decode(codec))
+        except UnicodeDecodeError:
+            pass
+    return forms
+
+
+_REPLACEMENTS = dict(_LIGATURES)
+for _char, _replacement in _MOJIBAKE.items():
+    for _form in _mojibake_forms(_char):
+        _REPLACEMENTS[_form] = _replacement
+
+# One alternation for every replacement, longest keys first
+_REPAIR = re.compile(
+    "|".join(re.escape(key) for key in sorted(_REPLACEMENTS, key=len, reverse=True))
+)
+
+
+def _replace(match: "re.Match") -> str:
+    return _REPLACEMENTS[match.group()]
+
+
+def normalize_text(text: str) -> str:
+    """
+    Collapse whitespace to single spaces, repair common mojibake punctuation
+    and expand typographic ligatures.
+
+    Whitespace is collapsed (and the ends stripped) by ``str.split``/``join``
+    in C; the replacements are then a single pass of one precompiled regex,
+    instead of a copy of the text per rule.
+    """
+    return _REPAIR.sub(_replace, " ".join(text.split()))
+
+
+def normalize_pages(pages: Iterable[str]) -> Iterator[str]:
+    """Normalize page by page, skipping pages left empty."""
+    for page in pages:
+        normalized = normalize_text(page)
+        if normalized:
+            yield normalized
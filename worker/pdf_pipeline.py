@@ -1,55 +1,176 @@
 import os
 import sys
 import tempfile
-from typing import Optional, Callable, List
+from typing import Any, Dict, Optional, Callable, Iterable, Iterator, List, Sequence
 
 # Add backend to path for settings access
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "backend"))
 from app.core.config import settings
 import fitz  # PyMuPDF
-from pdf2image import convert_from_path
-import pytesseract
 from PIL import Image
 import openai
 from pydub import AudioSegment
 import io
+import contextlib
+import gzip
+import hashlib
+import threading
+import json
+import uuid
 import re
 import random
 from abc import ABC, abstractmethod
+import asyncio
 import base64
+import copy
+import html
+from loguru import logger
 
 # TTS Provider Imports
 from google.cloud import texttospeech
 import boto3
 from botocore.exceptions import NoCredentialsError
-from azure.cognitiveservices.speech import SpeechConfig, SpeechSynthesizer, ResultReason
-from elevenlabs.client import ElevenLabs
+from azure.cognitiveservices.speech import (
+    ResultReason,
+    SpeechConfig,
+    SpeechSynthesisOutputFormat,
+    SpeechSynthesizer,
+)
+from elevenlabs.client import AsyncElevenLabs
+
+from .assembly import StreamingAssembler
+from .boilerplate import RepeatedLineFilter
+from .cache import RedisCache, TieredCache, build_tiered_cache, sha256_file
+from .concurrency import get_controller
+from .event_loop import run_sync
+from .chunking import ChunkLimit, StreamChunker, chunk_text, escaped_length, utf8_bytes
+from .normalization import normalize_pages, normalize_text
+from .rate_limit import build_rate_limiter, credential_id
+from .llm_client import get_llm_client
+from .long_form import (
+    assemble_s3_objects,
+    delete_gcs_objects,
+    delete_s3_prefix,
+    download_s3_objects,
+    gcs_http_url,
+    s3_key_from_uri,
+    transcode_to_mp3,
+    wait_for_all,
+)
+from .extraction import (
+    EXTRACTOR_VERSION,
+    default_workers,
+    extract_pages,
+    iter_ocr_pages,
+    page_count,
+    pages_needing_ocr,
+    table_of_contents,
+)
+from .hls import HLSWriter
+from .m4b import chapters_from_toc, mux_m4b
+from .profiles import OutputProfile, encode_audio, load_profile
+from .streaming import iterate_in_background
+from .summarization import MapReduceSummarizer
+from .synthesis import ChunkSynthesizer
+from .upload import StreamingUpload
 
 
 # --- TTS PROVIDER INTERFACE ---
 class TTSProvider(ABC):
+    # Bitrate (kbps) of the provider's default output, where it is known
+    DEFAULT_KBPS: Optional[int] = None
+    # MP3 bitrates (kbps) the provider can return natively, mapped to its own
+    # format id (None: the default output already is that)
+    MP3_FORMATS: Dict[int, Any] = {}
+    audio_format: Any = None
+
     @abstractmethod
     def text_to_audio(self, text: str, voice_id: str, speed: float) -> bytes:
         pass
 
+    def resolve_voice(self, voice_id: str) -> str:
+        """The provider-side voice name that voice_id is synthesized with."""
+        return voice_id
+
+    @property
+    def provider_name(self) -> str:
+        """The engine behind this provider; wrappers report the one they wrap."""
+        return type(self).__name__
+
+    def with_mp3_bitrate(self, kbps: int) -> Optional["TTSProvider"]:
+        """This provider returning MP3 at ``kbps`` natively, or None if it can't."""
+        if kbps not in self.MP3_FORMATS:
+            return None
+        if self.MP3_FORMATS[kbps] is None:
+            return self
+        provider = copy.copy(self)
+        provider.audio_format = self.MP3_FORMATS[kbps]
+        return provider
+
+
+class AsyncTTSProvider(TTSProvider, ABC):
+    """
+    A provider with a native async implementation.
+
+    Async callers await ``text_to_audio_async`` and can keep hundreds of
+    requests in flight on one event loop. ``text_to_audio`` is a sync adapter
+    that runs the request on the worker process's shared loop
+    (``worker.event_loop``), so threaded callers keep working and their
+    requests share the loop's non-blocking connections.
+
+    SDK clients are bound to the loop they are used on, so they are made by
+    ``_make_client`` on first use from each loop.
+    """
+
+    _client = None
+    _client_loop = None
+
+    @abstractmethod
+    async def text_to_audio_async(self, text: str, voice_id: str, speed: float) -> bytes:
+        """Synthesize ``text`` without blocking the event loop."""
+
+    def text_to_audio(self, text: str, voice_id: str, speed: float) -> bytes:
+        return run_sync(self.text_to_audio_async(text, voice_id, speed))
+
+    @abstractmethod
+    def _make_client(self):
+        """A new SDK client bound to the running loop."""
+
+    def _get_client(self):
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = self._make_client()
+            self._client_loop = loop
+        return self._client
+
 
 # --- CONCRETE TTS IMPLEMENTATIONS ---
-class OpenAITTS(TTSProvider):
+class OpenAITTS(AsyncTTSProvider):
     def __init__(self):
-        self.client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.voice_mapping = {"default": "alloy", "female": "nova", "male": "onyx"}
 
-    def text_to_audio(self, text: str, voice_id: str, speed: float) -> bytes:
-        voice = self.voice_mapping.get(voice_id, "alloy")
-        response = self.client.audio.speech.create(
+    def _make_client(self):
+        return openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+    def resolve_voice(self, voice_id: str) -> str:
+        return self.voice_mapping.get(voice_id, "alloy")
+
+    async def text_to_audio_async(self, text: str, voice_id: str, speed: float) -> bytes:
+        voice = self.resolve_voice(voice_id)
+        response = await self._get_client().audio.speech.create(
             model="tts-1", voice=voice, input=text, speed=speed
         )
         return response.content
 
 
-class GoogleTTS(TTSProvider):
+class GoogleTTS(AsyncTTSProvider):
+    # Long audio synthesis input: up to 1,000,000 bytes
+    LONG_FORM_LIMIT = ChunkLimit(1000000, max_size=1000000, size=utf8_bytes)
+    # AudioEncoding.MP3 is always 32 kbps
+    DEFAULT_KBPS = 32
+    MP3_FORMATS = {32: None}
+
     def __init__(self):
-        self.client = texttospeech.TextToSpeechClient()
         self.voice_mapping = {
             "us_female_std": (settings.GOOGLE_VOICE_US_FEMALE_STD, "en-US"),
             "us_male_std": (settings.GOOGLE_VOICE_US_MALE_STD, "en-US"),
@@ -63,7 +184,91 @@ class GoogleTTS(TTSProvider):
         from loguru import logger
         logger.info(f"🎤 GoogleTTS initialized with voice mapping: {self.voice_mapping}")
 
-    def text_to_audio(self, text: str, voice_id: str, speed: float) -> bytes:
+    def resolve_voice(self, voice_id: str) -> str:
+        voice_name, lang_code = self.voice_mapping.get(
+            voice_id, ("en-US-Neural2-D", "en-US")
+        )
+        return f"{lang_code}/{voice_name}"
+
+    def _make_client(self):
+        # gRPC aio channels attach to the running loop
+        return texttospeech.TextToSpeechAsyncClient()
+
+    def _long_audio_client(self):
+        return texttospeech.TextToSpeechLongAudioSynthesizeClient()
+
+    def _project_id(self) -> str:
+        if settings.GOOGLE_CLOUD_PROJECT:
+            return settings.GOOGLE_CLOUD_PROJECT
+        import google.auth
+
+        return google.auth.default()[1]
+
+    def gcs_auth_headers(self) -> dict:
+        """Bearer token for reading long-audio output from Cloud Storage."""
+        import google.auth
+        from google.auth.transport.requests import Request
+
+        credentials, _ = google.auth.default(
+            scopes=["https://www.googleapis.com/auth/cloud-platform"]
+        )
+        credentials.refresh(Request())
+        return {"Authorization": f"Bearer {credentials.token}"}
+
+    @staticmethod
+    def long_form_uri(bucket: str, prefix: str, index: int) -> str:
+        """Where long audio synthesis writes the ``index``-th text."""
+        return f"gs://{bucket}/{prefix}{index:04d}.wav"
+
+    def synthesize_long_form(
+        self,
+        texts: List[str],
+        voice_id: str,
+        speed: float,
+        bucket: str,
+        prefix: str,
+        poll_interval: float = 10.0,
+        timeout: float = 4 * 3600,
+        on_done: Optional[Callable[[int, int], None]] = None,
+    ) -> List[str]:
+        """
+        Render each text (within LONG_FORM_LIMIT) server-side with long audio
+        synthesis, which writes LINEAR16 WAV straight to
+        ``gs://bucket/prefix...``. All operations run in parallel on
+        Google's side; returns the output gs:// URIs in text order.
+        """
+        client = self._long_audio_client()
+        voice_name, lang_code = self.voice_mapping.get(
+            voice_id, ("en-US-Neural2-D", "en-US")
+        )
+        parent = f"projects/{self._project_id()}/locations/{settings.GOOGLE_LONG_AUDIO_LOCATION}"
+        operations = []
+        for i, text in enumerate(texts):
+            uri = self.long_form_uri(bucket, prefix, i)
+            request = texttospeech.SynthesizeLongAudioRequest(
+                parent=parent,
+                input=texttospeech.SynthesisInput(text=text),
+                # Long audio synthesis only produces LINEAR16
+                audio_config=texttospeech.AudioConfig(
+                    audio_encoding=texttospeech.AudioEncoding.LINEAR16, speaking_rate=speed
+                ),
+                voice=texttospeech.VoiceSelectionParams(language_code=lang_code, name=voice_name),
+                output_gcs_uri=uri,
+            )
+            operations.append((client.synthesize_long_audio(request=request), uri))
+        logger.info(f"📚 Submitted {len(operations)} Google long audio operations")
+
+        def check(index: int) -> Optional[str]:
+            operation, uri = operations[index]
+            if not operation.done():
+                return None
+            # Raises the operation's error if it failed
+            operation.result()
+            return uri
+
+        return wait_for_all(range(len(operations)), check, poll_interval, timeout, on_done)
+
+    async def text_to_audio_async(self, text: str, voice_id: str, speed: float) -> bytes:
         synthesis_input = texttospeech.SynthesisInput(text=text)
         
         voice_name, lang_code = self.voice_mapping.get(
@@ -79,13 +284,17 @@ class GoogleTTS(TTSProvider):
         audio_config = texttospeech.AudioConfig(
             audio_encoding=texttospeech.AudioEncoding.MP3, speaking_rate=speed
         )
-        response = self.client.synthesize_speech(
+        response = await self._get_client().synthesize_speech(
             input=synthesis_input, voice=voice, audio_config=audio_config
         )
         return response.audio_content
 
 
 class AWSPollyTTS(TTSProvider):
+    # One StartSpeechSynthesisTask: 100,000 billed characters, 200,000 in
+    # total including SSML markup
+    LONG_FORM_LIMIT = ChunkLimit(100000, max_size=190000, size=escaped_length)
+
     def __init__(self):
         self.client = boto3.client(
             "polly",
@@ -94,58 +303,168 @@ class AWSPollyTTS(TTSProvider):
             aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
         )
 
-    import html
+    def resolve_voice(self, voice_id: str) -> str:
+        return voice_id or "Joanna"
 
-    def text_to_audio(self, text: str, voice_id: str, speed: float) -> bytes:
+    def _ssml(self, text: str, speed: float) -> str:
         # Polly uses SSML for speed control
         rate = f"{int(speed * 100)}%"
         escaped_text = html.escape(text)
-        ssml_text = f'<speak><prosody rate="{rate}">{escaped_text}</prosody></speak>'
+        return f'<speak><prosody rate="{rate}">{escaped_text}</prosody></speak>'
+
+    def text_to_audio(self, text: str, voice_id: str, speed: float) -> bytes:
         response = self.client.synthesize_speech(
-            Text=ssml_text,
+            Text=self._ssml(text, speed),
             OutputFormat="mp3",
             VoiceId=voice_id or "Joanna",
             TextType="ssml",
         )
         return response["AudioStream"].read()
 
+    def synthesize_long_form(
+        self,
+        texts: List[str],
+        voice_id: str,
+        speed: float,
+        bucket: str,
+        prefix: str,
+        poll_interval: float = 10.0,
+        timeout: float = 4 * 3600,
+        on_done: Optional[Callable[[int, int], None]] = None,
+    ) -> List[str]:
+        """
+        Render each text (within LONG_FORM_LIMIT) server-side with
+        StartSpeechSynthesisTask, which writes the MP3 straight to
+        ``s3://bucket/prefix...``. All tasks run in parallel on Polly's side;
+        returns the output object keys in text order.
+        """
+        task_ids = []
+        for text in texts:
+            response = self.client.start_speech_synthesis_task(
+                Text=self._ssml(text, speed),
+                TextType="ssml",
+                OutputFormat="mp3",
+                VoiceId=self.resolve_voice(voice_id),
+                OutputS3BucketName=bucket,
+                OutputS3KeyPrefix=prefix,
+            )
+            task_ids.append(response["SynthesisTask"]["TaskId"])
+        logger.info(f"📚 Submitted {len(task_ids)} Polly synthesis tasks")
+
+        def check(task_id: str) -> Optional[str]:
+            task = self.client.get_speech_synthesis_task(TaskId=task_id)["SynthesisTask"]
+            if task["TaskStatus"] == "failed":
+                raise Exception(
+                    f"Polly synthesis task {task_id} failed: {task.get('TaskStatusReason')}"
+                )
+            if task["TaskStatus"] == "completed":
+                return s3_key_from_uri(task["OutputUri"], bucket)
+            return None
+
+        return wait_for_all(task_ids, check, poll_interval, timeout, on_done)
+
+
+class AzureTTS(AsyncTTSProvider):
+    # The SDK's default output is 24 kHz 16-bit mono PCM
+    DEFAULT_KBPS = 384
+    MP3_FORMATS = {
+        32: SpeechSynthesisOutputFormat.Audio16Khz32KBitRateMonoMp3,
+        48: SpeechSynthesisOutputFormat.Audio24Khz48KBitRateMonoMp3,
+        64: SpeechSynthesisOutputFormat.Audio16Khz64KBitRateMonoMp3,
+        96: SpeechSynthesisOutputFormat.Audio24Khz96KBitRateMonoMp3,
+        128: SpeechSynthesisOutputFormat.Audio16Khz128KBitRateMonoMp3,
+        160: SpeechSynthesisOutputFormat.Audio24Khz160KBitRateMonoMp3,
+        192: SpeechSynthesisOutputFormat.Audio48Khz192KBitRateMonoMp3,
+    }
 
-class AzureTTS(TTSProvider):
     def __init__(self):
-        self.speech_config = SpeechConfig(
+        self.speech_config = self._speech_config()
+
+    def _speech_config(self) -> SpeechConfig:
+        return SpeechConfig(
             subscription=os.getenv("AZURE_SPEECH_KEY"),
             region=os.getenv("AZURE_SPEECH_REGION"),
         )
 
-    import html
-
-    def text_to_audio(self, text: str, voice_id: str, speed: float) -> bytes:
-        self.speech_config.speech_synthesis_voice_name = voice_id or "en-US-JennyNeural"
+    def with_mp3_bitrate(self, kbps: int) -> Optional[TTSProvider]:
+        provider = super().with_mp3_bitrate(kbps)
+        if provider is not None and provider is not self:
+            # The format is set on the config, so the copy needs its own
+            provider.speech_config = self._speech_config()
+            provider.speech_config.set_speech_synthesis_output_format(provider.audio_format)
+        return provider
+
+    def _make_client(self):
+        # Synthesizers can't be shared between concurrent requests, so each
+        # request makes its own from the speech config
+        return None
+
+    def resolve_voice(self, voice_id: str) -> str:
+        return voice_id or "en-US-JennyNeural"
+
+    async def text_to_audio_async(self, text: str, voice_id: str, speed: float) -> bytes:
+        # The voice goes in the SSML rather than on the shared config, which
+        # concurrent requests for other voices would overwrite
+        voice = self.resolve_voice(voice_id)
         synthesizer = SpeechSynthesizer(
             speech_config=self.speech_config, audio_config=None
         )
         # Azure uses SSML for speed control
         rate = f"{speed:.2f}"
         escaped_text = html.escape(text)
-        ssml_text = f'<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="en-US"><voice name="{self.speech_config.speech_synthesis_voice_name}"><prosody rate="{rate}">{escaped_text}</prosody></voice></speak>'
-        result = synthesizer.speak_ssml_async(ssml_text).get()
+        ssml_text = f'<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="en-US"><voice name="{voice}"><prosody rate="{rate}">{escaped_text}</prosody></voice></speak>'
+
+        # The SDK's own future only offers a blocking get(); its completion
+        # events resolve an asyncio future instead, without holding a thread
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+
+        def finish(event) -> None:
+            loop.call_soon_threadsafe(
+                lambda: done.done() or done.set_result(event.result)
+            )
+
+        synthesizer.synthesis_completed.connect(finish)
+        synthesizer.synthesis_canceled.connect(finish)
+        synthesizer.speak_ssml_async(ssml_text)
+        result = await done
         if result.reason == ResultReason.SynthesizingAudioCompleted:
             return result.audio_data
         else:
             raise Exception(f"Azure TTS failed: {result.reason}")
 
 
-class ElevenLabsTTS(TTSProvider):
-    def __init__(self):
-        self.client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+class ElevenLabsTTS(AsyncTTSProvider):
+    # Premade voices by name; anything else is taken as a voice id
+    VOICE_IDS = {"Rachel": "21m00Tcm4TlvDq8ikWAM"}
+    DEFAULT_FORMAT = "mp3_44100_128"
+    DEFAULT_KBPS = 128
+    MP3_FORMATS = {
+        32: "mp3_44100_32",
+        64: "mp3_44100_64",
+        96: "mp3_44100_96",
+        128: None,
+        192: "mp3_44100_192",
+    }
 
-    def text_to_audio(self, text: str, voice_id: str, speed: float) -> bytes:
+    def _make_client(self):
+        return AsyncElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+
+    def resolve_voice(self, voice_id: str) -> str:
+        voice = voice_id or "Rachel"
+        return self.VOICE_IDS.get(voice, voice)
+
+    async def text_to_audio_async(self, text: str, voice_id: str, speed: float) -> bytes:
         # ElevenLabs does not directly support a speed parameter in the same way
         # Voice settings are managed in the ElevenLabs studio
-        audio = self.client.generate(
-            text=text, voice=voice_id or "Rachel", model="eleven_multilingual_v2"
+        stream = self._get_client().text_to_speech.convert(
+            self.resolve_voice(voice_id),
+            text=text,
+            model_id="eleven_multilingual_v2",
+            output_format=self.audio_format or self.DEFAULT_FORMAT,
         )
-        return audio
+        # The audio arrives as a stream of byte chunks
+        return b"".join([chunk async for chunk in stream])
 
 
 class MockTTS(TTSProvider):
@@ -161,8 +480,154 @@ class MockTTS(TTSProvider):
         logger.info(f"--- MOCK TTS: Generating audio for text (voice: {voice_id}, speed: {speed}) ---")
         return self.silent_audio
 
+
+# --- TTS AUDIO CACHE ---
+class CachedTTSProvider(TTSProvider):
+    """
+    Content-addressed audio cache in front of another provider.
+
+    Keyed by (provider, resolved voice name, speed, hash of the
+    whitespace-normalized text, and the output format when it isn't the
+    provider's default), so re-runs, duplicate documents and
+    boilerplate pages are synthesized (and billed) once. Counts hits and
+    misses for the job's usage stats.
+    """
+
+    def __init__(self, provider: TTSProvider, cache, audio_format: Any = None):
+        self.provider = provider
+        self.cache = cache
+        self.audio_format = audio_format
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.cached_chars = 0
+
+    def resolve_voice(self, voice_id: str) -> str:
+        return self.provider.resolve_voice(voice_id)
+
+    @property
+    def provider_name(self) -> str:
+        return self.provider.provider_name
+
+    def cache_key(self, text: str, voice_id: str, speed: float) -> str:
+        normalized = " ".join(text.split())
+        text_hash = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        parts = [
+            self.provider.provider_name,
+            self.provider.resolve_voice(voice_id),
+            f"{float(speed):.2f}",
+            text_hash,
+        ]
+        if self.audio_format is not None:
+            # Non-default formats only, so existing entries keep their keys
+            parts.append(str(self.audio_format))
+        identity = "|".join(parts)
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest() + ".mp3"
+
+    def text_to_audio(self, text: str, voice_id: str, speed: float) -> bytes:
+        key = self.cache_key(text, voice_id, speed)
+        audio = self.cache.get(key)
+        if audio is not None:
+            with self._lock:
+                self.hits += 1
+                self.cached_chars += len(text)
+            return audio
+
+        audio = self.provider.text_to_audio(text, voice_id, speed)
+        with self._lock:
+            self.misses += 1
+        self.cache.set(key, audio)
+        return audio
+
+    def stats(self) -> dict:
+        return {
+            "audio_cache_hits": self.hits,
+            "audio_cache_misses": self.misses,
+            "audio_cache_chars": self.cached_chars,
+        }
+
+
+# --- TTS RATE LIMITING ---
+class RateLimitedTTSProvider(TTSProvider):
+    """
+    Acquires from the shared rate limiter before every request, so all
+    workers together stay inside the provider's request and character
+    quotas. Records how long this job waited.
+    """
+
+    def __init__(self, provider: TTSProvider, limiter, bucket: str, credential: str):
+        self.provider = provider
+        self.limiter = limiter
+        self.bucket = bucket
+        self.credential = credential
+        self._lock = threading.Lock()
+        self.wait_seconds = 0.0
+
+    def resolve_voice(self, voice_id: str) -> str:
+        return self.provider.resolve_voice(voice_id)
+
+    @property
+    def provider_name(self) -> str:
+        return self.provider.provider_name
+
+    def text_to_audio(self, text: str, voice_id: str, speed: float) -> bytes:
+        waited = self.limiter.acquire(self.bucket, self.credential, chars=len(text))
+        if waited:
+            with self._lock:
+                self.wait_seconds += waited
+        return self.provider.text_to_audio(text, voice_id, speed)
+
+    def stats(self) -> dict:
+        return {"rate_limit_wait_seconds": round(self.wait_seconds, 3)}
+
+
+class AdaptiveTTSProvider(TTSProvider):
+    """Runs each request inside the provider's AIMD concurrency controller."""
+
+    def __init__(self, provider: TTSProvider, controller):
+        self.provider = provider
+        self.controller = controller
+
+    def resolve_voice(self, voice_id: str) -> str:
+        return self.provider.resolve_voice(voice_id)
+
+    @property
+    def provider_name(self) -> str:
+        return self.provider.provider_name
+
+    def text_to_audio(self, text: str, voice_id: str, speed: float) -> bytes:
+        with self.controller.slot():
+            return self.provider.text_to_audio(text, voice_id, speed)
+
+
 # --- TTS MANAGER ---
 class TTSManager:
+    # Per-request input limits, measured the way each provider counts them,
+    # so chunks are as large as each provider accepts.
+    CHUNK_LIMITS = {
+        # 4096 characters of input
+        "openai": ChunkLimit(4096),
+        # 5000 bytes of input text
+        "google": ChunkLimit(5000, max_size=5000, size=utf8_bytes),
+        # 3000 billed characters, 6000 characters of SSML including markup
+        "aws_polly": ChunkLimit(3000, max_size=5900, size=escaped_length),
+        # Keep escaped SSML well inside the 10-minute audio cap
+        "azure": ChunkLimit(5000, max_size=5000, size=escaped_length),
+        # eleven_multilingual_v2 accepts 10,000 characters
+        "eleven_labs": ChunkLimit(10000),
+    }
+    DEFAULT_CHUNK_LIMIT = ChunkLimit(4500)
+
+    # Environment variable holding each provider's credential; quotas are
+    # per account, so rate limit buckets are keyed by it.
+    CREDENTIAL_ENV = {
+        "openai": "OPENAI_API_KEY",
+        "google": "GOOGLE_APPLICATION_CREDENTIALS",
+        "aws_polly": "AWS_ACCESS_KEY_ID",
+        "azure": "AZURE_SPEECH_KEY",
+        "eleven_labs": "ELEVENLABS_API_KEY",
+    }
+
     def __init__(self):
         self._provider_map = {
             "openai": OpenAITTS,
@@ -193,11 +658,36 @@ class TTSManager:
         self._instances[provider_name] = instance
         return instance
 
+    def credential_id(self, provider_name: str) -> str:
+        env_var = self.CREDENTIAL_ENV.get(provider_name)
+        return credential_id(os.getenv(env_var) if env_var else None)
+
+    def chunk_limit(self, provider_name: str) -> ChunkLimit:
+        if os.getenv("TESTING_MODE", "False").lower() == "true":
+            return self.DEFAULT_CHUNK_LIMIT
+        return self.CHUNK_LIMITS.get(provider_name, self.DEFAULT_CHUNK_LIMIT)
+
 
 # --- PDF PIPELINE ---
 class PDFToAudioPipeline:
     def __init__(self):
         self.tts_manager = TTSManager()
+        self.rate_limiter = build_rate_limiter(
+            settings.RATE_LIMIT_ENABLED, settings.REDIS_URL, settings.RATE_LIMITS
+        )
+        self.llm_cache = self._build_llm_cache()
+        self.audio_cache = build_tiered_cache(
+            settings.AUDIO_CACHE_ENABLED,
+            settings.AUDIO_CACHE_DIR,
+            settings.AUDIO_CACHE_MAX_MB,
+            settings.AUDIO_CACHE_S3_PREFIX,
+        )
+        self.extraction_cache = build_tiered_cache(
+            settings.EXTRACTION_CACHE_ENABLED,
+            settings.EXTRACTION_CACHE_DIR,
+            settings.EXTRACTION_CACHE_MAX_MB,
+            settings.EXTRACTION_CACHE_S3_PREFIX,
+        )
 
     def process_pdf(
         self,
@@ -208,71 +698,266 @@ class PDFToAudioPipeline:
         include_summary: bool = False,
         conversion_mode: str = "full",
         progress_callback: Optional[Callable[[int], None]] = None,
-        work_dir: Optional[str] = None
-    ) -> tuple[str, float, dict]:
+        work_dir: Optional[str] = None,
+        checkpoint=None,
+        output_key: Optional[str] = None,
+        open_upload: Optional[Callable[[], StreamingUpload]] = None,
+        output_format: str = "mp3",
+        hls: Optional[HLSWriter] = None,
+        output_profile: str = "standard",
+    ) -> tuple[Optional[str], float, dict]:
         from loguru import logger
         logger.info(f"🚀 Starting PDF processing: provider='{voice_provider}', voice='{voice_type}', mode='{conversion_mode}', summary='{include_summary}'")
         
         usage_stats = {"chars": 0, "tokens": 0}
+        # The LLM cache outlives the job, so its counters are diffed
+        llm_cache_start = self._llm_cache_counts()
         
         try:
             if progress_callback:
                 progress_callback(5)
-            raw_text = self._extract_text(pdf_path)
-
-            if not raw_text.strip():
-                raise ValueError("No text could be extracted from the PDF.")
-
-            if progress_callback:
-                progress_callback(15)
-            cleaned_text = self._advanced_text_cleanup(raw_text)
 
-            final_text, tokens_used = self._get_final_text(
-                cleaned_text, include_summary, conversion_mode, progress_callback
+            cache_key = self._extraction_cache_key(pdf_path)
+            cached_extraction = self._load_cached_extraction(cache_key)
+            m4b = str(output_format).lower() == "m4b"
+            profile = load_profile(output_profile, settings.OUTPUT_PROFILES)
+            # Provider-side synthesis needs the whole text up front, and
+            # leaves no local file to mux chapters into or re-encode
+            long_form_provider = (
+                None if m4b or not profile.passthrough
+                else self._long_form_provider(voice_provider)
+            )
+            streaming = (
+                settings.PIPELINE_STREAMING
+                and cached_extraction is None
+                and str(conversion_mode).lower() == "full"
+                and not include_summary
+                and long_form_provider is None
+            )
+            llm_streaming = settings.LLM_STREAMING_TTS and str(conversion_mode).lower() in (
+                "explanation", "summary_explanation"
             )
-            usage_stats["tokens"] += tokens_used
-
-            if progress_callback:
-                progress_callback(35)
-            
-            # Smart chunking for TTS safety (Google has 5000 char limit)
-            chunks = self._chunk_text_for_tts(final_text)
 
-            tts_provider = self.tts_manager.get_provider(voice_provider)
+            tts_provider = base_provider = self.tts_manager.get_provider(voice_provider)
+            native_provider = None
+            if profile.codec == "mp3" and profile.bitrate_kbps and not m4b:
+                # Asking the provider for the bitrate saves both the bytes
+                # and an encode pass
+                native_provider = tts_provider.with_mp3_bitrate(profile.bitrate_kbps)
+                if native_provider is not None:
+                    tts_provider = native_provider
+            audio_format = tts_provider.audio_format
+            # Otherwise the assembled MP3 is encoded once at the end
+            encode = not m4b and not profile.passthrough and native_provider is None
+            chunk_limit = self.tts_manager.chunk_limit(voice_provider)
+            concurrency = settings.TTS_CONCURRENCY.get(
+                voice_provider, settings.TTS_DEFAULT_CONCURRENCY
+            )
+            if settings.ADAPTIVE_CONCURRENCY_ENABLED:
+                # TTS_CONCURRENCY becomes the starting point; the controller
+                # finds what the provider will take from there.
+                controller = get_controller(
+                    f"tts:{voice_provider}", concurrency, settings.ADAPTIVE_CONCURRENCY_MAX
+                )
+                tts_provider = AdaptiveTTSProvider(tts_provider, controller)
+                concurrency = controller.max_limit
+            rate_limited = None
+            if self.rate_limiter:
+                # Below the cache, so cache hits don't spend quota
+                tts_provider = rate_limited = RateLimitedTTSProvider(
+                    tts_provider,
+                    self.rate_limiter,
+                    voice_provider,
+                    self.tts_manager.credential_id(voice_provider),
+                )
+            if self.audio_cache:
+                # Fresh wrapper per job so hit/miss counters are per job
+                tts_provider = CachedTTSProvider(tts_provider, self.audio_cache, audio_format)
 
             # Create a localized temporary directory if not provided
             local_temp_dir = None
             if not work_dir:
                 local_temp_dir = tempfile.TemporaryDirectory()
                 work_dir = local_temp_dir.name
+
+            text_parts: Optional[List[str]] = None
+            # Last page each chunk reaches, to place chapter marks; only the
+            # verbatim text follows the page order of the PDF outline
+            chunk_pages: Optional[List[int]] = None
+            toc: List[tuple[str, int]] = []
+            if m4b and str(conversion_mode).lower() == "full" and not include_summary:
+                chunk_pages = []
+                toc = table_of_contents(pdf_path, settings.M4B_CHAPTER_LEVEL)
+            # Chunks are cut where chapters start, so marks land exactly there
+            chapter_pages = sorted({page for _, page in toc})
+            if streaming:
+                # Pages flow through cleanup and chunking while later pages are
+                # still being extracted/OCR'd, so synthesis starts early.
+                text_parts = []
+                chunk_stream = self._stream_chunks(
+                    pdf_path, cache_key, text_parts, usage_stats, chunk_limit,
+                    chunk_pages, chapter_pages,
+                )
+            elif llm_streaming:
+                pages, cleaned_text, chars_removed = cached_extraction or self._extract_and_clean(
+                    pdf_path, progress_callback, check_cache=False
+                )
+                usage_stats["chars_removed"] = chars_removed
+                if progress_callback:
+                    progress_callback(25)
+                # Chunks are synthesized while the LLM is still writing
+                text_parts = []
+                chunk_stream = self._stream_explanation_chunks(
+                    cleaned_text, text_parts, usage_stats, chunk_limit
+                )
+            else:
+                pages, cleaned_text, chars_removed = cached_extraction or self._extract_and_clean(
+                    pdf_path, progress_callback, check_cache=False
+                )
+                usage_stats["chars_removed"] = chars_removed
+
+                final_text, tokens_used = self._get_final_text(
+                    cleaned_text, include_summary, conversion_mode, progress_callback
+                )
+                usage_stats["tokens"] += tokens_used
+
+                if progress_callback:
+                    progress_callback(35)
+
+                if long_form_provider and len(final_text) >= settings.LONG_FORM_MIN_CHARS:
+                    audio_path = self._synthesize_long_form(
+                        long_form_provider, voice_provider, final_text, voice_type,
+                        reading_speed, work_dir, output_key, progress_callback, usage_stats,
+                    )
+                    estimated_cost = self._calculate_cost(voice_provider, voice_type, final_text)
+                    usage_stats.update(self._llm_cache_stats(llm_cache_start))
+                    if progress_callback:
+                        progress_callback(100)
+                    return audio_path, estimated_cost, usage_stats
             
-            chunk_files = []
-            
-            # Process chunks and save to disk immediately
+                if chunk_pages is not None:
+                    tagged_chunks = self._page_tagged_chunks(pages, chunk_limit, chapter_pages)
+                    chunks = [chunk for chunk, _ in tagged_chunks]
+                    chunk_pages.extend(page for _, page in tagged_chunks)
+                else:
+                    # Smart chunking for TTS safety (Google has 5000 char limit)
+                    chunks = self._chunk_text_for_tts(
+                        final_text, chunk_limit.max_chars, chunk_limit.fits
+                    )
+                # Progress reached once each chunk is done
+                chunk_stream = (
+                    (chunk, 40 + int(((i + 1) / len(chunks)) * 55))
+                    for i, chunk in enumerate(chunks)
+                )
+
+            chunk_progress = {}
             char_count = 0
-            for i, chunk in enumerate(chunks):
-                progress = 40 + int((i / len(chunks)) * 55)
-                if progress_callback:
-                    progress_callback(progress)
-                
-                char_count += len(chunk)
 
-                audio_data = tts_provider.text_to_audio(
-                    chunk, voice_type, reading_speed
+            def counted_chunks():
+                nonlocal char_count
+                for i, (chunk, progress) in enumerate(chunk_stream):
+                    chunk_progress[i] = progress
+                    char_count += len(chunk)
+                    yield chunk
+
+            last_progress = 0
+
+            def report_progress(completed: int, index: int) -> None:
+                nonlocal last_progress
+                # By how many chunks are done, not which one: with chunks in
+                # flight concurrently, a late chunk can finish first
+                progress = min(chunk_progress.get(completed - 1, 40), 95)
+                if progress > last_progress:
+                    last_progress = progress
+                    if progress_callback:
+                        progress_callback(progress)
+
+            synthesizer = ChunkSynthesizer(
+                tts_provider,
+                voice_type,
+                reading_speed,
+                work_dir,
+                concurrency=concurrency,
+                max_retries=settings.TTS_CHUNK_MAX_RETRIES,
+                checkpoint=checkpoint,
+            )
+            # Chunks are appended to the final file as soon as they (and all
+            # before them) land, instead of in one pass at the end, and the
+            # file is uploaded part by part as it grows (M4B and re-encoded
+            # profiles are written after), and published as a live HLS playlist
+            upload = open_upload() if open_upload and not (m4b or encode) else None
+            assembler = StreamingAssembler(
+                os.path.join(work_dir, "final_output.mp3"),
+                lambda files: self._assemble_audio_chapters(files, work_dir),
+                sinks=[sink.write for sink in (upload, hls) if sink],
+            )
+            try:
+                chunk_files = synthesizer.synthesize(
+                    counted_chunks(), on_progress=report_progress, on_chunk=assembler.add
                 )
-                
-                chunk_path = os.path.join(work_dir, f"chunk_{i:04d}.mp3")
-                with open(chunk_path, "wb") as f:
-                    f.write(audio_data)
-                
-                chunk_files.append(chunk_path)
+            except Exception:
+                if upload:
+                    upload.abort()
+                if hls:
+                    hls.close()
+                raise
+            finally:
+                assembler.close()
+            logger.info(f"🔊 Synthesized {len(chunk_files)} chunks ({char_count} chars)")
+
+            if text_parts is not None:
+                final_text = " ".join(text_parts)
             
             usage_stats["chars"] = char_count
+            if isinstance(tts_provider, CachedTTSProvider):
+                usage_stats.update(tts_provider.stats())
+            if rate_limited:
+                usage_stats.update(rate_limited.stats())
+            if checkpoint:
+                usage_stats.update(checkpoint.stats())
 
             if progress_callback:
                 progress_callback(95)
             
-            final_audio_path = self._assemble_audio_chapters(chunk_files, work_dir)
+            try:
+                final_audio_path = assembler.finish(len(chunk_files))
+                if assembler.appended == len(chunk_files):
+                    usage_stats["audio_seconds"] = round(assembler.duration, 3)
+                    if upload:
+                        upload.complete()
+                        # Already in the bucket at the upload's key
+                        final_audio_path = None
+                elif upload:
+                    # ffmpeg rewrote the file; the caller uploads it whole
+                    upload.abort()
+            except Exception:
+                if upload:
+                    upload.abort()
+                raise
+            finally:
+                if hls:
+                    # Ends the playlist even if the ffmpeg fallback cut it short
+                    hls.finish()
+            if m4b or not profile.passthrough:
+                assembled_bytes = os.path.getsize(final_audio_path or assembler.output_path)
+                if m4b:
+                    final_audio_path = self._write_m4b(
+                        final_audio_path, work_dir, toc,
+                        assembler.chunk_durations, chunk_pages, usage_stats, profile,
+                    )
+                elif encode:
+                    final_audio_path = encode_audio(
+                        final_audio_path,
+                        os.path.join(work_dir, f"final_output.{profile.extension}"),
+                        profile,
+                    )
+                usage_stats["bytes_saved"] = self._bytes_saved(
+                    assembled_bytes,
+                    final_audio_path,
+                    assembler,
+                    len(chunk_files),
+                    base_provider if native_provider not in (None, base_provider) else None,
+                )
             
             # If we created a local temp dir, we need to ensure the final file 
             # is moved out or persisted before the dir is cleaned up.
@@ -302,6 +987,7 @@ class PDFToAudioPipeline:
             estimated_cost = self._calculate_cost(
                 voice_provider, voice_type, final_text
             )
+            usage_stats.update(self._llm_cache_stats(llm_cache_start))
 
             if progress_callback:
                 progress_callback(100)
@@ -310,6 +996,163 @@ class PDFToAudioPipeline:
         except Exception as e:
             raise Exception(f"PDF processing failed: {str(e)}")
 
+    def _write_m4b(
+        self,
+        audio_path: str,
+        work_dir: str,
+        toc: List[tuple[str, int]],
+        chunk_durations: List[float],
+        chunk_pages: Optional[List[int]],
+        usage_stats: dict,
+        profile: Optional[OutputProfile] = None,
+    ) -> str:
+        """
+        Turn the assembled MP3 into an M4B, with chapters from the PDF outline
+        timed by the chunk durations read off the MP3 frame headers. Chapters
+        are skipped when a chunk's duration is unknown (ffmpeg fallback). The
+        output profile's bitrate and channels apply, if it sets a bitrate.
+        """
+        from loguru import logger
+        chapters = []
+        if chunk_pages is not None and len(chunk_durations) == len(chunk_pages):
+            chapters = chapters_from_toc(toc, chunk_pages, chunk_durations)
+        elif chunk_pages is not None:
+            logger.warning("⚠️ Chunk durations unavailable; writing M4B without chapters")
+        usage_stats["chapters"] = len(chapters)
+        bitrate = settings.M4B_BITRATE
+        if profile and profile.bitrate_kbps:
+            bitrate = f"{profile.bitrate_kbps}k"
+        return mux_m4b(
+            audio_path,
+            os.path.join(work_dir, "final_output.m4b"),
+            chapters,
+            bitrate=bitrate,
+            channels=profile.channels if profile else None,
+        )
+
+    @staticmethod
+    def _bytes_saved(
+        assembled_bytes: int,
+        final_audio_path: Optional[str],
+        assembler: StreamingAssembler,
+        chunk_count: int,
+        default_provider: Optional[TTSProvider],
+    ) -> int:
+        """
+        Bytes the output profile saved against the provider's default audio.
+        That is the assembled MP3, unless the provider returned the profile's
+        bitrate itself (``default_provider`` set), in which case it is
+        estimated from the duration at the provider's default bitrate.
+        """
+        baseline = assembled_bytes
+        if (
+            default_provider is not None
+            and default_provider.DEFAULT_KBPS
+            and assembler.appended == chunk_count
+        ):
+            baseline = round(assembler.duration * default_provider.DEFAULT_KBPS * 125)
+        output = os.path.getsize(final_audio_path) if final_audio_path else assembled_bytes
+        return max(baseline - output, 0)
+
+    def _long_form_provider(self, voice_provider: str) -> Optional[TTSProvider]:
+        if not settings.LONG_FORM_TTS_ENABLED:
+            return None
+        provider = self.tts_manager.get_provider(voice_provider)
+        return provider if hasattr(provider, "synthesize_long_form") else None
+
+    def _long_form_s3_client(self):
+        # Polly writes to AWS S3 itself, whatever endpoint app storage uses
+        return boto3.client(
+            "s3",
+            region_name=settings.AWS_REGION,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        )
+
+    def _synthesize_long_form(
+        self,
+        provider,
+        voice_provider: str,
+        text: str,
+        voice_type: str,
+        speed: float,
+        work_dir: str,
+        output_key: Optional[str],
+        progress_callback: Optional[Callable[[int], None]],
+        usage_stats: dict,
+    ) -> Optional[str]:
+        """
+        Render the whole text with the provider's server-side long-form
+        synthesis, which writes to object storage instead of streaming audio
+        through the worker.
+
+        Polly's MP3 objects are concatenated inside S3 into ``output_key`` of
+        the app bucket, and None is returned: the audio never touches the
+        worker. If that isn't possible (no ``output_key``, a non-AWS storage
+        endpoint, or parts under the S3 minimum) they are streamed to disk
+        and assembled as usual. Google's WAV output is transcoded to MP3 by
+        ffmpeg straight from Cloud Storage. Returns the local MP3 path then.
+        """
+        limit = provider.LONG_FORM_LIMIT
+        texts = chunk_text(text, limit.max_chars, limit.fits)
+        prefix = f"{settings.LONG_FORM_PREFIX}{uuid.uuid4().hex}/"
+        usage_stats["chars"] = len(text)
+        usage_stats["long_form_tasks"] = len(texts)
+
+        def on_done(done: int, total: int) -> None:
+            if progress_callback:
+                progress_callback(40 + int(50 * done / total))
+
+        if voice_provider == "google":
+            bucket = settings.GOOGLE_LONG_AUDIO_GCS_BUCKET
+            if not bucket:
+                raise Exception("GOOGLE_LONG_AUDIO_GCS_BUCKET is required for Google long-form synthesis")
+            headers = None
+            try:
+                uris = provider.synthesize_long_form(
+                    texts, voice_type, speed, bucket, prefix,
+                    settings.LONG_FORM_POLL_SECONDS, settings.LONG_FORM_TIMEOUT_SECONDS, on_done,
+                )
+                # Fetched after synthesis, which can outlast an access token
+                headers = provider.gcs_auth_headers()
+                return transcode_to_mp3(
+                    [gcs_http_url(uri) for uri in uris],
+                    os.path.join(work_dir, "final_output.mp3"),
+                    headers,
+                )
+            finally:
+                # Also the output of operations that finished before a
+                # failure; cleanup must never replace the job's real error
+                try:
+                    delete_gcs_objects(
+                        [provider.long_form_uri(bucket, prefix, i) for i in range(len(texts))],
+                        headers or provider.gcs_auth_headers(),
+                    )
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not clean up long-form output under {prefix}: {e}")
+
+        bucket = settings.LONG_FORM_S3_BUCKET or settings.S3_BUCKET_NAME
+        s3_client = self._long_form_s3_client()
+        try:
+            keys = provider.synthesize_long_form(
+                texts, voice_type, speed, bucket, prefix,
+                settings.LONG_FORM_POLL_SECONDS, settings.LONG_FORM_TIMEOUT_SECONDS, on_done,
+            )
+            if (
+                output_key
+                and settings.S3_BUCKET_NAME
+                and not settings.AWS_ENDPOINT_URL
+                and assemble_s3_objects(s3_client, bucket, keys, settings.S3_BUCKET_NAME, output_key)
+            ):
+                logger.info(f"📚 Assembled {len(keys)} long-form parts in S3 at {output_key}")
+                return None
+            paths = download_s3_objects(s3_client, bucket, keys, work_dir)
+            return self._assemble_audio_chapters(paths, work_dir)
+        finally:
+            # Task outputs land under the job's prefix, so this also catches
+            # those of tasks that finished before a failure or the timeout
+            delete_s3_prefix(s3_client, bucket, prefix)
+
     def _get_final_text(self, cleaned_text, include_summary, conversion_mode, progress_callback) -> tuple[str, int]:
         from loguru import logger
         mode = str(conversion_mode).lower()
@@ -359,61 +1202,268 @@ class PDFToAudioPipeline:
         
         return round(cost, 6)
 
-    def _extract_text(self, pdf_path: str) -> str:
-        text = ""
+    def _extraction_cache_key(self, pdf_path: str) -> str:
+        # Settings that change the extracted or cleaned text; worker counts don't
+        extraction_settings = {
+            "ocr_dpi": settings.OCR_DPI,
+            "ocr_page_min_chars": settings.OCR_PAGE_MIN_CHARS,
+            "strip_repeated_lines": settings.STRIP_REPEATED_LINES,
+            "repeated_line_min_pages": settings.REPEATED_LINE_MIN_PAGES,
+            "repeated_line_min_fraction": settings.REPEATED_LINE_MIN_FRACTION,
+            "repeated_line_lookahead_pages": settings.REPEATED_LINE_LOOKAHEAD_PAGES,
+        }
+        settings_hash = hashlib.sha256(
+            json.dumps(extraction_settings, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        return f"{sha256_file(pdf_path)}-v{EXTRACTOR_VERSION}-{settings_hash[:16]}.json.gz"
+
+    def _load_cached_extraction(self, cache_key: str) -> Optional[tuple[List[str], str, int]]:
+        from loguru import logger
+        if not self.extraction_cache:
+            return None
+        cached = self.extraction_cache.get(cache_key)
+        if cached is None:
+            return None
+        entry = json.loads(gzip.decompress(cached))
+        logger.info(f"♻️ Extraction cache hit ({cache_key}), skipping extraction")
+        return entry["pages"], entry["cleaned_text"], entry["chars_removed"]
+
+    def _store_cached_extraction(
+        self, cache_key: str, pages: List[str], cleaned_text: str, chars_removed: int
+    ) -> None:
+        if self.extraction_cache:
+            entry = {
+                "pages": pages,
+                "cleaned_text": cleaned_text,
+                "chars_removed": chars_removed,
+            }
+            self.extraction_cache.set(
+                cache_key, gzip.compress(json.dumps(entry).encode("utf-8"))
+            )
+
+    def _extract_and_clean(
+        self,
+        pdf_path: str,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        check_cache: bool = True,
+    ) -> tuple[List[str], str, int]:
+        """
+        Return (per-page raw text, cleaned text, characters of running
+        headers/footers removed), served from the extraction cache when this
+        exact PDF has been extracted before.
+        """
+        cache_key = self._extraction_cache_key(pdf_path)
+        if check_cache:
+            cached = self._load_cached_extraction(cache_key)
+            if cached is not None:
+                return cached
+
+        pages = self._extract_pages(pdf_path)
+        if progress_callback:
+            progress_callback(15)
+
+        # Page by page, the same way the streaming path cleans
+        repeated_lines = self._repeated_line_filter()
+        cleaned_text = " ".join(normalize_pages(self._strip_repeated_lines(pages, repeated_lines)))
+        if not cleaned_text:
+            raise ValueError("No text could be extracted from the PDF.")
+
+        chars_removed = repeated_lines.chars_removed if repeated_lines else 0
+        self._store_cached_extraction(cache_key, pages, cleaned_text, chars_removed)
+        return pages, cleaned_text, chars_removed
+
+    def _stream_chunks(
+        self,
+        pdf_path: str,
+        cache_key: str,
+        text_parts: List[str],
+        usage_stats: dict,
+        chunk_limit: ChunkLimit = TTSManager.DEFAULT_CHUNK_LIMIT,
+        chunk_pages: Optional[List[int]] = None,
+        chapter_pages: Sequence[int] = (),
+    ) -> Iterator[tuple[str, int]]:
+        """
+        Yield (chunk, progress) while extraction is still running.
+
+        A background thread extracts pages, cleans each one and feeds them
+        through the incremental chunker; cleaned page text is appended to
+        ``text_parts`` so the caller can cost the full text afterwards, and
+        ``usage_stats["chars_removed"]`` is set once extraction finishes.
+        If given, ``chunk_pages`` gets the index of the last page each chunk
+        reaches before the chunk is yielded, and a chunk starts at each of
+        ``chapter_pages``.
+        """
         try:
-            with fitz.open(pdf_path) as doc:
-                for page in doc:
-                    text += page.get_text()
-            if len(text.strip()) < 100:  # Threshold for considering OCR
-                return self._ocr_pdf(pdf_path)
-            return text
+            total_pages = page_count(pdf_path)
         except Exception:
-            return self._ocr_pdf(pdf_path)
+            total_pages = 0
+
+        def produce() -> Iterator[tuple[str, int]]:
+            pages: List[str] = []
+            pages_done = 0
+            repeated_lines = self._repeated_line_filter()
+
+            def extracted_pages() -> Iterator[str]:
+                for page in self._iter_pages(pdf_path):
+                    pages.append(page)
+                    yield page
+
+            def cleaned_pages() -> Iterator[tuple[str, int]]:
+                nonlocal pages_done
+                stripped = self._strip_repeated_lines(
+                    extracted_pages(), repeated_lines,
+                    lookahead=settings.REPEATED_LINE_LOOKAHEAD_PAGES,
+                )
+                for page in stripped:
+                    pages_done += 1
+                    cleaned = self._advanced_text_cleanup(page)
+                    if cleaned:
+                        text_parts.append(cleaned)
+                        yield cleaned, pages_done
+
+            # Tagged with pages done, one past the page index
+            breaks = [page + 1 for page in chapter_pages]
+            for chunk, pages_done in self._iter_chunks_for_tts(
+                cleaned_pages(), chunk_limit.max_chars, chunk_limit.fits, breaks
+            ):
+                progress = 5 + int(90 * pages_done / total_pages) if total_pages else 40
+                if chunk_pages is not None:
+                    chunk_pages.append(pages_done - 1)
+                yield chunk, min(progress, 95)
+
+            if not text_parts:
+                raise ValueError("No text could be extracted from the PDF.")
+            chars_removed = repeated_lines.chars_removed if repeated_lines else 0
+            usage_stats["chars_removed"] = chars_removed
+            self._store_cached_extraction(
+                cache_key, pages, " ".join(text_parts), chars_removed
+            )
+
+        return iterate_in_background(produce, maxsize=settings.PIPELINE_QUEUE_SIZE)
+
+    def _page_tagged_chunks(
+        self,
+        pages: List[str],
+        chunk_limit: ChunkLimit = TTSManager.DEFAULT_CHUNK_LIMIT,
+        chapter_pages: Sequence[int] = (),
+    ) -> List[tuple[str, int]]:
+        """
+        The chunks of the cleaned text, each tagged with the index of the
+        last page it reaches. Without ``chapter_pages`` they are the same as
+        chunking ``cleaned_text``; with them, a chunk starts at each one.
+        """
+        repeated_lines = self._repeated_line_filter()
+
+        def cleaned_pages() -> Iterator[tuple[str, int]]:
+            stripped = self._strip_repeated_lines(pages, repeated_lines)
+            for index, page in enumerate(stripped):
+                cleaned = self._advanced_text_cleanup(page)
+                if cleaned:
+                    yield cleaned, index
+
+        return list(
+            self._iter_chunks_for_tts(
+                cleaned_pages(), chunk_limit.max_chars, chunk_limit.fits, chapter_pages
+            )
+        )
+
+    def _repeated_line_filter(self) -> Optional[RepeatedLineFilter]:
+        if not settings.STRIP_REPEATED_LINES:
+            return None
+        return RepeatedLineFilter(
+            min_repeats=settings.REPEATED_LINE_MIN_PAGES,
+            min_fraction=settings.REPEATED_LINE_MIN_FRACTION,
+        )
+
+    def _strip_repeated_lines(
+        self,
+        pages: Iterable[str],
+        repeated_lines: Optional[RepeatedLineFilter],
+        lookahead: Optional[int] = None,
+    ) -> Iterable[str]:
+        """Drop running headers/footers/page numbers so they aren't billed as TTS."""
+        from loguru import logger
+        if repeated_lines is None:
+            yield from pages
+            return
+        yield from repeated_lines.filter(pages, lookahead=lookahead)
+        if repeated_lines.lines_removed:
+            logger.info(
+                f"✂️ Removed {repeated_lines.lines_removed} repeated header/footer lines "
+                f"({repeated_lines.chars_removed} chars)"
+            )
+
+    def _extract_text(self, pdf_path: str) -> str:
+        return "".join(self._extract_pages(pdf_path))
+
+    def _extract_pages(self, pdf_path: str) -> List[str]:
+        return list(self._iter_pages(pdf_path))
+
+    def _iter_pages(self, pdf_path: str) -> Iterator[str]:
+        """
+        Yield page text in order, OCR-ing only the pages whose text layer is
+        unusable. OCR results stream in as the pool finishes them. Falls back
+        to whole-document OCR if fitz can't read the file.
+        """
+        from loguru import logger
+        try:
+            pages = extract_pages(
+                pdf_path,
+                workers=default_workers(settings.PDF_EXTRACTION_WORKERS),
+                min_pages_for_parallel=settings.PDF_PARALLEL_EXTRACTION_MIN_PAGES,
+            )
+            ocr_targets = pages_needing_ocr(
+                pdf_path, pages, min_chars=settings.OCR_PAGE_MIN_CHARS
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Text layer extraction failed ({e}), falling back to full OCR")
+            yield self._ocr_pdf(pdf_path)
+            return
+
+        if ocr_targets:
+            logger.info(f"🔎 OCR needed for {len(ocr_targets)}/{len(pages)} pages")
+        ocr_results = self._iter_ocr(pdf_path, ocr_targets)
+        ocr_target_set = set(ocr_targets)
+        for page_number, text in enumerate(pages):
+            if page_number in ocr_target_set:
+                _, ocr_text = next(ocr_results)
+                # A failed page keeps whatever text layer it had
+                if ocr_text is not None:
+                    text = ocr_text
+            yield text
 
     def _ocr_pdf(self, pdf_path: str) -> str:
-        text = ""
+        """OCR every page, rendering one page at a time to keep memory flat."""
         try:
-            images = convert_from_path(pdf_path, dpi=300)
-            for image in images:
-                text += pytesseract.image_to_string(image, lang="eng") + "\n"
-            return text
+            try:
+                page_texts = self._iter_ocr(pdf_path)
+                return "".join(text or "" for _, text in page_texts)
+            except fitz.FileDataError:
+                # fitz can't parse the file at all; let poppler rasterize it
+                page_texts = self._iter_ocr(pdf_path, renderer="poppler")
+                return "".join(text or "" for _, text in page_texts)
         except Exception as e:
             raise Exception(f"OCR extraction failed: {str(e)}")
 
+    def _iter_ocr(self, pdf_path: str, page_numbers=None, renderer: str = "fitz"):
+        return iter_ocr_pages(
+            pdf_path,
+            page_numbers,
+            dpi=settings.OCR_DPI,
+            workers=default_workers(settings.OCR_WORKERS),
+            renderer=renderer,
+        )
+
     def _advanced_text_cleanup(self, text: str) -> str:
-        text = re.sub(r"\n\s*\n", "\n", text)
-        text = re.sub(r"\s+", " ", text)
-        replacements = {
-            "â": "-",
-            "â": '"',
-            "â": '"',
-            "â": "'",
-            "â¦": "...",
-            "â¢": "*",
-            "â€™": "'",
-            "â€˜": "'",
-            "â€œ": '"',
-            "â€ť": '"',
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        text = text.replace("ﬁ", "fi").replace("ﬂ", "fl")
-        text = re.sub(r"\s{2,}", " ", text)
-        return text.strip()
+        return normalize_text(text)
 
     def _generate_summary(self, text: str) -> tuple[str, int]:
         """Generate a concise summary of the text."""
         from loguru import logger
         try:
             system_prompt = "Summarize the following text in about 150 words."
-            user_content = text[:20000] if len(text) > 20000 else text # Flash has large context
-            
-            summary, tokens = self._call_llm_with_retry(
-                system_prompt=system_prompt,
-                user_content=user_content,
-                max_tokens=600,
-                temperature=0.3
+            summary, tokens = self._summarizer(temperature=0.3).run(
+                system_prompt, text, max_tokens=600
             )
             logger.info(f"✅ Summary generated: {len(summary)} chars, {tokens} tokens")
             return summary, tokens
@@ -423,20 +1473,16 @@ class PDFToAudioPipeline:
                 logger.error("❌ CRITICAL: LLM API key is missing or invalid. Check your environment variables.")
             return text[:500] + "...", 0
 
+    CONCEPT_EXPLANATION_PROMPT = """Analyze the provided text and create a comprehensive explanation of its core concepts.
+                Focus on explaining key ideas, methodologies, findings, and conclusions in a narrative form suitable for audio conversion.
+                Make the explanation educational and accessible, as if teaching the concepts to someone new to the topic."""
+
     def _generate_concept_explanation(self, text: str) -> tuple[str, int]:
         """Generate a comprehensive explanation of core concepts from the text."""
         from loguru import logger
         try:
-            system_prompt = """Analyze the provided text and create a comprehensive explanation of its core concepts.
-                Focus on explaining key ideas, methodologies, findings, and conclusions in a narrative form suitable for audio conversion.
-                Make the explanation educational and accessible, as if teaching the concepts to someone new to the topic."""
-            user_content = text[:20000] if len(text) > 20000 else text
-
-            explanation, tokens = self._call_llm_with_retry(
-                system_prompt=system_prompt,
-                user_content=user_content,
-                max_tokens=4000,
-                temperature=0.2
+            explanation, tokens = self._summarizer(temperature=0.2).run(
+                self.CONCEPT_EXPLANATION_PROMPT, text, max_tokens=4000
             )
             logger.info(f"✅ Concept explanation generated: {len(explanation)} chars, {tokens} tokens")
             return explanation, tokens
@@ -444,46 +1490,206 @@ class PDFToAudioPipeline:
             logger.warning(f"⚠️ Concept explanation error: {e}")
             if "api_key" in str(e).lower() or "401" in str(e):
                 logger.error("❌ CRITICAL: LLM API key is missing or invalid. Check your environment variables.")
-            # Fallback: generate a basic summary-style explanation
-            return f"This document explores key concepts and ideas. {text[:1000]}... The main themes and conclusions are presented in a structured format suitable for understanding the core content.", 0
+            return self._concept_explanation_fallback(text), 0
 
-    def _call_llm_with_retry(self, system_prompt: str, user_content: str, max_tokens: int, temperature: float, max_retries: int = 5) -> tuple[str, int]:
-        """Call LLM with exponential backoff to handle rate limits."""
-        import time
-        from loguru import logger
-        
+    def _concept_explanation_fallback(self, text: str) -> str:
+        # Fallback: generate a basic summary-style explanation
+        return f"This document explores key concepts and ideas. {text[:1000]}... The main themes and conclusions are presented in a structured format suitable for understanding the core content."
+
+    def _stream_concept_explanation(self, text: str, usage: dict) -> Iterator[str]:
+        """
+        Streaming _generate_concept_explanation: yields the explanation as the
+        LLM writes it, adding tokens used to ``usage["tokens"]``. Failures
+        before any output fall back as before; once audio is under way they
+        fail the job.
+        """
+        started = False
+        try:
+            pieces = self._summarizer(temperature=0.2).stream(
+                self.CONCEPT_EXPLANATION_PROMPT,
+                text,
+                4000,
+                lambda system_prompt, user_content, max_tokens, usage: self._stream_llm(
+                    system_prompt, user_content, max_tokens, 0.2, usage
+                ),
+                usage,
+            )
+            for piece in pieces:
+                started = True
+                yield piece
+        except Exception as e:
+            if started:
+                raise
+            logger.warning(f"⚠️ Concept explanation error: {e}")
+            if "api_key" in str(e).lower() or "401" in str(e):
+                logger.error("❌ CRITICAL: LLM API key is missing or invalid. Check your environment variables.")
+            yield self._concept_explanation_fallback(text)
+
+    def _stream_explanation_chunks(
+        self,
+        text: str,
+        text_parts: List[str],
+        usage_stats: dict,
+        chunk_limit: ChunkLimit = TTSManager.DEFAULT_CHUNK_LIMIT,
+    ) -> Iterator[tuple[str, int]]:
+        """
+        Yield (chunk, progress) for the concept explanation while the LLM is
+        still generating it, so the first chunk is synthesized after roughly
+        one sentence instead of the whole completion. Chunks are appended to
+        ``text_parts`` for costing.
+        """
+        # A full-length explanation is about 4000 tokens of ~4 chars
+        expected_chars = 4000 * 4
+
+        def produce() -> Iterator[tuple[str, int]]:
+            chunker = StreamChunker(
+                chunk_limit.max_chars, chunk_limit.fits, settings.LLM_STREAM_FIRST_CHUNK_CHARS
+            )
+            generated = 0
+            for piece in self._stream_concept_explanation(text, usage_stats):
+                generated += len(piece)
+                progress = 40 + int(54 * min(generated / expected_chars, 1))
+                for chunk in chunker.feed(piece):
+                    text_parts.append(chunk)
+                    yield chunk, progress
+            for chunk in chunker.close():
+                text_parts.append(chunk)
+                yield chunk, 95
+
+        return iterate_in_background(produce, maxsize=settings.PIPELINE_QUEUE_SIZE)
+
+    def _summarizer(self, temperature: float) -> MapReduceSummarizer:
+        """Map-reduce over the whole text, one context-sized section per call."""
+        return MapReduceSummarizer(
+            lambda system_prompt, user_content, max_tokens: self._call_llm_with_retry(
+                system_prompt=system_prompt,
+                user_content=user_content,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            ),
+            section_chars=settings.SUMMARY_SECTION_CHARS,
+            max_workers=settings.SUMMARY_MAX_PARALLEL,
+        )
+
+    def _build_llm_cache(self) -> Optional[TieredCache]:
+        if not settings.LLM_CACHE_ENABLED:
+            return None
+        try:
+            import redis
+
+            client = redis.Redis.from_url(
+                settings.REDIS_URL, socket_timeout=2, socket_connect_timeout=2
+            )
+        except Exception as e:
+            from loguru import logger
+            logger.warning(f"⚠️ LLM cache disabled: {e}")
+            return None
+        # Wrapped in a TieredCache so Redis outages are misses, not failures
+        return TieredCache(
+            RedisCache(client, settings.LLM_CACHE_PREFIX, settings.LLM_CACHE_TTL_SECONDS)
+        )
+
+    def _llm_cache_counts(self) -> tuple[int, int]:
+        if not self.llm_cache:
+            return 0, 0
+        return self.llm_cache.hits, self.llm_cache.misses
+
+    def _llm_cache_stats(self, start: tuple[int, int]) -> dict:
+        """LLM cache hits and misses since ``start`` (from _llm_cache_counts)."""
+        if not self.llm_cache:
+            return {}
+        hits, misses = self._llm_cache_counts()
+        return {"llm_cache_hits": hits - start[0], "llm_cache_misses": misses - start[1]}
+
+    def _llm_cache_key(
+        self, model: str, system_prompt: str, user_content: str, max_tokens: int, temperature: float
+    ) -> str:
+        def digest(value: str) -> str:
+            return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+        identity = "|".join([
+            model, digest(system_prompt), digest(user_content), str(max_tokens), f"{temperature:.2f}"
+        ])
+        return digest(identity)
+
+    def _llm_client(self, api_key: str, base_url: Optional[str]) -> openai.OpenAI:
+        """Pooled per-process client, so calls reuse keep-alive connections."""
+        return get_llm_client(
+            api_key,
+            base_url,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            connect_timeout=settings.LLM_CONNECT_TIMEOUT_SECONDS,
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+            keepalive_expiry=settings.LLM_KEEPALIVE_SECONDS,
+        )
+
+    def _llm_slot(self):
+        if not settings.ADAPTIVE_CONCURRENCY_ENABLED:
+            return contextlib.nullcontext()
+        return get_controller(
+            "llm", settings.LLM_CONCURRENCY, settings.ADAPTIVE_CONCURRENCY_MAX
+        ).slot()
+
+    def _llm_target(self) -> tuple[openai.OpenAI, str, str]:
+        """(client, model, api key) for the configured LLM provider."""
         openrouter_key = settings.OPENROUTER_API_KEY
         openai_key = settings.OPENAI_API_KEY
 
+        api_key = openrouter_key or openai_key
         if openrouter_key:
             logger.info(f"🔗 Using OpenRouter for LLM ({settings.LLM_MODEL})")
-            client = openai.OpenAI(
-                api_key=openrouter_key,
-                base_url="https://openrouter.ai/api/v1",
+            client = self._llm_client(
+                openrouter_key, settings.LLM_BASE_URL or "https://openrouter.ai/api/v1"
             )
             model = settings.LLM_MODEL
         elif openai_key:
             logger.info("🔗 Using direct OpenAI for LLM (gpt-3.5-turbo)")
-            client = openai.OpenAI(api_key=openai_key)
+            client = self._llm_client(openai_key, settings.LLM_BASE_URL or None)
             model = "gpt-3.5-turbo"
         else:
             logger.error("❌ No LLM API key found in settings (OPENROUTER_API_KEY or OPENAI_API_KEY)")
             raise ValueError("No LLM API key configured. Summary/Explanation modes require an API key.")
+        return client, model, api_key
+
+    def _call_llm_with_retry(self, system_prompt: str, user_content: str, max_tokens: int, temperature: float, max_retries: int = 5) -> tuple[str, int]:
+        """Call LLM with exponential backoff to handle rate limits."""
+        import time
+        from loguru import logger
+
+        client, model, api_key = self._llm_target()
+
+        cache_key = self._llm_cache_key(model, system_prompt, user_content, max_tokens, temperature)
+        if self.llm_cache:
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"♻️ LLM cache hit ({model}) for {system_prompt[:50]}...")
+                # Nothing was spent on this call
+                return json.loads(cached)["content"], 0
 
         logger.info(f"🤖 Calling LLM ({model}) for {system_prompt[:50]}...")
         for i in range(max_retries):
-            try:
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_content},
-                    ],
-                    max_tokens=max_tokens,
-                    temperature=temperature,
+            if self.rate_limiter:
+                waited = self.rate_limiter.acquire(
+                    "llm", credential_id(api_key), chars=len(system_prompt) + len(user_content)
                 )
+                if waited:
+                    logger.info(f"⏳ Waited {waited:.2f}s for LLM rate limit")
+            try:
+                with self._llm_slot():
+                    response = client.chat.completions.create(
+                        model=model,
+                        messages=[
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": user_content},
+                        ],
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                    )
                 tokens = response.usage.total_tokens if response.usage else 0
-                return response.choices[0].message.content.strip(), tokens
+                content = response.choices[0].message.content.strip()
+                if self.llm_cache:
+                    self.llm_cache.set(cache_key, json.dumps({"content": content}).encode("utf-8"))
+                return content, tokens
             except Exception as e:
                 # Check for 429 Rate Limit
                 if "429" in str(e) or "rate limit" in str(e).lower():
@@ -498,43 +1704,132 @@ class PDFToAudioPipeline:
         
         raise Exception(f"Max retries ({max_retries}) exceeded for LLM call.")
 
-    def _chunk_text_for_tts(self, text: str, max_chars: int = 4500) -> List[str]:
+    def _stream_llm(
+        self,
+        system_prompt: str,
+        user_content: str,
+        max_tokens: int,
+        temperature: float,
+        usage: dict,
+        max_retries: int = 5,
+    ) -> Iterator[str]:
         """
-        Split text into chunks that are safe for TTS providers (e.g., Google's 5000 character limit).
-        Attempts to split at sentence boundaries (., !, ?) or at the last whitespace if no sentence boundary is found.
+        Streaming _call_llm_with_retry: yields the completion's text as it is
+        generated and adds the tokens used to ``usage["tokens"]``. Rate limits
+        are retried only until the first text arrives; after that it has
+        already gone to synthesis, so errors propagate.
         """
-        if not text:
-            return []
-        
-        if len(text) <= max_chars:
-            return [text]
+        import time
 
-        chunks = []
-        while text:
-            if len(text) <= max_chars:
-                chunks.append(text)
-                break
+        client, model, api_key = self._llm_target()
 
-            # Find the best split point within the max_chars limit
-            sub_text = text[:max_chars]
-            
-            # 1. Look for a sentence boundary within the last 500 chars of the limit
-            split_match = list(re.finditer(r'[.!?]\s+', sub_text))
-            if split_match:
-                split_point = split_match[-1].end()
-            else:
-                # 2. Look for ANY whitespace to avoid splitting words
-                split_match = list(re.finditer(r'\s+', sub_text))
-                if split_match:
-                    split_point = split_match[-1].end()
-                else:
-                    # 3. Hard cut if necessary
-                    split_point = max_chars
+        cache_key = self._llm_cache_key(model, system_prompt, user_content, max_tokens, temperature)
+        if self.llm_cache:
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"♻️ LLM cache hit ({model}) for {system_prompt[:50]}...")
+                yield json.loads(cached)["content"]
+                return
 
-            chunks.append(text[:split_point].strip())
-            text = text[split_point:].strip()
+        logger.info(f"🤖 Streaming LLM ({model}) for {system_prompt[:50]}...")
+        for i in range(max_retries):
+            if self.rate_limiter:
+                waited = self.rate_limiter.acquire(
+                    "llm", credential_id(api_key), chars=len(system_prompt) + len(user_content)
+                )
+                if waited:
+                    logger.info(f"⏳ Waited {waited:.2f}s for LLM rate limit")
+            parts: List[str] = []
 
-        return chunks
+            def read_stream() -> Iterator[str]:
+                with self._llm_slot(), client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_content},
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                ) as stream:
+                    for event in stream:
+                        if event.usage:
+                            usage["tokens"] = usage.get("tokens", 0) + event.usage.total_tokens
+                        delta = event.choices[0].delta.content if event.choices else None
+                        if delta:
+                            yield delta
+
+            try:
+                # Read on a thread into an unbounded queue, so the slot is
+                # released when the response ends rather than when synthesis
+                # catches up with it
+                for delta in iterate_in_background(read_stream, maxsize=0):
+                    parts.append(delta)
+                    yield delta
+            except Exception as e:
+                if not parts and ("429" in str(e) or "rate limit" in str(e).lower()):
+                    wait_time = (2 ** i) + (random.random() * i)
+                    logger.warning(f"⚠️ Rate limit hit (429). Retrying in {wait_time:.2f}s... (Attempt {i+1}/{max_retries})")
+                    time.sleep(wait_time)
+                    continue
+                logger.error(f"❌ LLM stream failed: {e}")
+                raise e
+
+            content = "".join(parts).strip()
+            if self.llm_cache and content:
+                self.llm_cache.set(cache_key, json.dumps({"content": content}).encode("utf-8"))
+            return
+
+        raise Exception(f"Max retries ({max_retries}) exceeded for LLM call.")
+
+    def _chunk_text_for_tts(
+        self, text: str, max_chars: int = 4500, fits: Optional[Callable[[str], bool]] = None
+    ) -> List[str]:
+        """
+        Split text into chunks that are safe for TTS providers (e.g., Google's 5000 character limit).
+        Attempts to split at sentence boundaries (., !, ?) or at the last whitespace if no sentence boundary is found.
+        """
+        return chunk_text(text, max_chars, fits)
+
+    def _iter_chunks_for_tts(
+        self,
+        pieces: Iterable[tuple[str, Any]],
+        max_chars: int = 4500,
+        fits: Optional[Callable[[str], bool]] = None,
+        breaks: Sequence[Any] = (),
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Incremental version of _chunk_text_for_tts over a stream of stripped
+        text pieces (joined with single spaces). Emits the same chunks as
+        chunking the joined text in one go, each tagged with the tag of the
+        latest piece consumed when it was cut.
+
+        ``breaks`` are sorted tags where a chunk must start (e.g. chapter
+        pages): the first piece whose tag reaches a break opens a new chunk.
+        """
+        buffer = ""
+        tag = None
+        next_break = 0
+        for piece, piece_tag in pieces:
+            crossed = False
+            while next_break < len(breaks) and piece_tag >= breaks[next_break]:
+                next_break += 1
+                crossed = True
+            if crossed and buffer:
+                for chunk in chunk_text(buffer, max_chars, fits):
+                    yield chunk, tag
+                buffer = ""
+            tag = piece_tag
+            buffer = f"{buffer} {piece}" if buffer else piece
+            # Once the buffer overflows one request, every cut but the last
+            # is final no matter what text follows.
+            if len(buffer) > max_chars or (fits and not fits(buffer)):
+                *done, buffer = chunk_text(buffer, max_chars, fits)
+                for chunk in done:
+                    yield chunk, tag
+        if buffer:
+            yield buffer, tag
 
     def _chapterize_text(self, text: str, min_chapter_length_sentences=20) -> List[str]:
         # Legacy: keeping for backward compatibility if needed, but processing now uses _chunk_text_for_tts
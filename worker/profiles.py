@@ -0,0 +1,65 @@
+import subprocess
+from typing import Any, Dict, NamedTuple, Optional
+
+from loguru import logger
+
+# codec -> (ffmpeg encoder, file extension, content type, extra encoder options)
+CODECS = {
+    "mp3": ("libmp3lame", "mp3", "audio/mpeg", []),
+    "aac": ("aac", "m4a", "audio/mp4", ["-movflags", "+faststart"]),
+    # Opus' speech tuning holds up well at 24-48 kbps
+    "opus": ("libopus", "ogg", "audio/ogg", ["-application", "voip"]),
+}
+
+
+class OutputProfile(NamedTuple):
+    name: str
+    codec: str = "mp3"
+    bitrate_kbps: Optional[int] = None  # None: the provider's MP3 as is
+    channels: int = 1
+
+    @property
+    def passthrough(self) -> bool:
+        """Whether the provider's MP3 is stored untouched."""
+        return self.codec == "mp3" and self.bitrate_kbps is None
+
+    @property
+    def extension(self) -> str:
+        return CODECS[self.codec][1]
+
+    @property
+    def content_type(self) -> str:
+        return CODECS[self.codec][2]
+
+
+def load_profile(name: str, profiles: Dict[str, Dict[str, Any]]) -> OutputProfile:
+    """The named profile from an ``OUTPUT_PROFILES``-style mapping."""
+    if name not in profiles:
+        raise ValueError(f"Unknown output profile '{name}'")
+    spec = profiles[name]
+    codec = spec.get("codec", "mp3")
+    if codec not in CODECS:
+        raise ValueError(f"Output profile '{name}' has unsupported codec '{codec}'")
+    if codec != "mp3" and not spec.get("bitrate_kbps"):
+        raise ValueError(f"Output profile '{name}' needs a bitrate for {codec}")
+    return OutputProfile(name, codec, spec.get("bitrate_kbps"), spec.get("channels", 1))
+
+
+def encode_audio(input_path: str, output_path: str, profile: OutputProfile) -> str:
+    """Encode ``input_path`` to the profile's codec, bitrate and channels in one pass."""
+    encoder, _, _, options = CODECS[profile.codec]
+    cmd = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-i", input_path,
+        "-vn", "-ac", str(profile.channels),
+        "-c:a", encoder, "-b:a", f"{profile.bitrate_kbps}k",
+        *options,
+        output_path,
+    ]
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as e:
+        stderr_output = e.stderr.decode() if e.stderr else "No stderr"
+        raise Exception(f"FFmpeg encode to {profile.name} failed: {stderr_output}")
+    logger.info(f"🎚️ Encoded audio to {profile.name} ({profile.codec} {profile.bitrate_kbps}k)")
+    return output_path
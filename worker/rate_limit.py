@@ -0,0 +1,176 @@
+import hashlib
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+# Token buckets shared by every worker process through Redis. All buckets for
+# one call are checked and debited atomically: either every bucket has enough
+# tokens and all are debited, or nothing is and the longest wait is returned.
+# Uses the server clock so workers with skewed clocks agree.
+#
+# KEYS: bucket keys. ARGV: (rate per second, capacity, cost) per bucket.
+_ACQUIRE_SCRIPT = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local levels = {}
+local wait = 0
+for i = 1, #KEYS do
+    local rate = tonumber(ARGV[i * 3 - 2])
+    local capacity = tonumber(ARGV[i * 3 - 1])
+    local cost = tonumber(ARGV[i * 3])
+    local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    levels[i] = tokens
+    if tokens < cost then
+        wait = math.max(wait, (cost - tokens) / rate)
+    end
+end
+if wait > 0 then
+    return tostring(wait)
+end
+for i = 1, #KEYS do
+    local rate = tonumber(ARGV[i * 3 - 2])
+    local capacity = tonumber(ARGV[i * 3 - 1])
+    local cost = tonumber(ARGV[i * 3])
+    redis.call('HSET', KEYS[i], 'tokens', tostring(levels[i] - cost), 'ts', tostring(now))
+    redis.call('EXPIRE', KEYS[i], math.ceil(capacity / rate) + 60)
+end
+return '0'
+"""
+
+
+def credential_id(secret: Optional[str]) -> str:
+    """Short, non-reversible id for an API key, for use in Redis key names."""
+    if not secret:
+        return "default"
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:12]
+
+
+class RateLimiter:
+    """
+    Distributed rate limiter keyed per provider and credential.
+
+    ``limits`` maps a provider name to ``{"requests_per_sec": r,
+    "chars_per_min": c}``; either may be omitted (or 0) for no limit on that
+    axis. ``acquire`` blocks until the call may proceed and returns the
+    seconds it waited. If Redis is unreachable the limiter fails open: calls
+    proceed unthrottled and the provider's own 429s remain the backstop.
+
+    Wait times are counted per provider in this process (``stats()``) and
+    across all workers in the ``<prefix>metrics:<provider>`` Redis hash.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        limits: Dict[str, Dict[str, float]],
+        prefix: str = "ratelimit:",
+        max_sleep: float = 5.0,
+    ):
+        self.redis = redis_client
+        self.limits = limits
+        self.prefix = prefix
+        self.max_sleep = max_sleep
+        self._script = redis_client.register_script(_ACQUIRE_SCRIPT)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._last_error_log = 0.0
+
+    def _buckets(self, provider: str, credential: str, chars: int) -> List[Tuple[str, float, float, float]]:
+        limits = self.limits.get(provider) or {}
+        buckets = []
+        requests_per_sec = limits.get("requests_per_sec") or 0
+        if requests_per_sec > 0:
+            buckets.append((
+                f"{self.prefix}{provider}:{credential}:requests",
+                requests_per_sec,
+                max(1.0, requests_per_sec),
+                1,
+            ))
+        chars_per_min = limits.get("chars_per_min") or 0
+        if chars_per_min > 0 and chars > 0:
+            buckets.append((
+                f"{self.prefix}{provider}:{credential}:chars",
+                chars_per_min / 60.0,
+                chars_per_min,
+                # A single call larger than the whole bucket would never fit
+                min(chars, chars_per_min),
+            ))
+        return buckets
+
+    def acquire(self, provider: str, credential: str = "default", chars: int = 0) -> float:
+        """Block until ``provider`` may take one more call of ``chars`` characters."""
+        buckets = self._buckets(provider, credential, chars)
+        if not buckets:
+            return 0.0
+
+        keys = [key for key, _, _, _ in buckets]
+        args = [value for _, rate, capacity, cost in buckets for value in (rate, capacity, cost)]
+        waited = 0.0
+        while True:
+            try:
+                wait = float(self._script(keys=keys, args=args))
+            except Exception as e:
+                self._log_failure(e)
+                break
+            if wait <= 0:
+                break
+            # Jitter so throttled workers don't all wake at the same instant
+            pause = min(wait, self.max_sleep) * (1 + random.random() * 0.1)
+            time.sleep(pause)
+            waited += pause
+
+        self._record(provider, waited)
+        return waited
+
+    def _record(self, provider: str, waited: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                provider, {"calls": 0, "throttled": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+            )
+            stats["calls"] += 1
+            if waited > 0:
+                stats["throttled"] += 1
+                stats["wait_seconds"] += waited
+                stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+        if waited > 0:
+            try:
+                key = f"{self.prefix}metrics:{provider}"
+                pipe = self.redis.pipeline()
+                pipe.hincrby(key, "throttled", 1)
+                pipe.hincrbyfloat(key, "wait_seconds", waited)
+                pipe.execute()
+            except Exception as e:
+                self._log_failure(e)
+
+    def _log_failure(self, error: Exception) -> None:
+        # Once a minute is enough while Redis is down
+        now = time.monotonic()
+        if now - self._last_error_log > 60:
+            self._last_error_log = now
+            logger.warning(f"⚠️ Rate limiter unavailable, proceeding without it: {error}")
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-provider call, throttle and wait-time counters for this process."""
+        with self._lock:
+            return {provider: dict(stats) for provider, stats in self._stats.items()}
+
+
+def build_rate_limiter(enabled: bool, redis_url: str, limits: Dict[str, Dict[str, float]]) -> Optional[RateLimiter]:
+    """Build a limiter on the shared Redis from settings values."""
+    if not enabled or not limits:
+        return None
+    try:
+        import redis
+
+        # Connections are made lazily, after Celery has forked its children
+        client = redis.Redis.from_url(redis_url, socket_timeout=2, socket_connect_timeout=2)
+        return RateLimiter(client, limits)
+    except Exception as e:
+        logger.warning(f"⚠️ Rate limiter disabled: {e}")
+        return None
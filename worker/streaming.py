@@ -0,0 +1,69 @@
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def iterate_in_background(
+    produce: Callable[[], Iterable[T]], maxsize: int = 8
+) -> Iterator[T]:
+    """
+    Run ``produce()`` in a background thread and yield its items here.
+
+    The bounded queue lets the producer run at most ``maxsize`` items ahead of
+    the consumer. Producer exceptions are re-raised in the consumer. If the
+    consumer stops early (error or ``close()``), the producer is told to stop
+    at its next item so it doesn't block forever on a full queue.
+    """
+    items: "queue.Queue" = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run() -> None:
+        source = None
+        try:
+            source = iter(produce())
+            for item in source:
+                if not put(item):
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(_Failure(e))
+        finally:
+            # Release whatever the producer holds open (pools, files)
+            close = getattr(source, "close", None)
+            if close:
+                close()
+
+    thread = threading.Thread(target=run, name="pipeline-producer", daemon=True)
+    thread.start()
+
+    def consume() -> Iterator[T]:
+        try:
+            while True:
+                item = items.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.exc
+                yield item
+        finally:
+            stop.set()
+
+    return consume()
@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Tuple
+
+from loguru import logger
+
+from .chunking import chunk_text
+
+# (system_prompt, user_content, max_tokens) -> (text, tokens used)
+LLMCall = Callable[[str, str, int], Tuple[str, int]]
+# (system_prompt, user_content, max_tokens, usage) -> text deltas; adds the
+# tokens used to usage["tokens"]
+LLMStream = Callable[[str, str, int, dict], Iterator[str]]
+
+MAP_PROMPT = (
+    "You are given one section of a longer document. Summarize this section, "
+    "keeping its key ideas, findings, names and conclusions, in at most {words} words."
+)
+REDUCE_PROMPT = (
+    "You are given summaries of consecutive sections of a longer document. "
+    "Merge them into one summary of at most {words} words that keeps the key "
+    "ideas, findings, names and conclusions in document order."
+)
+FINAL_PREFIX = (
+    "The following are summaries of consecutive sections of one document, "
+    "which together cover the whole document.\n\n"
+)
+
+
+class MapReduceSummarizer:
+    """
+    Runs an LLM task over documents longer than one context window.
+
+    The text is split at sentence boundaries into sections of at most
+    ``section_chars``. Each section is summarized (map), in parallel up to
+    ``max_workers``; the partial summaries are then merged in groups that fit
+    in one section (reduce), level by level, until they fit in a single
+    request for the final task prompt. Short documents are one call, as
+    before. Wall-clock grows with the number of levels, not sections.
+    """
+
+    def __init__(
+        self,
+        call_llm: LLMCall,
+        section_chars: int = 20000,
+        max_workers: int = 8,
+        partial_words: int = 400,
+    ):
+        self.call_llm = call_llm
+        self.section_chars = section_chars
+        self.max_workers = max(1, max_workers)
+        self.partial_words = partial_words
+
+    def run(self, system_prompt: str, text: str, max_tokens: int) -> Tuple[str, int]:
+        """Apply ``system_prompt`` to the whole of ``text``; returns (result, tokens)."""
+        user_content, tokens = self._condense(text)
+        result, used = self.call_llm(system_prompt, user_content, max_tokens)
+        return result, tokens + used
+
+    def stream(
+        self, system_prompt: str, text: str, max_tokens: int, stream_llm: LLMStream, usage: dict
+    ) -> Iterator[str]:
+        """
+        Like ``run``, but the final call's output is yielded as it is
+        generated. Tokens used are added to ``usage["tokens"]``.
+        """
+        user_content, tokens = self._condense(text)
+        usage["tokens"] = usage.get("tokens", 0) + tokens
+        yield from stream_llm(system_prompt, user_content, max_tokens, usage)
+
+    def _condense(self, text: str) -> Tuple[str, int]:
+        """Map and reduce ``text`` until it fits one request; returns (input, tokens)."""
+        if len(text) <= self.section_chars:
+            return text, 0
+
+        sections = chunk_text(text, self.section_chars)
+        logger.info(f"🗺️ Map-reduce over {len(sections)} sections of up to {self.section_chars} chars")
+
+        partial_tokens = self.partial_words * 2
+        parts, tokens = self._map(
+            MAP_PROMPT.format(words=self.partial_words), sections, partial_tokens
+        )
+        level = 1
+        while len(FINAL_PREFIX) + len("\n\n".join(parts)) > self.section_chars and len(parts) > 1:
+            groups = self._group(parts)
+            logger.info(f"🔁 Reduce level {level}: {len(parts)} summaries -> {len(groups)}")
+            parts, used = self._map(
+                REDUCE_PROMPT.format(words=self.partial_words),
+                ["\n\n".join(group) for group in groups],
+                partial_tokens,
+            )
+            tokens += used
+            level += 1
+
+        return FINAL_PREFIX + "\n\n".join(parts), tokens
+
+    def _map(self, prompt: str, inputs: List[str], max_tokens: int) -> Tuple[List[str], int]:
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(inputs)), thread_name_prefix="llm"
+        ) as pool:
+            results = list(pool.map(lambda item: self.call_llm(prompt, item, max_tokens), inputs))
+        return [text for text, _ in results], sum(used for _, used in results)
+
+    def _group(self, parts: List[str]) -> List[List[str]]:
+        """Consecutive runs of summaries that fit in one section (at least two each)."""
+        groups: List[List[str]] = []
+        current: List[str] = []
+        size = 0
+        for part in parts:
+            if len(current) >= 2 and size + len(part) + 2 > self.section_chars:
+                groups.append(current)
+                current, size = [], 0
+            current.append(part)
+            size += len(part) + 2
+        if current:
+            if len(current) == 1 and groups:
+                groups[-1].append(current[0])
+            else:
+                groups.append(current)
+        return groups
@@ -0,0 +1,121 @@
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+
+class ChunkSynthesizer:
+    """
+    Synthesizes TTS chunks with bounded concurrency while preserving order.
+
+    Chunk ``i`` is always written to ``chunk_{i:04d}.mp3`` in ``work_dir`` and
+    the returned paths are in chunk order, however the requests complete.
+    Each chunk retries on its own, so one flaky request doesn't hold up the
+    others. Progress callbacks run on the calling thread (safe for DB
+    sessions) and receive the number of completed chunks.
+
+    Requests go through the provider's blocking ``text_to_audio``, one pool
+    thread each, so at most ``concurrency`` are in flight. Async providers
+    share the worker's event loop and its connections behind that adapter,
+    but don't lift the thread bound.
+
+    With a ``checkpoint`` (see ``worker.checkpoint.JobCheckpoint``), chunks
+    already synthesized by an earlier attempt of the job are reused and new
+    ones are persisted as they finish.
+    """
+
+    def __init__(
+        self,
+        provider,
+        voice_id: str,
+        speed: float,
+        work_dir: str,
+        concurrency: int = 4,
+        max_retries: int = 2,
+        retry_base_delay: float = 1.0,
+        checkpoint=None,
+    ):
+        self.provider = provider
+        self.voice_id = voice_id
+        self.speed = speed
+        self.work_dir = work_dir
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.checkpoint = checkpoint
+
+    def synthesize(
+        self,
+        chunks: Iterable[str],
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        on_chunk: Optional[Callable[[int, str], None]] = None,
+    ) -> List[str]:
+        """
+        Synthesize every chunk and return the chunk file paths in order.
+        ``on_chunk(index, path)`` and then ``on_progress(completed, index)``
+        are called as each chunk finishes.
+        """
+        paths: Dict[int, str] = {}
+        pending: Dict[Future, int] = {}
+        completed = 0
+
+        def collect(timeout: Optional[float]) -> None:
+            nonlocal completed
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                paths[index] = future.result()
+                completed += 1
+                if on_chunk:
+                    on_chunk(index, paths[index])
+                if on_progress:
+                    on_progress(completed, index)
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="tts"
+        ) as pool:
+            try:
+                for index, text in enumerate(chunks):
+                    # Keep a little work queued without reading the whole
+                    # (possibly streaming) chunk source up front.
+                    while len(pending) >= self.concurrency * 2:
+                        collect(timeout=None)
+                    pending[pool.submit(self._synthesize_chunk, index, text)] = index
+                    collect(timeout=0)
+                while pending:
+                    collect(timeout=None)
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        return [paths[i] for i in range(len(paths))]
+
+    def _synthesize_chunk(self, index: int, text: str) -> str:
+        audio_data = self.checkpoint.get(index, text) if self.checkpoint else None
+        if audio_data is None:
+            audio_data = self._request_audio(index, text)
+            if self.checkpoint:
+                self.checkpoint.put(index, text, audio_data)
+
+        chunk_path = os.path.join(self.work_dir, f"chunk_{index:04d}.mp3")
+        with open(chunk_path, "wb") as f:
+            f.write(audio_data)
+        return chunk_path
+
+    def _request_audio(self, index: int, text: str) -> bytes:
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.provider.text_to_audio(text, self.voice_id, self.speed)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                wait_time = self.retry_base_delay * (2 ** attempt + random.random())
+                logger.warning(
+                    f"⚠️ TTS chunk {index} failed ({e}). Retrying in {wait_time:.2f}s... "
+                    f"(Attempt {attempt + 1}/{self.max_retries})"
+                )
+                time.sleep(wait_time)
@@ -3,6 +3,7 @@ from .celery_app import celery_app
 import os
 import sys
 import tempfile
+from functools import partial
 from typing import Optional
 
 # Add backend to path
@@ -17,6 +18,10 @@ from app.core.config import settings
 # Import PDF processing pipeline
 
 from .pdf_pipeline import PDFToAudioPipeline
+from .checkpoint import JobCheckpoint
+from .hls import HLSWriter
+from .profiles import load_profile
+from .upload import StreamingUpload
 
 pipeline = PDFToAudioPipeline()
 
@@ -36,7 +41,16 @@ for var in voice_vars:
     logger.info(f"  {var} = '{val}'")
 
 
-@celery_app.task(bind=True)
+def _set_playlist_key(job_id: int, key: str) -> None:
+    # Called from the HLS upload thread, so it gets its own session
+    db = SessionLocal()
+    try:
+        JobService(db).update_job(job_id, {"playlist_s3_key": key})
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, max_retries=3)
 def process_pdf_task(self, job_id: int):
     """
     Process a PDF file and convert it to audio
@@ -46,6 +60,7 @@ def process_pdf_task(self, job_id: int):
     job_service = JobService(db)
     pdf_path = None
     temp_dir = None
+    checkpoint = None
 
     try:
         logger.info(f"Starting PDF processing for job {job_id}")
@@ -65,6 +80,57 @@ def process_pdf_task(self, job_id: int):
         with open(pdf_path, "wb") as pdf_file:
             pdf_file.write(pdf_data)
 
+        profile = load_profile(
+            job.output_profile or settings.OUTPUT_PROFILE_DEFAULT, settings.OUTPUT_PROFILES
+        )
+
+        if settings.JOB_CHECKPOINTS_ENABLED and settings.S3_BUCKET_NAME:
+            # Chunk audio survives the temp dir, so a retry resumes where this
+            # attempt stopped instead of paying for every chunk again
+            checkpoint = JobCheckpoint(
+                job_id,
+                fingerprint={
+                    "voice_provider": str(job.voice_provider),
+                    "voice_type": job.voice_type,
+                    "reading_speed": float(job.reading_speed),
+                    "include_summary": bool(job.include_summary),
+                    "conversion_mode": str(job.conversion_mode),
+                    # Decides the bitrate of the chunk audio itself
+                    "output_profile": profile.name,
+                },
+                prefix=settings.JOB_CHECKPOINT_PREFIX,
+                storage=storage_service,
+            )
+
+        output_format = str(job.output_format or "mp3")
+        if output_format == "m4b":
+            extension, content_type = "m4b", "audio/mp4"
+        else:
+            extension, content_type = profile.extension, profile.content_type
+        audio_key = f"audio/{job.user_id}/{job.id}.{extension}"
+
+        open_upload = None
+        if settings.STREAMING_UPLOAD_ENABLED and settings.S3_BUCKET_NAME:
+            # Parts go up while synthesis is still running
+            open_upload = partial(
+                StreamingUpload,
+                storage_service.s3_client,
+                storage_service.bucket_name,
+                audio_key,
+                part_size=settings.STREAMING_UPLOAD_PART_MB * 1024 * 1024,
+            )
+
+        hls = None
+        if settings.HLS_ENABLED and settings.S3_BUCKET_NAME:
+            # Playable from the first segment instead of after the whole job
+            hls = HLSWriter(
+                storage_service,
+                f"{settings.HLS_PREFIX}{job.user_id}/{job.id}/",
+                segment_seconds=settings.HLS_SEGMENT_SECONDS,
+                url_expiry=settings.HLS_URL_EXPIRY_SECONDS,
+                on_live=lambda key: _set_playlist_key(job_id, key),
+            )
+
         # process_pdf now returns (file_path, cost, usage_stats) and uses work_dir
         audio_file_path, tts_cost, usage_stats = pipeline.process_pdf(
             pdf_path=pdf_path,
@@ -76,7 +142,13 @@ def process_pdf_task(self, job_id: int):
             progress_callback=lambda progress: job_service.update_job_status(
                 job_id, JobStatus.processing, progress
             ),
-            work_dir=work_dir
+            work_dir=work_dir,
+            checkpoint=checkpoint,
+            output_key=audio_key,
+            open_upload=open_upload,
+            output_format=output_format,
+            hls=hls,
+            output_profile=profile.name,
         )
 
         # Calculate final cost (TTS + LLM)
@@ -85,14 +157,18 @@ def process_pdf_task(self, job_id: int):
         token_cost = (usage_stats["tokens"] / 1_000_000) * 2.0
         final_cost = float(tts_cost) + token_cost
         
-        # Upload the audio file to S3
-        audio_key = f"audio/{job.user_id}/{job.id}.mp3"
-        audio_url = storage_service.upload_large_file(
-            audio_file_path, audio_key, "audio/mpeg"
-        )
+        if audio_file_path is None:
+            # Streamed or long-form audio is in the bucket already
+            audio_url = storage_service.object_url(audio_key)
+        else:
+            # Upload the audio file to S3
+            audio_url = storage_service.upload_large_file(
+                audio_file_path, audio_key, content_type
+            )
         
         job.audio_s3_key = audio_key
         job.audio_s3_url = audio_url
+        job.bytes_saved = usage_stats.get("bytes_saved", 0)
         
         # Deduct credits using service logic (AFTER successful upload)
         job_service.deduct_credits(job.user_id, final_cost)
@@ -106,6 +182,32 @@ def process_pdf_task(self, job_id: int):
             tokens_used=usage_stats.get("tokens", 0)
         )
 
+        for cache, label in (("audio", "Audio"), ("llm", "LLM")):
+            hits = usage_stats.get(f"{cache}_cache_hits")
+            misses = usage_stats.get(f"{cache}_cache_misses")
+            if hits is not None and hits + misses:
+                logger.info(
+                    f"{label} cache for job {job_id}: {hits} hits, {misses} misses "
+                    f"({hits / (hits + misses):.0%} hit rate)"
+                )
+        if usage_stats.get("rate_limit_wait_seconds"):
+            logger.info(
+                f"⏳ Job {job_id} waited {usage_stats['rate_limit_wait_seconds']}s "
+                f"on shared TTS rate limits"
+            )
+        if usage_stats.get("chars_removed"):
+            logger.info(
+                f"🧹 Job {job_id}: stripped {usage_stats['chars_removed']} chars of running "
+                f"headers, footers and page numbers before synthesis"
+            )
+        if usage_stats.get("checkpoint_chunks_reused"):
+            logger.info(
+                f"♻️ Job {job_id} attempt {self.request.retries + 1} resumed from checkpoint: "
+                f"reused {usage_stats['checkpoint_chunks_reused']} chunks "
+                f"({usage_stats['checkpoint_chars_reused']} chars of synthesis saved)"
+            )
+        if checkpoint:
+            checkpoint.clear()
         logger.info(f"Successfully processed job {job_id}")
         return {"status": "completed", "job_id": job_id, "audio_url": audio_url}
 
@@ -119,8 +221,13 @@ def process_pdf_task(self, job_id: int):
         job_service.update_job_status(
             job_id, JobStatus.failed, error_message=f"An unexpected error occurred: {str(e)}"
         )
+        if self.request.retries >= self.max_retries:
+            # No attempt left to resume from it
+            if checkpoint:
+                checkpoint.clear()
+            raise
         # Retry for system errors
-        raise self.retry(exc=e, countdown=60, max_retries=3)
+        raise self.retry(exc=e, countdown=60)
 
     finally:
         # cleanup happens automatically when temp_dir object is garbage collected or explicitly cleaned
@@ -0,0 +1,104 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import List
+
+from loguru import logger
+
+from .long_form import MIN_PART_BYTES
+
+
+class StreamingUpload:
+    """
+    S3 multipart upload fed incrementally with ``write``.
+
+    Every ``part_size`` bytes written are shipped as one part in the
+    background (at most ``max_in_flight`` at a time, which also bounds the
+    memory held), so by the time the last byte is written only the tail is
+    left to send. ``complete`` uploads the tail and completes the upload;
+    ``abort`` cancels it so no orphaned parts are left billed in the bucket.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        key: str,
+        content_type: str = "audio/mpeg",
+        part_size: int = 8 * 1024 * 1024,
+        max_in_flight: int = 2,
+    ):
+        self.s3 = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = max(part_size, MIN_PART_BYTES)
+        self.max_in_flight = max(1, max_in_flight)
+        self.bytes_written = 0
+        self._buffer = bytearray()
+        self._parts: List[Future] = []
+        self._pool = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="upload")
+        self._closed = False
+        self.upload_id = s3_client.create_multipart_upload(
+            Bucket=bucket, Key=key, ContentType=content_type
+        )["UploadId"]
+
+    def write(self, data: bytes) -> None:
+        self._buffer += data
+        self.bytes_written += len(data)
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[:self.part_size])
+            del self._buffer[:self.part_size]
+            self._submit(part)
+
+    def _submit(self, data: bytes) -> None:
+        in_flight = [part for part in self._parts if not part.done()]
+        while len(in_flight) >= self.max_in_flight:
+            wait(in_flight, return_when=FIRST_COMPLETED)
+            in_flight = [part for part in in_flight if not part.done()]
+        # Surface a failed part now rather than after the whole book is written
+        for part in self._parts:
+            if part.done():
+                part.result()
+        number = len(self._parts) + 1
+        self._parts.append(self._pool.submit(self._upload_part, number, data))
+
+    def _upload_part(self, number: int, data: bytes) -> dict:
+        response = self.s3.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=number,
+            Body=data,
+        )
+        return {"PartNumber": number, "ETag": response["ETag"]}
+
+    def complete(self) -> None:
+        """Upload what's buffered and complete the object."""
+        if self._buffer or not self._parts:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        try:
+            parts = [part.result() for part in self._parts]
+            self.s3.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            self.abort()
+            raise
+        self._closed = True
+        self._pool.shutdown()
+        logger.info(f"☁️ Streamed {self.bytes_written} bytes to {self.key} in {len(parts)} parts")
+
+    def abort(self) -> None:
+        """Cancel the upload; safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        for part in self._parts:
+            part.cancel()
+        self._pool.shutdown(wait=True)
+        try:
+            self.s3.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not abort multipart upload of {self.key}: {e}")